@@ -0,0 +1,105 @@
+"""
+Offline fixtures for the benchmark suite: a throwaway SQLite copy of the IS reference
+tables and a deterministic corpus of designs built from the conductor sizes.
+Import configure_database() before anything from src.backend, which binds its engine at import.
+"""
+import json
+import os
+import random
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONDUCTOR_JSON = REPO_ROOT / "extracted_output" / "conductor_v1.json"
+INSULATION_JSON = REPO_ROOT / "extracted_output" / "insulation_v1.json"
+
+
+def configure_database() -> str:
+    """Points DATABASE_URL at a fresh SQLite file so the suite never touches a real database."""
+    path = os.path.join(tempfile.mkdtemp(prefix="cable-bench-"), "conductors.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{path}"
+    # Keep the run offline: no broker, no shared cache or scheduler backends
+    os.environ["REDIS_URL_SET"] = ""
+    os.environ["LANGSMITH_TRACING_V2"] = "false"
+    return path
+
+
+def load_reference_tables() -> Dict[str, int]:
+    """Creates conductor_specs/insulation_specs the way conductors.db is built (src/backend/test_db.py)."""
+    from src.backend.db.database import Base, SessionLocal, engine
+    from src.backend.db.models.conductor_spec_model import ConductorSpec
+    from src.backend.db.models.insulation_spec_model import InsulationSpec
+    from src.backend.test_db import load_from_json, load_insulation_from_json
+
+    Base.metadata.create_all(engine, tables=[ConductorSpec.__table__, InsulationSpec.__table__])  # type: ignore
+    db = SessionLocal()
+    try:
+        with open(CONDUCTOR_JSON, encoding="utf-8") as f:
+            conductors = load_from_json(json.load(f), db)
+        with open(INSULATION_JSON, encoding="utf-8") as f:
+            insulation = load_insulation_from_json(json.load(f), db)
+    finally:
+        db.close()
+    return {"conductor_specs": conductors, "insulation_specs": insulation}
+
+
+def conductor_sizes() -> List[float]:
+    with open(CONDUCTOR_JSON, encoding="utf-8") as f:
+        data = json.load(f)
+    return sorted({float(row["nominal_cross_sectional_area"]) for table in data["tables"] for row in table["rows"]})
+
+
+def insulation_thickness() -> Dict[float, float]:
+    with open(INSULATION_JSON, encoding="utf-8") as f:
+        data = json.load(f)
+    return {
+        float(row["nominal_cross_sectional_area"]): float(row["nominal_thickness_mm"])
+        for table in data["tables"] if table["insulation_material"] == "PVC"
+        for row in table["rows"]
+    }
+
+
+def design_corpus(size: int, seed: int = 1554) -> List[Dict[str, Any]]:
+    """
+    Mix of compliant, non-compliant and incomplete designs over every standard size,
+    so both the deterministic path and the LLM-audit path are exercised.
+    """
+    rng = random.Random(seed)
+    sizes = conductor_sizes()
+    thickness = insulation_thickness()
+    corpus = []
+    for i in range(size):
+        csa = sizes[i % len(sizes)]
+        nominal = thickness.get(csa, 1.0)
+        design: Dict[str, Any] = {
+            "standard": "IS 1554-1",
+            "voltage": "1.1 kV",
+            "conductor_material": rng.choice(["Cu", "Al"]),
+            "conductor_class": "Class 2",
+            "csa": csa,
+            "insulation_material": "PVC",
+            "insulation_thickness": nominal,
+        }
+        variant = i % 4
+        if variant == 1:
+            design["insulation_thickness"] = round(nominal * 0.8, 2)
+        elif variant == 2:
+            design["csa"] = round(csa * 1.07, 2)
+        elif variant == 3:
+            del design[rng.choice(["standard", "voltage", "insulation_thickness"])]
+        corpus.append(design)
+    return corpus
+
+
+def free_text(design: Dict[str, Any]) -> str:
+    parts = [
+        design.get("standard"),
+        design.get("voltage"),
+        f"{design['csa']} sqmm" if design.get("csa") else None,
+        design.get("conductor_material"),
+        design.get("conductor_class"),
+        f"{design['insulation_material']} insulated" if design.get("insulation_material") else None,
+        f"insulation thickness {design['insulation_thickness']} mm" if design.get("insulation_thickness") else None,
+    ]
+    return ", ".join(p for p in parts if p)
@@ -0,0 +1,300 @@
+"""
+Open-loop load generator for POST /design-validations + GET /design-validations/{request_id}.
+
+Arrivals follow a Poisson process at --rate submissions/s regardless of how fast the
+system answers, so queueing delay shows up in time-to-result instead of throttling the
+generator. Each submission is polled until SUCCESS/FAILED or --result-timeout.
+
+    # Against a running deployment
+    python -m benchmarks.load_test --base-url http://localhost:8001 --rate 20 --duration 60
+
+    # Self-contained: API + Celery worker in this process, SQLite, in-memory broker, mock LLMs
+    python -m benchmarks.load_test --in-process --rate 50 --duration 30 --mock-latency-ms 400
+
+Corpus: --corpus FILE.jsonl with one POST payload per line ({"input_mode": ..., "data": ...});
+a bare {"description": ...} line is sent as free_text and any other object as json.
+Without --corpus, designs are generated from the extracted_output/conductor_v1.json sizes.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from collections import Counter
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from benchmarks.fixtures import configure_database, design_corpus, free_text, load_reference_tables
+
+API_PATH = "/api/v1/design/design-validations"
+TERMINAL_STATUSES = {"SUCCESS", "FAILED"}
+
+
+@dataclass
+class RequestOutcome:
+    scheduled_at: float
+    submit_latency: Optional[float] = None
+    time_to_result: Optional[float] = None
+    job_status: Optional[str] = None
+    error: Optional[str] = None
+    input_mode: str = ""
+    polls: int = 0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+def load_corpus(path: Optional[str], size: int, free_text_ratio: float, seed: int) -> List[Dict[str, Any]]:
+    if path:
+        payloads = []
+        for line in Path(path).read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            item = json.loads(line)
+            if "input_mode" in item and "data" in item:
+                payloads.append({"input_mode": item["input_mode"], "data": item["data"]})
+            elif "description" in item:
+                payloads.append({"input_mode": "free_text", "data": {"description": item["description"]}})
+            else:
+                payloads.append({"input_mode": "json", "data": item})
+        if not payloads:
+            raise ValueError(f"Corpus {path} is empty")
+        return payloads
+
+    rng = random.Random(seed)
+    payloads = []
+    for design in design_corpus(size, seed):
+        if rng.random() < free_text_ratio:
+            payloads.append({"input_mode": "free_text", "data": {"description": free_text(design)}})
+        else:
+            payloads.append({"input_mode": "json", "data": design})
+    return payloads
+
+
+def percentiles(values: List[float]) -> Dict[str, Optional[float]]:
+    if not values:
+        return {"count": 0, "mean": None, "p50": None, "p90": None, "p95": None, "p99": None, "max": None}
+    ordered = sorted(values)
+
+    def pct(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    return {
+        "count": len(ordered),
+        "mean": statistics.fmean(ordered),
+        "p50": pct(0.50),
+        "p90": pct(0.90),
+        "p95": pct(0.95),
+        "p99": pct(0.99),
+        "max": ordered[-1],
+    }
+
+
+async def run_one(client: httpx.AsyncClient, payload: Dict[str, Any], outcome: RequestOutcome, args: argparse.Namespace) -> None:
+    # Latencies count from the scheduled arrival, so client-side backlog is not hidden (coordinated omission)
+    started = outcome.scheduled_at
+    try:
+        response = await client.post(API_PATH, json=payload, headers={"X-Bypass-Dedup": "true"})
+    except httpx.HTTPError as e:
+        outcome.error = f"submit:{type(e).__name__}"
+        return
+    outcome.submit_latency = time.perf_counter() - started
+    if response.status_code != 202:
+        outcome.error = f"submit:http_{response.status_code}"
+        return
+
+    request_id = response.json()["request_id"]
+    deadline = started + args.result_timeout
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(args.poll_interval)
+        outcome.polls += 1
+        try:
+            poll = await client.get(f"{API_PATH}/{request_id}")
+        except httpx.HTTPError as e:
+            outcome.extra[f"poll:{type(e).__name__}"] = outcome.extra.get(f"poll:{type(e).__name__}", 0) + 1
+            continue
+        if poll.status_code != 200:
+            outcome.extra[f"poll:http_{poll.status_code}"] = outcome.extra.get(f"poll:http_{poll.status_code}", 0) + 1
+            continue
+        job_status = poll.json().get("job_status")
+        if job_status in TERMINAL_STATUSES:
+            outcome.time_to_result = time.perf_counter() - started
+            outcome.job_status = job_status
+            if job_status == "FAILED":
+                outcome.error = "job:FAILED"
+            return
+
+    outcome.error = "timeout"
+
+
+async def generate_load(client: httpx.AsyncClient, corpus: List[Dict[str, Any]], args: argparse.Namespace) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    outcomes: List[RequestOutcome] = []
+    tasks: List[asyncio.Task] = []
+    limits = asyncio.Semaphore(args.max_in_flight)
+
+    async def guarded(payload: Dict[str, Any], outcome: RequestOutcome) -> None:
+        async with limits:
+            await run_one(client, payload, outcome, args)
+
+    start = time.perf_counter()
+    next_arrival = 0.0
+    index = 0
+    while next_arrival < args.duration:
+        delay = start + next_arrival - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        payload = corpus[index % len(corpus)]
+        outcome = RequestOutcome(scheduled_at=start + next_arrival, input_mode=payload["input_mode"])
+        outcomes.append(outcome)
+        tasks.append(asyncio.create_task(guarded(payload, outcome)))
+        index += 1
+        next_arrival += rng.expovariate(args.rate)
+
+    submitted_in = time.perf_counter() - start
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    return summarize(outcomes, args, submitted_in, elapsed)
+
+
+def summarize(outcomes: List[RequestOutcome], args: argparse.Namespace, submitted_in: float, elapsed: float) -> Dict[str, Any]:
+    accepted = [o for o in outcomes if o.submit_latency is not None and not (o.error or "").startswith("submit:")]
+    completed = [o for o in outcomes if o.job_status == "SUCCESS"]
+    errors = Counter(o.error for o in outcomes if o.error)
+    poll_errors: Counter = Counter()
+    for o in outcomes:
+        poll_errors.update(o.extra)
+
+    by_mode: Dict[str, Any] = {}
+    for mode in sorted({o.input_mode for o in outcomes}):
+        times = [o.time_to_result for o in completed if o.input_mode == mode]
+        by_mode[mode] = {"submitted": sum(o.input_mode == mode for o in outcomes), "time_to_result_s": percentiles(times)}  # type: ignore
+
+    return {
+        "target_rate_per_s": args.rate,
+        "duration_s": args.duration,
+        "submitted": len(outcomes),
+        "accepted": len(accepted),
+        "completed": len(completed),
+        "achieved_submit_rate_per_s": len(accepted) / submitted_in if submitted_in else 0.0,
+        "completed_per_s": len(completed) / elapsed if elapsed else 0.0,
+        "elapsed_s": elapsed,
+        "submit_latency_s": percentiles([o.submit_latency for o in accepted]),  # type: ignore
+        "time_to_result_s": percentiles([o.time_to_result for o in completed]),  # type: ignore
+        "by_input_mode": by_mode,
+        "errors": dict(errors),
+        "poll_errors": dict(poll_errors),
+        "mean_polls": statistics.fmean(o.polls for o in outcomes) if outcomes else 0.0,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    def ms(value: Optional[float]) -> str:
+        return f"{value * 1e3:9.1f}" if value is not None else f"{'-':>9}"
+
+    print(f"\nOffered {report['target_rate_per_s']:.1f}/s for {report['duration_s']:.0f}s | "
+          f"submitted={report['submitted']} accepted={report['accepted']} completed={report['completed']}")
+    print(f"Achieved submit rate {report['achieved_submit_rate_per_s']:.2f}/s | completions {report['completed_per_s']:.2f}/s | "
+          f"elapsed {report['elapsed_s']:.1f}s")
+    print(f"\n{'latency (ms)':<28}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    rows = [("submit", report["submit_latency_s"]), ("time to result", report["time_to_result_s"])]
+    rows += [(f"  {mode}", stats["time_to_result_s"]) for mode, stats in report["by_input_mode"].items()]
+    for label, stats in rows:
+        print(f"{label:<28}{ms(stats['p50'])}{ms(stats['p90'])}{ms(stats['p95'])}{ms(stats['p99'])}{ms(stats['max'])}")
+    if report["errors"] or report["poll_errors"]:
+        print("\nErrors:")
+        for name, count in sorted({**report["errors"], **report["poll_errors"]}.items(), key=lambda kv: -kv[1]):
+            print(f"  {name:<32}{count:>8}")
+
+
+def start_in_process_stack(args: argparse.Namespace, stack: ExitStack) -> httpx.AsyncClient:
+    """FastAPI app over ASGI plus a threads-pool Celery worker on an in-memory broker, backed by SQLite."""
+    configure_database()
+    os.environ.update({
+        "EXTRACTION_PROVIDER": "Mock",
+        "VALIDATION_PROVIDER": "Mock",
+        "MOCK_LLM_LATENCY_DISTRIBUTION": args.mock_distribution,
+        "MOCK_LLM_LATENCY_MEAN_MS": str(args.mock_latency_ms),
+        "MOCK_LLM_ERROR_RATE": str(args.mock_error_rate),
+        "MOCK_LLM_SEED": str(args.seed),
+        "WORKER_ASYNC_CONCURRENCY": str(args.workers),
+        "WORKER_METRICS_PORT": "0",
+    })
+    load_reference_tables()
+
+    from celery.contrib.testing.worker import start_worker
+    from main import app
+    from src.backend.config.logger import logger
+    from src.backend.tasks.validation_task import celery_app
+
+    # Per-request log lines and the (absent) result notifier's warnings would swamp the report
+    logger.setLevel(logging.ERROR)
+    celery_app.conf.update(
+        broker_url="memory://",
+        result_backend="cache+memory://",
+        broker_transport_options={**celery_app.conf.broker_transport_options, "polling_interval": 0.01}
+    )
+    stack.enter_context(start_worker(celery_app, pool="threads", concurrency=args.workers, perform_ping_check=False, loglevel="ERROR"))
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://load-test", timeout=args.request_timeout)
+
+
+async def main_async(args: argparse.Namespace) -> Dict[str, Any]:
+    corpus = load_corpus(args.corpus, args.corpus_size, args.free_text_ratio, args.seed)
+    with ExitStack() as stack:
+        if args.in_process:
+            client = start_in_process_stack(args, stack)
+        else:
+            client = httpx.AsyncClient(
+                base_url=args.base_url,
+                timeout=args.request_timeout,
+                limits=httpx.Limits(max_connections=args.max_in_flight)
+            )
+        try:
+            async with client:
+                return await generate_load(client, corpus, args)
+        finally:
+            if args.in_process:
+                # aiosqlite connection threads are not daemons; close them before the loop goes away
+                from src.backend.db.database import async_engine
+                await async_engine.dispose()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Open-loop load test for the cable validation API")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="Running API, e.g. http://localhost:8001")
+    target.add_argument("--in-process", action="store_true", help="Run API + worker here on SQLite and an in-memory broker with mock LLMs")
+    parser.add_argument("--rate", type=float, default=10.0, help="Mean arrival rate (submissions/s)")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds of arrivals; in-flight requests are then drained")
+    parser.add_argument("--corpus", default=None, help="JSONL file of POST payloads")
+    parser.add_argument("--corpus-size", type=int, default=500, help="Generated designs when no --corpus is given")
+    parser.add_argument("--free-text-ratio", type=float, default=0.5, help="Share of generated designs sent as free_text")
+    parser.add_argument("--poll-interval", type=float, default=0.25, help="Seconds between result polls")
+    parser.add_argument("--result-timeout", type=float, default=300.0, help="Give up on a result after this many seconds")
+    parser.add_argument("--request-timeout", type=float, default=30.0, help="HTTP timeout per request")
+    parser.add_argument("--max-in-flight", type=int, default=1000, help="Cap on concurrently tracked requests (client-side safety limit)")
+    parser.add_argument("--seed", type=int, default=1554)
+    parser.add_argument("--output", default=None, help="Write the report JSON here")
+    in_process = parser.add_argument_group("in-process stack")
+    in_process.add_argument("--workers", type=int, default=32, help="Celery pool threads")
+    in_process.add_argument("--mock-latency-ms", type=float, default=300.0, help="Mean mock LLM latency per call")
+    in_process.add_argument("--mock-distribution", default="lognormal", help="fixed, uniform, exponential or lognormal")
+    in_process.add_argument("--mock-error-rate", type=float, default=0.0, help="Share of mock LLM calls that fail")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(main_async(args))
+    print_report(report)
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+        print(f"\nReport written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+"""
+Validation pipeline benchmarks (no network, no external services).
+
+    python -m benchmarks.run_benchmarks --save-baseline          # record this machine's baseline (not committed)
+    python -m benchmarks.run_benchmarks                          # run and compare with benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --sizes 1,100 --repeat 20 --output results.json
+
+Exits with status 1 when a case is slower than its baseline by more than --threshold.
+Timings only compare on the host that recorded the baseline; against another host's
+baseline the comparison is printed but never fails.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.fixtures import configure_database, design_corpus, free_text, load_reference_tables
+
+configure_database()
+
+from src.backend.auditors.llm_auditor import LLMAuditor  # noqa: E402
+from src.backend.config.logger import logger  # noqa: E402
+from src.backend.extractor.llm_extractor import LLMFieldExtractor  # noqa: E402
+from src.backend.formatters.evidence_formatters import CompactEvidenceFormatter, EvidenceFormatter  # noqa: E402
+from src.backend.orchestrator.cable_validation_orchestrator import CableDesignValidator  # noqa: E402
+from src.backend.providers.mock_llm_client import MockExtractLLMClient, MockLatency, MockValidateLLMClient  # noqa: E402
+from src.backend.schemas.cable_validation_schema import CableDesignSchema, LLMResponseSchema  # noqa: E402
+from src.backend.validators.cable_rag_validator import CableRAGValidator  # noqa: E402
+from src.backend.validators.conductor_spec_index import init_spec_index  # noqa: E402
+from src.backend.validators.database_validators import ISRAGDatabaseValidator  # noqa: E402
+from src.backend.validators.insulation_rule_engine import IS1554RuleEngine  # noqa: E402
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+DEFAULT_SIZES = (1, 10, 100, 1000)
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> Dict[str, float]:
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return {
+        "min_s": timings[0],
+        "median_s": statistics.median(timings),
+        "p95_s": timings[min(len(timings) - 1, int(0.95 * len(timings)))],
+        "mean_s": statistics.fmean(timings),
+    }
+
+
+def build_cases(sizes: List[int]) -> Dict[str, Callable[[], Any]]:
+    """Every case processes `size` designs per call so results are comparable per item."""
+    spec_index = init_spec_index()
+    rag_validator = CableRAGValidator(spec_index)
+    db_validator = ISRAGDatabaseValidator(spec_index)
+    formatter = EvidenceFormatter()
+    compact_formatter = CompactEvidenceFormatter()
+    no_latency = MockLatency(distribution="fixed", mean_ms=0, error_rate=0.0, seed=0)
+    pipeline = CableDesignValidator(
+        field_extractor=LLMFieldExtractor(MockExtractLLMClient(no_latency)),
+        database_validator=db_validator,
+        evidence_formatter=formatter,
+        auditor=LLMAuditor(MockValidateLLMClient(no_latency)),
+        rule_engine=IS1554RuleEngine()
+    )
+    loop = asyncio.new_event_loop()
+
+    cases: Dict[str, Callable[[], Any]] = {}
+    for size in sizes:
+        raw = design_corpus(size)
+        designs = [CableDesignSchema(**d) for d in raw]
+        evidence = [db_validator.validate(d) for d in designs]
+        texts = [free_text(d) for d in raw]
+        audit_payloads = [
+            {
+                "is_out_of_scope": False,
+                "out_of_scope_explanation": "",
+                "fields": d,
+                "validation": [v.model_dump() for v in e],
+                "confidence": {"overall": 0.9},
+            }
+            for d, e in zip(raw, evidence)
+        ]
+
+        def run_pipeline(inputs: List[Any], mode: str) -> Callable[[], Any]:
+            async def batch():
+                return await asyncio.gather(*(pipeline.validate(i, mode) for i in inputs))
+            return lambda: loop.run_until_complete(batch())
+
+        cases[f"rag_validate_design[{size}]"] = lambda designs=designs: [rag_validator.validate_design(d) for d in designs]
+        cases[f"evidence_format_verbose[{size}]"] = lambda evidence=evidence: [formatter.format(e) for e in evidence]
+        cases[f"evidence_format_compact[{size}]"] = lambda evidence=evidence: [compact_formatter.format(e) for e in evidence]
+        cases[f"schema_cable_design[{size}]"] = lambda raw=raw: [CableDesignSchema(**d) for d in raw]
+        cases[f"schema_llm_response[{size}]"] = lambda payloads=audit_payloads: [LLMResponseSchema(**p) for p in payloads]
+        cases[f"pipeline_structured[{size}]"] = run_pipeline(raw, "json")
+        cases[f"pipeline_free_text[{size}]"] = run_pipeline(texts, "free_text")
+    return cases
+
+
+def host_info() -> Dict[str, Any]:
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+    }
+
+
+def run(sizes: List[int], repeat: int, only: Optional[str]) -> Dict[str, Any]:
+    tables = load_reference_tables()
+    results: Dict[str, Any] = {}
+    for name, fn in build_cases(sizes).items():
+        if only and only not in name:
+            continue
+        size = int(name[name.index("[") + 1:-1])
+        stats = measure(fn, repeat)
+        stats["per_item_us"] = stats["median_s"] / size * 1e6
+        results[name] = stats
+        print(f"{name:<36} median={stats['median_s'] * 1e3:9.3f} ms  per_item={stats['per_item_us']:9.2f} us")
+
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "host": host_info(),
+        "repeat": repeat,
+        "reference_tables": tables,
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Names of cases whose median is more than `threshold` slower than the baseline."""
+    regressions = []
+    print(f"\n{'case':<36} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, stats in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<36} {'-':>12} {stats['median_s'] * 1e3:10.3f}ms {'new':>8}")
+            continue
+        change = stats["median_s"] / base["median_s"] - 1 if base["median_s"] > 0 else 0.0
+        flag = "  REGRESSION" if change > threshold else ""
+        print(f"{name:<36} {base['median_s'] * 1e3:10.3f}ms {stats['median_s'] * 1e3:10.3f}ms {change:+8.1%}{flag}")
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the cable validation pipeline")
+    parser.add_argument("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES), help="Comma-separated designs per call")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per case")
+    parser.add_argument("--only", default=None, help="Run only cases whose name contains this text")
+    parser.add_argument("--output", default=None, help="Write results JSON here")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE), help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown before a case counts as a regression")
+    parser.add_argument("--save-baseline", action="store_true", help="Store this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    # Per-request log lines would dominate the timings
+    logger.setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    current = run([int(s) for s in args.sizes.split(",")], args.repeat, args.only)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(current, indent=2))
+        print(f"\nResults written to {args.output}")
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(current, indent=2))
+        print(f"\nBaseline saved to {baseline_path}")
+        return 0
+
+    if not baseline_path.exists():
+        print(f"\nNo baseline at {baseline_path}; run with --save-baseline to create one")
+        return 0
+
+    baseline = json.loads(baseline_path.read_text())
+    regressions = compare(current, baseline, args.threshold)
+    if baseline.get("host") != current["host"]:
+        print(f"\nBaseline was recorded on another host ({baseline.get('host')}); comparison is informational only")
+        return 0
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
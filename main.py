@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from src.backend.router.v1.design_router import router as design_router_v1
@@ -7,7 +8,9 @@ from dotenv import load_dotenv
 from pathlib import Path
 from src.backend.config.logger import logger
 from src.backend.db.database import engine, Base
+from src.backend.db.migrations import upgrade_schema
 from src.backend.config.constants import constant
+from src.backend.observability.tracing import flush_tracing
 
 
 # Load environment variables
@@ -15,6 +18,13 @@ ENV_PATH = Path(__file__).resolve().parent / ".env"
 load_dotenv(dotenv_path=ENV_PATH)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Traces are sent by the client's background batcher; only drain what is left on the way out
+    flush_tracing()
+
+
 app = FastAPI(
     title=f"{constant.APP_TITLE} API",
     version=constant.API_VERSION,
@@ -31,6 +41,7 @@ app = FastAPI(
     ],
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 
@@ -43,6 +54,8 @@ app.add_middleware(
 )
 
 Base.metadata.create_all(bind=engine)
+# create_all never alters existing tables; add columns introduced since they were created
+upgrade_schema(engine)
 
 app.include_router(design_router_v1,prefix=f"{constant.API_PREFIX}/design",tags=[f"Design Validation {constant.API_VERSION}"])  
 app.include_router(system_router)
@@ -0,0 +1,155 @@
+import asyncio
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+import redis
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.observability.metrics import EXTRACTION_CACHE_LOOKUPS
+from src.backend.prompt_library.extraction_prompt import EXTRACTION_PROMPT
+from src.backend.schemas.cable_validation_schema import CableDesignSchema
+from src.backend.utils.hashing import normalize_free_text
+
+KEY_PREFIX = "extraction_cache:"
+INDEX_KEY = f"{KEY_PREFIX}index"
+
+# Changing the prompt changes every key, so stale extractions are never served after a prompt edit
+_PROMPT_DIGEST = hashlib.sha256(EXTRACTION_PROMPT.encode("utf-8")).hexdigest()
+
+
+def extraction_cache_key(user_input: Union[str, Dict[str, Any]], model_name: str) -> str:
+    if isinstance(user_input, str):
+        normalized = normalize_free_text(user_input)
+    else:
+        normalized = json.dumps(user_input, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    canonical = f"{model_name}\n{_PROMPT_DIGEST}\n{normalized}"
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ExtractionCache:
+    """
+    Two-tier cache of extraction results.
+    Tier 1 is a per-process LRU; tier 2 is an optional shared Redis tier with a TTL
+    and a size cap enforced through a sorted-set index of write times.
+    """
+
+    def __init__(
+        self,
+        local_max_entries: int,
+        redis_url: Optional[str] = None,
+        redis_ttl_seconds: int = 86400,
+        redis_max_entries: int = 100000
+    ):
+        self.local_max_entries = local_max_entries
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self.redis_max_entries = redis_max_entries
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = redis.Redis.from_url(redis_url) if redis_url else None
+        self.local_hits = 0
+        self.redis_hits = 0
+        self.misses = 0
+
+    # Local tier
+    def _get_local(self, key: str) -> Optional[str]:
+        with self._lock:
+            value = self._local.get(key)
+            if value is not None:
+                self._local.move_to_end(key)
+            return value
+
+    def _put_local(self, key: str, value: str) -> None:
+        if self.local_max_entries <= 0:
+            return
+        with self._lock:
+            self._local[key] = value
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    # Redis tier (blocking client, called off the event loop)
+    def _get_redis(self, key: str) -> Optional[str]:
+        value = self._redis.get(f"{KEY_PREFIX}{key}")
+        return value.decode("utf-8") if value is not None else None
+
+    def _put_redis(self, key: str, value: str) -> None:
+        now = time.time()
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.set(f"{KEY_PREFIX}{key}", value, ex=self.redis_ttl_seconds)
+        pipe.zadd(INDEX_KEY, {key: now})
+        # Drop index entries whose values have already expired
+        pipe.zremrangebyscore(INDEX_KEY, "-inf", now - self.redis_ttl_seconds)
+        pipe.zcard(INDEX_KEY)
+        size = pipe.execute()[-1]
+
+        overflow = size - self.redis_max_entries
+        if overflow > 0:
+            evicted = [member for member, _ in self._redis.zpopmin(INDEX_KEY, overflow)]
+            if evicted:
+                self._redis.delete(*(f"{KEY_PREFIX}{m.decode('utf-8')}" for m in evicted))
+
+    async def get(self, key: str) -> Optional[CableDesignSchema]:
+        value = self._get_local(key)
+        if value is not None:
+            self.local_hits += 1
+            EXTRACTION_CACHE_LOOKUPS.labels("local_hit").inc()
+            return CableDesignSchema.model_validate_json(value)
+
+        if self._redis is not None:
+            try:
+                value = await asyncio.to_thread(self._get_redis, key)
+            except Exception as e:
+                logger.warning(f"Extraction cache Redis read failed | error={str(e)}")
+                value = None
+            if value is not None:
+                self.redis_hits += 1
+                EXTRACTION_CACHE_LOOKUPS.labels("redis_hit").inc()
+                self._put_local(key, value)
+                return CableDesignSchema.model_validate_json(value)
+
+        self.misses += 1
+        EXTRACTION_CACHE_LOOKUPS.labels("miss").inc()
+        return None
+
+    async def set(self, key: str, fields: CableDesignSchema) -> None:
+        value = fields.model_dump_json()
+        self._put_local(key, value)
+
+        if self._redis is not None:
+            try:
+                await asyncio.to_thread(self._put_redis, key, value)
+            except Exception as e:
+                logger.warning(f"Extraction cache Redis write failed | error={str(e)}")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.local_hits + self.redis_hits + self.misses
+        return {
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.local_hits + self.redis_hits) / lookups if lookups else 0.0,
+            "local_entries": len(self._local)
+        }
+
+    def clear_local(self) -> None:
+        with self._lock:
+            self._local.clear()
+
+
+_extraction_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Process-wide cache so hits survive the per-task client construction."""
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache(
+            local_max_entries=settings.extraction_cache_local_max_entries,
+            redis_url=settings.redis_url_set if settings.extraction_cache_redis_enabled else None,
+            redis_ttl_seconds=settings.extraction_cache_redis_ttl_seconds,
+            redis_max_entries=settings.extraction_cache_redis_max_entries
+        )
+    return _extraction_cache
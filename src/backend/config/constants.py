@@ -7,6 +7,7 @@ class Constant:
     GPT = "GPT"
     CLAUDE = "Claude"
     GROQ = "Groq"
+    MOCK = "Mock"
 
     # Application Settings
     APP_TITLE = "Cable Design Validation System"
@@ -1,3 +1,8 @@
 class LLMInvocationError(Exception):
     """Custom exception for errors during LLM invocation."""
+    pass
+
+
+class LLMSchedulerTimeoutError(LLMInvocationError):
+    """Raised when an LLM call cannot get a concurrency slot or rate budget in time."""
     pass
\ No newline at end of file
@@ -1,17 +1,92 @@
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
+import random
 import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
 import colorlog
+from src.backend.config.settings import settings
 
 logger = logging.getLogger("Innovites Cable Design Validation System")
 
-if not logger.handlers: 
-    logger.setLevel(logging.DEBUG)
+# Request being handled by the current task/coroutine; attached to every record as `request_id`
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def set_request_id(request_id: Optional[str]) -> None:
+    request_id_var.set(request_id)
+
+
+def parse_sample_rates(spec: str) -> Dict[int, float]:
+    """'DEBUG=0.1,INFO=0.5' -> {10: 0.1, 20: 0.5}"""
+    rates = {}
+    for part in filter(None, (p.strip() for p in spec.split(","))):
+        level, _, rate = part.partition("=")
+        rates[logging.getLevelName(level.strip().upper())] = float(rate)
+    return rates
+
+
+class RequestContextFilter(logging.Filter):
+    """Runs on the caller's thread, before the record is queued, while the context var is still visible."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get() or "-"
+        return True
+
+
+class LevelSamplingFilter(logging.Filter):
+    """Keeps a random fraction of records per level; levels without a rate are always kept."""
+
+    def __init__(self, rates: Dict[int, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(record.levelno)
+        return rate is None or (rate > 0 and random.random() < rate)
+
+
+class RecordQueueHandler(QueueHandler):
+    """Merges the message on the caller's thread but leaves the traceback for the formatter (JSON keeps it separate)."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setLevel(logging.DEBUG)
 
+class JsonFormatter(logging.Formatter):
 
-    formatter = colorlog.ColoredFormatter(
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", "-"),
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def _build_formatter() -> logging.Formatter:
+    if settings.log_format == "json":
+        return JsonFormatter()
+    return colorlog.ColoredFormatter(
         "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
         datefmt="%Y-%m-%d %H:%M:%S",
         log_colors={
@@ -23,5 +98,48 @@ if not logger.handlers:
         }
     )
 
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
\ No newline at end of file
+
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    if _listener is not None:
+        _listener.stop()
+
+
+def _restart_listener_in_child() -> None:
+    # The listener thread does not survive fork (prefork pools); give the child its own queue and thread
+    global _listener
+    if _listener is None:
+        return
+    child_queue: queue.SimpleQueue = queue.SimpleQueue()
+    for handler in logger.handlers:
+        if isinstance(handler, RecordQueueHandler):
+            handler.queue = child_queue
+    _listener = QueueListener(child_queue, *_listener.handlers, respect_handler_level=True)
+    _listener.start()
+
+
+if not logger.handlers:
+    logger.setLevel(settings.log_level.upper())
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setLevel(settings.log_level.upper())
+    handler.setFormatter(_build_formatter())
+
+    if settings.log_async:
+        # Callers only enqueue the record; formatting and the blocking write happen on the listener thread
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        front: logging.Handler = RecordQueueHandler(log_queue)
+        _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(_stop_listener)
+        os.register_at_fork(after_in_child=_restart_listener_in_child)
+    else:
+        front = handler
+
+    sample_rates = parse_sample_rates(settings.log_sample_rates)
+    if sample_rates:
+        front.addFilter(LevelSamplingFilter(sample_rates))
+    front.addFilter(RequestContextFilter())
+    logger.addHandler(front)
@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
+from typing import Optional
 
 class Settings(BaseSettings):
 
@@ -18,17 +19,117 @@ class Settings(BaseSettings):
     groq_api_key: str = Field(default="", description="Groq API key")
     llama_cloud_api_key: str = Field(default="", description="Llama Cloud API key")
 
+    # LLM providers
+    extraction_provider: str = Field(default="Groq", description="Extraction provider: Groq, GPT, Claude or Mock")
+    validation_provider: str = Field(default="Gemini", description="Validation (audit) provider: Gemini or Mock")
+
+    # Mock providers (extraction_provider / validation_provider = "Mock")
+    mock_llm_latency_distribution: str = Field(default="lognormal", description="Injected latency: fixed, uniform, exponential or lognormal")
+    mock_llm_latency_mean_ms: float = Field(default=300.0, description="Mean injected latency per mock LLM call")
+    mock_llm_latency_sigma: float = Field(default=0.5, description="Shape of the lognormal latency distribution")
+    mock_llm_error_rate: float = Field(default=0.0, description="Probability that a mock LLM call raises LLMInvocationError")
+    mock_llm_seed: Optional[int] = Field(default=None, description="Seed for repeatable latency and failure sequences")
+
+    # Extraction provider routing (hedged requests + circuit breakers)
+    routing_enabled: bool = Field(default=False, description="Route extraction across several providers instead of extraction_provider alone")
+    routing_providers: str = Field(default="Groq,GPT,Claude", description="Comma-separated extraction providers in preference order")
+    routing_hedge_percentile: float = Field(default=0.95, description="Latency percentile after which a hedged request is sent")
+    routing_hedge_default_delay_seconds: float = Field(default=2.0, description="Hedge deadline until a provider has enough latency samples")
+    routing_min_samples: int = Field(default=20, description="Samples needed before the percentile deadline is trusted")
+    routing_latency_window: int = Field(default=200, description="Rolling window of latency/outcome samples per provider")
+    routing_breaker_failure_threshold: int = Field(default=5, description="Consecutive failures that open a provider's circuit")
+    routing_breaker_error_rate: float = Field(default=0.5, description="Windowed error rate that opens a provider's circuit")
+    routing_breaker_cooldown_seconds: float = Field(default=30.0, description="How long an open circuit keeps a provider out of rotation")
+
+    # LLM scheduler (per-provider concurrency and rate budgets, 0 disables a limit)
+    llm_scheduler_enabled: bool = Field(default=True, description="Throttle LLM calls per provider before sending them")
+    llm_scheduler_redis_enabled: bool = Field(default=True, description="Share budgets across workers through the broker Redis")
+    llm_scheduler_redis_retry_seconds: float = Field(default=30.0, description="How long to use in-process limits after a Redis error")
+    llm_scheduler_lease_seconds: float = Field(default=120.0, description="Expiry of an in-flight slot whose holder crashed")
+    llm_scheduler_acquire_timeout_seconds: float = Field(default=300.0, description="Maximum wait for a slot and budget before failing the call")
+    groq_max_in_flight: int = Field(default=8, description="Concurrent Groq requests across all workers")
+    groq_requests_per_minute: float = Field(default=30, description="Groq requests-per-minute budget")
+    groq_tokens_per_minute: float = Field(default=6000, description="Groq tokens-per-minute budget")
+    gemini_max_in_flight: int = Field(default=4, description="Concurrent Gemini requests across all workers")
+    gemini_requests_per_minute: float = Field(default=10, description="Gemini requests-per-minute budget")
+    gemini_tokens_per_minute: float = Field(default=250000, description="Gemini tokens-per-minute budget")
+
+    # Audit prompt
+    evidence_format: str = Field(default="verbose", description="Evidence layout sent to the auditor: verbose or compact")
+
+    # Audit micro-batching (several designs per Gemini call)
+    audit_batching_enabled: bool = Field(default=False, description="Collect concurrent audits into batched validation calls")
+    audit_batch_max_size: int = Field(default=8, description="Maximum designs per batched audit call")
+    audit_batch_max_wait_ms: float = Field(default=20.0, description="How long the collector waits to fill a batch")
+
+    # Rule-based pre-extraction
+    rule_extractor_enabled: bool = Field(default=True, description="Parse well-formed free text without calling the extraction LLM")
+    rule_extractor_min_confidence: float = Field(default=0.8, description="Minimum per-field confidence to accept a rule-parsed value")
+
     # Database
     database_url: str = Field(default="", description="Database connection URL")
 
+    # Conductor spec index
+    spec_index_version_check_seconds: float = Field(default=300.0, description="How often to check conductor_specs for changes (0 disables)")
+    csa_match_rel_tolerance: float = Field(default=0.005, description="Relative tolerance when matching a CSA to a standard IS 8130 size")
+
     # Celery
     redis_url_set: str = Field(default="", description="Redis connection URL for Celery")
+    celery_worker_pool: str = Field(default="threads", description="Celery pool: threads (concurrent validations on the async runner), solo or prefork")
+    celery_worker_concurrency: int = Field(default=32, description="Pool threads/processes per worker (ignored by solo)")
+    worker_async_concurrency: int = Field(default=32, description="Validations a worker process runs concurrently on its event loop")
+    task_max_retries: int = Field(default=3, description="Retries of a failed validation before it is marked FAILED")
+    task_retry_backoff_seconds: float = Field(default=10.0, description="Base delay of the exponential retry backoff")
+    task_retry_backoff_max_seconds: float = Field(default=300.0, description="Upper bound on a single retry delay")
+
+    # Validation queues (per input_mode and batch priority)
+    structured_queue_concurrency: int = Field(default=16, description="Pool threads/processes of workers serving json/manual validations (ignored by solo)")
+    free_text_queue_concurrency: int = Field(default=32, description="Pool threads/processes of workers serving free_text validations (ignored by solo)")
+
+    # Readiness probe (/ready)
+    readiness_cache_seconds: float = Field(default=5.0, description="How long a readiness result is reused before the checks run again")
+    readiness_check_timeout_seconds: float = Field(default=2.0, description="Time limit of each dependency check")
+    readiness_max_pool_utilization: float = Field(default=0.9, description="Share of DB pool connections checked out above which the instance is not ready")
+    readiness_max_queue_depth: int = Field(default=1000, description="Queued validations above which /ready reports degraded (0 disables)")
+    readiness_max_pending_age_seconds: float = Field(default=600.0, description="Age of the oldest PENDING validation above which /ready reports degraded (0 disables)")
+    readiness_min_workers: int = Field(default=1, description="Live Celery workers below which /ready reports degraded (0 disables the check)")
+
+    # Metrics
+    worker_metrics_port: int = Field(default=9808, description="Port of the Celery worker's Prometheus endpoint (0 disables)")
+
+    # Batch submissions
+    max_batch_size: int = Field(default=500, description="Maximum number of designs accepted per batch submission")
+
+    # Submission deduplication
+    dedup_enabled: bool = Field(default=True, description="Reuse recent results for identical submissions")
+    dedup_ttl_seconds: int = Field(default=3600, description="How long a SUCCESS or PENDING record can be reused")
+
+    # Result delivery (long-poll / SSE)
+    result_wait_default_seconds: float = Field(default=30.0, description="Default time a long-poll or SSE client waits for a result")
+    result_wait_max_seconds: float = Field(default=120.0, description="Upper bound on the wait time a client may request")
+    sse_keepalive_seconds: float = Field(default=15.0, description="Interval between SSE keep-alive comments")
+
+    # Extraction cache
+    extraction_cache_enabled: bool = Field(default=True, description="Cache free_text extraction results")
+    extraction_cache_local_max_entries: int = Field(default=1024, description="Per-process LRU size (0 disables the local tier)")
+    extraction_cache_redis_enabled: bool = Field(default=False, description="Share extraction results across workers through Redis")
+    extraction_cache_redis_ttl_seconds: int = Field(default=86400, description="TTL of Redis extraction cache entries")
+    extraction_cache_redis_max_entries: int = Field(default=100000, description="Size cap of the Redis tier; oldest entries are evicted first")
 
     
+    # Logging
+    log_level: str = Field(default="DEBUG", description="Level of the application logger (DEBUG, INFO, WARNING, ...)")
+    log_format: str = Field(default="color", description="Log line format: color or json (json carries request_id)")
+    log_async: bool = Field(default=True, description="Write log records from a background listener thread instead of the caller")
+    log_sample_rates: str = Field(default="", description="Per-level keep ratios, e.g. 'DEBUG=0.05,INFO=0.5'; unlisted levels are always kept")
+
     # LangSmith
     langsmith_api_key: str = Field(default="", description="LangSmith API key")
     langsmith_project: str = Field(default="", description="LangSmith project name")
     langsmith_endpoint: str = Field(default="", description="LangSmith endpoint")
     langsmith_tracing_v2: bool = Field(default=False)
+    langsmith_sample_rate: float = Field(default=1.0, description="Fraction of API requests and worker tasks traced (0-1)")
+    langsmith_route_sample_rates: str = Field(default="", description="Per-trace overrides, e.g. 'cable_design_validation_result_Api_hit=0.01'")
+    langsmith_trace_on_error: bool = Field(default=True, description="Record a root-only trace for failed calls that were not sampled")
 
 settings = Settings()
@@ -0,0 +1,104 @@
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from src.backend.db.models.ai_validation_model import AIValidation
+
+
+async def save_ai_validation(
+    db: AsyncSession,
+    request_id,
+    raw_text: str,
+    ai_result,
+    meta: dict,
+    error_message: str = None,
+    payload_hash: str = None
+) -> AIValidation:
+
+    row = AIValidation(
+        request_id=request_id,
+        raw_input_text=raw_text,
+        payload_hash=payload_hash,
+        ai_response=ai_result,
+        model_name=meta.get("model_name"),
+        pipeline_type=meta.get("pipeline_type"),
+        status=meta.get("status", "SUCCESS"),
+        error_message=error_message
+    )
+
+    db.add(row)
+    await db.commit()
+    return row
+
+
+async def get_ai_validation(db: AsyncSession, request_id) -> Optional[AIValidation]:
+    result = await db.execute(select(AIValidation).where(AIValidation.request_id == request_id))
+    return result.scalars().first()
+
+
+async def find_reusable_validation(db: AsyncSession, payload_hash: str, since: datetime) -> Optional[AIValidation]:
+    """Most recent SUCCESS or in-flight PENDING/RETRYING record for the payload created after `since`."""
+    result = await db.execute(
+        select(AIValidation)
+        .where(
+            AIValidation.payload_hash == payload_hash,
+            AIValidation.status.in_(("SUCCESS", "PENDING", "RETRYING")),
+            AIValidation.created_at >= since
+        )
+        .order_by(AIValidation.created_at.desc())
+        .limit(1)
+    )
+    return result.scalars().first()
+
+
+async def find_inflight_validation(db: AsyncSession, payload_hash: str) -> Optional[AIValidation]:
+    """The PENDING/RETRYING single submission holding uq_ai_validations_inflight_payload for the payload."""
+    result = await db.execute(
+        select(AIValidation)
+        .where(
+            AIValidation.payload_hash == payload_hash,
+            AIValidation.status.in_(("PENDING", "RETRYING")),
+            AIValidation.batch_id.is_(None)
+        )
+        .limit(1)
+    )
+    return result.scalars().first()
+
+
+async def bulk_save_ai_validations(db: AsyncSession, rows: List[Dict[str, Any]]) -> int:
+    """Inserts all rows with a single executemany INSERT and one commit."""
+    if not rows:
+        return 0
+
+    await db.execute(insert(AIValidation), rows)
+    await db.commit()
+    return len(rows)
+
+
+async def mark_validation_failed(db: AsyncSession, request_id, error_message: str) -> bool:
+    """Marks an existing record FAILED; False when no record was saved for request_id."""
+    result = await db.execute(
+        update(AIValidation)
+        .where(AIValidation.request_id == request_id)
+        .values(status="FAILED", error_message=error_message)
+    )
+    await db.commit()
+    return result.rowcount > 0
+
+
+async def mark_batch_failed(db: AsyncSession, batch_id, error_message: str) -> None:
+    await db.execute(
+        update(AIValidation)
+        .where(AIValidation.batch_id == batch_id, AIValidation.status == "PENDING")
+        .values(status="FAILED", error_message=error_message)
+    )
+    await db.commit()
+
+
+async def get_batch_status_counts(db: AsyncSession, batch_id) -> Dict[str, int]:
+    result = await db.execute(
+        select(AIValidation.status, func.count(AIValidation.id))
+        .where(AIValidation.batch_id == batch_id)
+        .group_by(AIValidation.status)
+    )
+    return {status: count for status, count in result.all()}
@@ -8,12 +8,14 @@ def save_ai_validation(
     raw_text: str,
     ai_result,
     meta: dict,
-    error_message: str = None
+    error_message: str = None,
+    payload_hash: str = None
 ) -> AIValidation:
 
     row = AIValidation(
         request_id=request_id,
         raw_input_text=raw_text,
+        payload_hash=payload_hash,
         ai_response=ai_result,
         model_name=meta.get("model_name"),
         pipeline_type=meta.get("pipeline_type"),
@@ -24,4 +26,5 @@ def save_ai_validation(
     db.add(row)
     db.commit()
     db.refresh(row)
-    return row
\ No newline at end of file
+    return row
+
@@ -1,11 +1,28 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from src.backend.config.settings import settings
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 
+def to_async_database_url(database_url: str) -> str:
+    """Maps a sync DATABASE_URL onto its async driver (asyncpg for Postgres, aiosqlite for SQLite)."""
+    for sync_prefix, async_prefix in (
+        ("postgresql+psycopg2://", "postgresql+asyncpg://"),
+        ("postgresql://", "postgresql+asyncpg://"),
+        ("postgres://", "postgresql+asyncpg://"),
+        ("sqlite:///", "sqlite+aiosqlite:///"),
+    ):
+        if database_url.startswith(sync_prefix):
+            return async_prefix + database_url[len(sync_prefix):]
+    return database_url
+
+
 engine = create_engine(settings.database_url, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = create_async_engine(to_async_database_url(settings.database_url), pool_pre_ping=True)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 # FastAPI dependency
@@ -14,4 +31,9 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# FastAPI dependency (async routes)
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,65 @@
+"""
+Schema upgrades for databases created before the ai_validations columns in UPGRADE_STEPS existed.
+Base.metadata.create_all only creates missing tables and never alters an existing one,
+so these are applied explicitly. Every step is idempotent; safe to run on each start.
+
+    python -m src.backend.db.migrations
+"""
+from typing import List, Tuple
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.engine import Engine
+from src.backend.config.logger import logger
+from src.backend.db.database import engine
+from src.backend.db.models.ai_validation_model import AIValidation
+
+# Nullable columns and indexes added to ai_validations after its first release, one step per change,
+# applied in order; existing rows stay valid because every added column is nullable
+UPGRADE_STEPS: List[Tuple[str, Tuple[str, ...], Tuple[str, ...]]] = [
+    ("batch submissions", ("batch_id",), ("ix_ai_validations_batch_id",)),
+    ("submission deduplication", ("payload_hash",), ("ix_ai_validations_payload_hash", "uq_ai_validations_inflight_payload")),
+]
+
+
+def upgrade_schema(bind: Engine) -> List[str]:
+    """Applies every missing step to an existing ai_validations table; returns the changes applied."""
+    table = AIValidation.__table__
+    inspector = inspect(bind)
+    if not inspector.has_table(table.name):
+        # create_all builds it with the current columns
+        return []
+
+    applied = []
+    indexes = {index.name: index for index in table.indexes}  # type: ignore
+    # Postgres tolerates a concurrent instance adding the same column first
+    if_not_exists = " IF NOT EXISTS" if bind.dialect.name == "postgresql" else ""
+    for step, columns, index_names in UPGRADE_STEPS:
+        existing_columns = {c["name"] for c in inspect(bind).get_columns(table.name)}
+        with bind.begin() as conn:
+            for name in columns:
+                if name in existing_columns:
+                    continue
+                column_type = table.c[name].type.compile(dialect=bind.dialect)
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN{if_not_exists} {name} {column_type}"))
+                applied.append(f"column {table.name}.{name} ({step})")
+
+        existing_indexes = {i["name"] for i in inspect(bind).get_indexes(table.name)}
+        for name in index_names:
+            if name in existing_indexes:
+                continue
+            try:
+                indexes[name].create(bind, checkfirst=True)
+            except IntegrityError as e:
+                # A unique index over rows that already collide; the other steps still apply
+                logger.warning(f"Schema upgrade skipped index {name} ({step}); resolve the duplicate rows and rerun | error={str(e)}")
+                continue
+            applied.append(f"index {name} ({step})")
+
+    for change in applied:
+        logger.info(f"Schema upgraded | added {change}")
+    return applied
+
+
+if __name__ == "__main__":
+    changes = upgrade_schema(engine)
+    logger.info(f"Schema upgrade complete | changes={len(changes)}")
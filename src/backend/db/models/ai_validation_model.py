@@ -1,22 +1,44 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Index, Integer, String, Text, DateTime, JSON
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 import uuid
 from ..database import Base
 
+# Plain JSON on SQLite (local runs, load tests); JSONB everywhere else
+JSONType = JSONB().with_variant(JSON(), "sqlite")
+
 class AIValidation(Base):
     __tablename__ = "ai_validations"
 
     id = Column(Integer, primary_key=True, index=True)
     request_id = Column(UUID(as_uuid=True), default=uuid.uuid4, unique=True, index=True, nullable=False)
+    batch_id = Column(UUID(as_uuid=True), nullable=True, index=True)
 
     raw_input_text = Column(Text, nullable=False)
-    ai_response = Column(JSONB, nullable=True)
+    payload_hash = Column(String(64), nullable=True, index=True)
+    ai_response = Column(JSONType, nullable=True)
 
     model_name = Column(String(100))
     pipeline_type = Column(String(50))
+    prompt_tokens = Column(Integer, nullable=True)  # estimated LLM input tokens for the request
 
-    status = Column(String(20), default="SUCCESS")
+    status = Column(String(20), default="SUCCESS", index=True)  # readiness looks up the oldest PENDING row
     error_message = Column(Text, nullable=True)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    # Last completed pipeline stage and its intermediate results, so task retries resume instead of restarting
+    stage = Column(String(20), nullable=True)
+    checkpoint = Column(JSONType, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        # At most one in-flight single submission per payload, so concurrent identical POSTs cannot both enqueue;
+        # batch items are never deduplicated and are left out
+        Index(
+            "uq_ai_validations_inflight_payload",
+            payload_hash,
+            unique=True,
+            postgresql_where=status.in_(("PENDING", "RETRYING")) & batch_id.is_(None),
+            sqlite_where=status.in_(("PENDING", "RETRYING")) & batch_id.is_(None)
+        ),
+    )
\ No newline at end of file
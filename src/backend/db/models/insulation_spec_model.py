@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, Float, String, Text
+from ..database import Base
+
+class InsulationSpec(Base):
+
+    __tablename__ = "insulation_specs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    standard = Column(String(50), nullable=False)
+    
+    # --- Voltage Grade ---
+    voltage_grade = Column(String(20), nullable=False)
+    max_voltage_v = Column(Integer, nullable=False)
+
+    # --- Insulation (IS 1554-1 Table 3) ---
+    insulation_material = Column(String(20), nullable=False, index=True)
+    csa_mm2 = Column(Float(10), nullable=False, index=True)
+    nominal_thickness_mm = Column(Float(10), nullable=False)
+    
+    note = Column(Text)
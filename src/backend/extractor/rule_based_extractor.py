@@ -0,0 +1,175 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.interfaces.IS_cable_validation import IFieldExtractor
+from src.backend.schemas.cable_validation_schema import CableDesignSchema
+
+_NUMBER = r"(\d+(?:\.\d+)?)"
+_AREA_UNIT = r"(?:mm\s*²|mm\s*2\b|mm\s*\^\s*2|sq\.?\s*mm\b|sqmm\b)"
+
+_STANDARD_PATTERN = re.compile(
+    r"\bIS\s*[:\-]?\s*(\d{3,5})(?:\s*\(\s*Part\s*[-:]?\s*(\d+|I{1,3})\s*\)|\s*[-,]?\s*Part\s*[-:]?\s*(\d+|I{1,3})\b|\s*-\s*(\d+)\b)?",
+    re.IGNORECASE
+)
+_VOLTAGE_PATTERN = re.compile(rf"\b{_NUMBER}\s*(?:/\s*{_NUMBER}\s*)?(kV|V)\b", re.IGNORECASE)
+_MATERIAL_PATTERN = re.compile(r"\b(Cu|Copper|Al|Alu|Aluminium|Aluminum)\b", re.IGNORECASE)
+_CLASS_PATTERN = re.compile(r"\bClass\s*[-:]?\s*([1-6])\b", re.IGNORECASE)
+_CSA_PATTERN = re.compile(rf"(?:\b\d+\s*C?\s*[xX×]\s*)?\b{_NUMBER}\s*{_AREA_UNIT}", re.IGNORECASE)
+_INSULATION_PATTERN = re.compile(r"\b(PVC|XLPE|HEPR|EPR|LSZH|PE)\b(\s*[-]?\s*insulat\w*)?", re.IGNORECASE)
+_INSULATION_THICKNESS_PATTERN = re.compile(
+    rf"\b(?:PVC|XLPE|HEPR|EPR|LSZH|PE|insulation|thickness)\b[^,;\n\d]{{0,25}}?{_NUMBER}\s*mm\b(?!\s*(?:²|2|\^))",
+    re.IGNORECASE
+)
+_LENGTH_PATTERN = re.compile(rf"\b{_NUMBER}\s*mm\b(?!\s*(?:²|2|\^))", re.IGNORECASE)
+
+# Words that carry no field value; anything else left over means the text holds more than the grammar parsed
+_FILLER_WORDS = frozenset({
+    "is", "cable", "cables", "core", "cores", "conductor", "conductors", "insulated", "insulation",
+    "thickness", "nominal", "grade", "standard", "rated", "voltage", "with", "and", "of", "mm",
+    "stranded", "design", "csa", "material", "type", "single", "multi", "nom", "thk", "per"
+})
+_TOKEN_PATTERN = re.compile(r"[^\W_]+", re.UNICODE)
+
+_MATERIAL_ALIASES = {"cu": "Cu", "copper": "Cu", "al": "Al", "alu": "Al", "aluminium": "Al", "aluminum": "Al"}
+_ROMAN_PARTS = {"i": "1", "ii": "2", "iii": "3"}
+
+
+@dataclass
+class RuleExtraction:
+    """Rule parser output: values, per-field confidence (0-1) and unparsed residual tokens."""
+    fields: CableDesignSchema
+    confidence: Dict[str, float]
+    residual: List[str] = field(default_factory=list)
+
+    def unresolved(self, min_confidence: float) -> List[str]:
+        return [name for name in CableDesignSchema.model_fields if self.confidence.get(name, 0.0) < min_confidence]
+
+    def is_ambiguous(self, min_confidence: float) -> bool:
+        """True when a field was seen in the text but not with enough confidence to trust it."""
+        return any(0.0 < score < min_confidence for score in self.confidence.values())
+
+
+def _single(values: List[Any]) -> Tuple[Optional[Any], float]:
+    """One distinct value -> high confidence; conflicting values -> unresolved."""
+    distinct = list(dict.fromkeys(values))
+    if not distinct:
+        return None, 0.0
+    if len(distinct) == 1:
+        return distinct[0], 0.95
+    return distinct[0], 0.4
+
+
+class RuleBasedFieldExtractor(IFieldExtractor):
+    """
+    Grammar-based extractor for terse engineering shorthand such as
+    "IS 1554-1, 1.1 kV, Cu, Class 2, 10 mm², PVC 1.0 mm". No network calls.
+    """
+
+    def __init__(self):
+        logger.info("RuleBasedFieldExtractor initialized")
+
+    def parse(self, text: str) -> RuleExtraction:
+        values: Dict[str, Any] = {}
+        confidence: Dict[str, float] = {}
+        consumed: List[Tuple[int, int]] = []
+
+        def take(name: str, matches: List[re.Match], convert) -> None:
+            if not matches:
+                return
+            value, score = _single([convert(m) for m in matches])
+            values[name], confidence[name] = value, score
+            consumed.extend(m.span() for m in matches)
+
+        # Standard: "IS 1554-1", "IS 1554 (Part 1)", "IS:694"
+        def standard_value(m: re.Match) -> str:
+            part = m.group(2) or m.group(3) or m.group(4)
+            part = _ROMAN_PARTS.get(part.lower(), part) if part else None
+            return f"IS {m.group(1)}-{part}" if part else f"IS {m.group(1)}"
+        take("standard", list(_STANDARD_PATTERN.finditer(text)), standard_value)
+
+        take("voltage", list(_VOLTAGE_PATTERN.finditer(text)), lambda m: " ".join(m.group(0).split()))
+        take("conductor_material", list(_MATERIAL_PATTERN.finditer(text)), lambda m: _MATERIAL_ALIASES[m.group(1).lower()])
+        take("conductor_class", list(_CLASS_PATTERN.finditer(text)), lambda m: f"Class {m.group(1)}")
+        take("csa", list(_CSA_PATTERN.finditer(text)), lambda m: float(m.group(1)))
+
+        # Insulation material: prefer an explicit "<material> insulated" over a bare mention (could be the sheath)
+        insulation_matches = list(_INSULATION_PATTERN.finditer(text))
+        explicit = [m for m in insulation_matches if m.group(2)]
+        take("insulation_material", explicit or insulation_matches, lambda m: m.group(1).upper())
+        if not explicit and len({m.group(1).upper() for m in insulation_matches}) > 1:
+            confidence["insulation_material"] = 0.4
+
+        # Insulation thickness: a length next to an insulation cue, else a lone length is only a guess
+        thickness_matches = list(_INSULATION_THICKNESS_PATTERN.finditer(text))
+        if thickness_matches:
+            take("insulation_thickness", thickness_matches, lambda m: float(m.group(1)))
+        else:
+            lengths = list(_LENGTH_PATTERN.finditer(text))
+            take("insulation_thickness", lengths, lambda m: float(m.group(1)))
+            if lengths:
+                confidence["insulation_thickness"] = min(confidence["insulation_thickness"], 0.5)
+
+        residual = self._residual(text, consumed)
+        try:
+            fields = CableDesignSchema(**values)
+        except ValueError:
+            # e.g. a zero CSA; leave every field to the LLM
+            fields, confidence = CableDesignSchema(), {}
+
+        return RuleExtraction(fields=fields, confidence=confidence, residual=residual)
+
+    @staticmethod
+    def _residual(text: str, consumed: List[Tuple[int, int]]) -> List[str]:
+        chars = list(text)
+        for start, end in consumed:
+            chars[start:end] = " " * (end - start)
+        return [t for t in _TOKEN_PATTERN.findall("".join(chars)) if t.lower() not in _FILLER_WORDS]
+
+    async def extract(self, user_input: Union[str, Dict[str, Any]]) -> CableDesignSchema:
+        return self.parse(str(user_input)).fields
+
+
+class HybridFieldExtractor(IFieldExtractor):
+    """
+    Rule parser first; the LLM extractor is called only when the parser left something
+    unexplained (ambiguous fields or unparsed text), and only its values for the
+    unresolved fields are used.
+    """
+
+    def __init__(
+        self,
+        rule_extractor: RuleBasedFieldExtractor,
+        llm_extractor: IFieldExtractor,
+        min_confidence: Optional[float] = None
+    ):
+        self.rule_extractor = rule_extractor
+        self.llm_extractor = llm_extractor
+        self.min_confidence = settings.rule_extractor_min_confidence if min_confidence is None else min_confidence
+        logger.info("HybridFieldExtractor initialized")
+
+    async def extract(self, user_input: Union[str, Dict[str, Any]]) -> CableDesignSchema:
+        if not isinstance(user_input, str):
+            return await self.llm_extractor.extract(user_input)
+
+        parsed = self.rule_extractor.parse(user_input)
+        unresolved = parsed.unresolved(self.min_confidence)
+
+        if not parsed.residual and not parsed.is_ambiguous(self.min_confidence):
+            logger.info("Rule extractor resolved input without LLM | missing=%s", unresolved)
+            return self._resolved_only(parsed)
+
+        logger.info("Falling back to LLM extractor | unresolved=%s | residual=%s", unresolved, parsed.residual[:5])
+        llm_fields = await self.llm_extractor.extract(user_input)
+        merged = self._resolved_only(parsed).model_dump()
+        for name in unresolved:
+            merged[name] = getattr(llm_fields, name)
+        return CableDesignSchema(**merged)
+
+    def _resolved_only(self, parsed: RuleExtraction) -> CableDesignSchema:
+        keep = {
+            name: value for name, value in parsed.fields.model_dump().items()
+            if parsed.confidence.get(name, 0.0) >= self.min_confidence
+        }
+        return CableDesignSchema(**keep)
@@ -7,7 +7,7 @@ from src.backend.schemas.cable_validation_schema import ValidationResponseSchema
 class EvidenceFormatter(IEvidenceFormatter):
     
     def format(self, db_validations: List[ValidationResponseSchema]) -> str:
-        logger.debug(f"Formatting {len(db_validations)} validation results")
+        logger.debug("Formatting %d validation results", len(db_validations))
         evidence_lines = ["### DATABASE VALIDATION EVIDENCE (IS 8130):"]
         for v in db_validations:
             icon = "✅" if v.validation_status == "PASS" else "⚠️"
@@ -15,4 +15,50 @@ class EvidenceFormatter(IEvidenceFormatter):
                 f"{icon} Field: {v.field} | Status: {v.validation_status} | "
                 f"Expected: {v.expected} | Comment: {v.comment}"
             )
-        return "\n".join(evidence_lines)
\ No newline at end of file
+        return "\n".join(evidence_lines)
+
+# Short codes keep the compact table narrow; the legend line maps them back to schema fields
+FIELD_CODES = {
+    "standard": "STD",
+    "voltage": "V",
+    "conductor_material": "CM",
+    "conductor_class": "CC",
+    "csa": "CSA",
+    "insulation_material": "IM",
+    "insulation_thickness": "IT",
+}
+
+
+# Sentences repeated on every WARN row (CableRAGValidator._prepare_llm_fields); the compact header states them once
+WARN_BOILERPLATE = (
+    " is outside the scope of IS 8130.",
+    " Final LLM must validate this against IS 1554-1 requirements.",
+)
+
+
+class CompactEvidenceFormatter(IEvidenceFormatter):
+    """
+    Minimal pipe table keyed by field code. Drops icons and the sentences repeated on
+    every WARN row; every comment (rule citations, tolerance matches) is kept. A 'Refer to'
+    expected value is a placeholder, not an IS requirement, and stays marked as 'ref:'.
+    """
+
+    def format(self, db_validations: List[ValidationResponseSchema]) -> str:
+        logger.debug("Formatting %d validation results (compact)", len(db_validations))
+        present = {v.field for v in db_validations}
+        legend = " ".join(f"{code}={field}" for field, code in FIELD_CODES.items() if field in present)
+        evidence_lines = [
+            "### DB EVIDENCE (IS 8130; WARN = outside IS 8130, verify per IS 1554-1; ref: = value to verify, not an IS requirement)",
+            f"codes: {legend}",
+            "code|status|expected|note"
+        ]
+        for v in db_validations:
+            expected = v.expected or ""
+            if expected.startswith("Refer to "):
+                expected = "ref:" + expected.removeprefix("Refer to ")
+            note = v.comment or ""
+            if v.validation_status == "WARN":
+                for sentence in WARN_BOILERPLATE:
+                    note = note.replace(sentence, "")
+            evidence_lines.append(f"{FIELD_CODES.get(v.field, v.field)}|{v.validation_status}|{expected}|{note.strip()}")
+        return "\n".join(evidence_lines)
@@ -16,6 +16,13 @@ class IDatabaseValidator(ABC):
         pass
 
 
+class IRuleEngine(ABC):
+    """Interface for deterministic standards rules (returns only the fields it can decide)"""
+    @abstractmethod
+    def evaluate(self, extracted_fields: CableDesignSchema) -> List[ValidationResponseSchema]:
+        pass
+
+
 class IEvidenceFormatter(ABC):
     """Interface for formatting validation evidence"""
     @abstractmethod
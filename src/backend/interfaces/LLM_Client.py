@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from src.backend.schemas.cable_validation_schema import LLMResponseSchema, CableDesignSchema
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, List, Tuple
+import asyncio
 
 class ExtractLLMClient(ABC):
     @abstractmethod
@@ -12,5 +13,12 @@ class ValidateLLMClient(ABC):
     async def validate(self, evidence_context: str, extracted_fields: CableDesignSchema) -> LLMResponseSchema:
         pass
 
+    async def validate_batch(self, items: List[Tuple[str, CableDesignSchema]]) -> List[Union[LLMResponseSchema, BaseException]]:
+        """
+        Audits several (evidence_context, extracted_fields) pairs; clients may override with a single call.
+        Results are in item order, and an item whose audit failed holds its exception so the others still succeed.
+        """
+        return list(await asyncio.gather(*(self.validate(evidence, fields) for evidence, fields in items), return_exceptions=True))
+
 
     
\ No newline at end of file
@@ -0,0 +1,108 @@
+import asyncio
+import json
+from typing import Dict, Optional, Set
+import redis
+import redis.asyncio as aioredis
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+
+CHANNEL_PREFIX = "validation_result:"
+TERMINAL_STATUSES = {"SUCCESS", "FAILED"}
+
+_publisher: Optional[redis.Redis] = None
+
+
+def result_channel(request_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{request_id}"
+
+
+def publish_validation_result(request_id: str, job_status: str) -> None:
+    """Notifies waiting API clients that a validation job has finished. Never raises."""
+    global _publisher
+    try:
+        if _publisher is None:
+            _publisher = redis.Redis.from_url(settings.redis_url_set)
+        _publisher.publish(result_channel(request_id), json.dumps({"request_id": request_id, "status": job_status}))
+    except Exception as e:
+        # Waiters fall back to their timeout and a final DB read, so a lost notification is not fatal
+        logger.warning(f"Failed to publish validation result | request_id={request_id} | error={str(e)}")
+
+
+class ValidationResultListener:
+    """
+    Process-wide Redis pub/sub listener.
+    A single pattern subscription serves every waiting client in this process,
+    so N waiters cost one Redis connection instead of N.
+    """
+
+    def __init__(self, redis_url: str):
+        self.redis_url = redis_url
+        self._waiters: Dict[str, Set[asyncio.Future]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._listen())
+
+    async def _listen(self) -> None:
+        backoff = 0.5
+        while True:
+            client = aioredis.Redis.from_url(self.redis_url)
+            pubsub = client.pubsub()
+            try:
+                await pubsub.psubscribe(f"{CHANNEL_PREFIX}*")
+                logger.info("Validation result listener subscribed")
+                backoff = 0.5
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+                    if message is not None:
+                        self._dispatch(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Validation result listener disconnected | error={str(e)}")
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10.0)
+            finally:
+                await pubsub.aclose()
+                await client.aclose()
+
+    def _dispatch(self, message: dict) -> None:
+        channel = message.get("channel")
+        if isinstance(channel, bytes):
+            channel = channel.decode()
+        request_id = str(channel)[len(CHANNEL_PREFIX):]
+
+        try:
+            job_status = json.loads(message.get("data")).get("status")
+        except Exception:
+            job_status = None
+
+        for future in self._waiters.get(request_id, ()):
+            if not future.done():
+                future.set_result(job_status)
+
+    def register(self, request_id: str) -> asyncio.Future:
+        """Registers interest in a request. Call before reading the DB so no notification is missed."""
+        self._ensure_running()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(request_id, set()).add(future)
+        return future
+
+    def unregister(self, request_id: str, future: asyncio.Future) -> None:
+        waiters = self._waiters.get(request_id)
+        if waiters is None:
+            return
+        waiters.discard(future)
+        if not waiters:
+            del self._waiters[request_id]
+
+    async def wait(self, future: asyncio.Future, timeout: float) -> Optional[str]:
+        """Returns the published status, or None on timeout."""
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+result_listener = ValidationResultListener(settings.redis_url_set)
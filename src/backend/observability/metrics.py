@@ -0,0 +1,106 @@
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional, Tuple
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess, start_http_server
+from src.backend.config.logger import logger
+
+# Seconds; LLM calls dominate, DB/formatting stages sit in the low buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+TOKEN_BUCKETS = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000)
+
+STAGE_DURATION = Histogram(
+    "cable_validation_stage_duration_seconds",
+    "Duration of one CableDesignValidator pipeline stage",
+    ["stage"],
+    buckets=LATENCY_BUCKETS
+)
+TASK_DURATION = Histogram(
+    "cable_validation_task_duration_seconds",
+    "Duration of one validate_cable_design_task attempt",
+    ["input_mode", "status"],
+    buckets=LATENCY_BUCKETS
+)
+QUEUE_WAIT = Histogram(
+    "cable_validation_queue_wait_seconds",
+    "Time between enqueueing a validation and a worker starting it",
+    ["queue"],
+    buckets=LATENCY_BUCKETS
+)
+LLM_REQUEST_DURATION = Histogram(
+    "llm_request_duration_seconds",
+    "Duration of one LLM provider call, excluding scheduler waits",
+    ["provider", "stage"],
+    buckets=LATENCY_BUCKETS
+)
+LLM_PROMPT_TOKENS = Histogram(
+    "llm_prompt_tokens",
+    "Estimated input tokens per LLM prompt",
+    ["provider", "stage"],
+    buckets=TOKEN_BUCKETS
+)
+LLM_ERRORS = Counter(
+    "llm_errors_total",
+    "Failed LLM provider calls",
+    ["provider", "stage"]
+)
+EXTRACTION_CACHE_LOOKUPS = Counter(
+    "extraction_cache_lookups_total",
+    "Extraction cache lookups by outcome",
+    ["result"]
+)
+TASK_OUTCOMES = Counter(
+    "cable_validation_tasks_total",
+    "Validation task attempts by outcome",
+    ["status"]
+)
+
+
+@contextmanager
+def observe_stage(stage: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_DURATION.labels(stage).observe(time.perf_counter() - started)
+
+
+@contextmanager
+def observe_llm_call(provider: str, stage: str) -> Iterator[None]:
+    """Times the provider call and counts it as an error if it raises (cancellation excluded)."""
+    started = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        LLM_ERRORS.labels(provider, stage).inc()
+        raise
+    finally:
+        LLM_REQUEST_DURATION.labels(provider, stage).observe(time.perf_counter() - started)
+
+
+def observe_queue_wait(queue: Optional[str], enqueued_at: Optional[float]) -> None:
+    # Wall-clock timestamps from the API host; clock skew can make tiny waits negative
+    if enqueued_at is not None:
+        QUEUE_WAIT.labels(queue or "unknown").observe(max(0.0, time.time() - enqueued_at))
+
+
+def _collection_registry() -> CollectorRegistry:
+    # Prefork children / several uvicorn workers each write their own files under PROMETHEUS_MULTIPROC_DIR
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    return generate_latest(_collection_registry()), CONTENT_TYPE_LATEST
+
+
+def start_metrics_server(port: int) -> None:
+    """Serves /metrics for a Celery worker on its own port. Never raises."""
+    try:
+        start_http_server(port, registry=_collection_registry())
+        logger.info(f"Worker metrics server listening | port={port}")
+    except OSError as e:
+        logger.warning(f"Worker metrics server not started | port={port} | error={str(e)}")
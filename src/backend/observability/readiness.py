@@ -0,0 +1,136 @@
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Dict, Optional, Tuple
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, select, text
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.db.database import async_engine
+from src.backend.db.models.ai_validation_model import AIValidation
+from src.backend.tasks.queues import get_queue_depths
+from src.backend.tasks.validation_task import celery_app
+
+_cached: Optional[Tuple[float, Dict[str, Any]]] = None
+_lock = asyncio.Lock()
+
+
+def pool_usage() -> Dict[str, Any]:
+    """Connections of the API's (async) engine pool; utilization is None for pools without a fixed capacity."""
+    pool = async_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return {"checked_out": None, "capacity": None, "utilization": None}
+    max_overflow = getattr(pool, "_max_overflow", 0)
+    capacity = pool.size() + max_overflow if max_overflow >= 0 else None
+    checked_out = pool.checkedout()
+    return {
+        "checked_out": checked_out,
+        "capacity": capacity,
+        "utilization": round(checked_out / capacity, 3) if capacity else None
+    }
+
+
+async def check_database() -> Dict[str, Any]:
+    # Read the pool before taking our own connection; a saturated pool shows up as a timeout below
+    pool = pool_usage()
+    started = time.perf_counter()
+    async with async_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+    utilization = pool["utilization"]
+    return {
+        "ok": utilization is None or utilization < settings.readiness_max_pool_utilization,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        "pool": pool
+    }
+
+
+async def check_pending_age() -> Dict[str, Any]:
+    async with async_engine.connect() as conn:
+        oldest = (await conn.execute(
+            select(func.min(AIValidation.created_at)).where(AIValidation.status == "PENDING")
+        )).scalar()
+    if oldest is None:
+        return {"ok": True, "oldest_pending_age_seconds": 0.0}
+    if oldest.tzinfo is None:
+        # SQLite stores CURRENT_TIMESTAMP as naive UTC
+        oldest = oldest.replace(tzinfo=timezone.utc)
+    age = (datetime.now(timezone.utc) - oldest).total_seconds()
+    limit = settings.readiness_max_pending_age_seconds
+    return {"ok": limit <= 0 or age <= limit, "oldest_pending_age_seconds": round(age, 1)}
+
+
+async def check_broker() -> Dict[str, Any]:
+    """Broker reachability; get_queue_depths raises when Redis is down."""
+    depths = await run_in_threadpool(get_queue_depths)
+    return {"ok": True, "total": sum(depths.values()), "queues": depths}
+
+
+async def check_workers() -> Dict[str, Any]:
+    # Broadcast ping; replies are collected until the timeout, so leave headroom within the check's own limit
+    replies = await run_in_threadpool(celery_app.control.ping, timeout=settings.readiness_check_timeout_seconds / 2)
+    workers = sorted(name for reply in replies or [] for name in reply)
+    return {"ok": len(workers) >= settings.readiness_min_workers, "count": len(workers), "workers": workers}
+
+
+async def _run_check(name: str, check: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+    try:
+        return await asyncio.wait_for(check, timeout=settings.readiness_check_timeout_seconds)
+    except asyncio.TimeoutError:
+        return {"ok": False, "error": f"timed out after {settings.readiness_check_timeout_seconds}s"}
+    except Exception as e:
+        logger.warning(f"Readiness check failed | check={name} | error={str(e)}")
+        return {"ok": False, "error": str(e)}
+
+
+async def evaluate_readiness() -> Dict[str, Any]:
+    """
+    Only this instance's own dependencies (database pool, broker connection) decide readiness.
+    Backlog, pending age and live workers are shared by every instance, so failing on them would
+    drop the whole fleet at once; they only mark the report as degraded.
+    """
+    database, broker, pending = await asyncio.gather(
+        _run_check("database", check_database()),
+        _run_check("broker", check_broker()),
+        _run_check("pending", check_pending_age())
+    )
+    checks = {"database": database, "broker": broker}
+    signals = {"pending": pending}
+    if broker["ok"]:
+        limit = settings.readiness_max_queue_depth
+        signals["queue_depth"] = {"ok": limit <= 0 or broker["total"] <= limit, "total": broker["total"]}
+        if settings.readiness_min_workers > 0:
+            signals["workers"] = await _run_check("workers", check_workers())
+    else:
+        # Pinging through a dead broker blocks a threadpool thread on reconnect attempts long after our timeout
+        signals["queue_depth"] = {"ok": False, "error": "broker unavailable"}
+        if settings.readiness_min_workers > 0:
+            signals["workers"] = {"ok": False, "error": "broker unavailable"}
+
+    failing = [name for name, result in checks.items() if not result["ok"]]
+    degraded = [name for name, result in signals.items() if not result["ok"]]
+    if failing:
+        logger.warning(f"Instance not ready | failing={failing} | degraded={degraded}")
+    elif degraded:
+        logger.warning(f"Instance degraded | degraded={degraded}")
+    return {
+        "status": "not_ready" if failing else "degraded" if degraded else "ready",
+        "checks": checks,
+        "signals": signals,
+        "timestamp": datetime.now().isoformat()
+    }
+
+
+async def get_readiness() -> Dict[str, Any]:
+    """
+    Cached readiness report: probes from every load balancer share one evaluation per
+    readiness_cache_seconds, and concurrent probes wait for the one in flight.
+    """
+    global _cached
+    if _cached is not None and time.monotonic() - _cached[0] < settings.readiness_cache_seconds:
+        return _cached[1]
+    async with _lock:
+        if _cached is not None and time.monotonic() - _cached[0] < settings.readiness_cache_seconds:
+            return _cached[1]
+        report = await evaluate_readiness()
+        _cached = (time.monotonic(), report)
+        return report
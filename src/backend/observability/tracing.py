@@ -0,0 +1,168 @@
+import functools
+import inspect
+import random
+import threading
+import uuid
+from typing import Any, Callable, Dict, Optional, TypeVar
+from langsmith import Client, RunTree, traceable  # type: ignore
+from langsmith.run_helpers import tracing_context  # type: ignore
+from pydantic import BaseModel
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_SAFE_INPUT_TYPES = (str, int, float, bool, type(None), dict, list, tuple, uuid.UUID, BaseModel)
+
+
+class TracingPolicy:
+    """Head-based sampling for LangSmith: decided once per root trace, inherited by every child run."""
+
+    def __init__(self, enabled: bool, sample_rate: float, route_rates: Dict[str, float], trace_errors: bool):
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.route_rates = route_rates
+        self.trace_errors = trace_errors
+
+    @classmethod
+    def from_settings(cls) -> "TracingPolicy":
+        route_rates = {}
+        for part in filter(None, (p.strip() for p in settings.langsmith_route_sample_rates.split(","))):
+            name, _, rate = part.partition("=")
+            route_rates[name.strip()] = float(rate)
+        return cls(
+            enabled=settings.langsmith_tracing_v2,
+            sample_rate=settings.langsmith_sample_rate,
+            route_rates=route_rates,
+            trace_errors=settings.langsmith_trace_on_error
+        )
+
+    def rate_for(self, name: str) -> float:
+        return self.route_rates.get(name, self.sample_rate)
+
+    def should_sample(self, name: str) -> bool:
+        rate = self.rate_for(name)
+        return rate >= 1.0 or (rate > 0 and random.random() < rate)
+
+
+_policy: Optional[TracingPolicy] = None
+_client: Optional[Client] = None
+_lock = threading.Lock()
+
+
+def get_tracing_policy() -> TracingPolicy:
+    global _policy
+    if _policy is None:
+        _policy = TracingPolicy.from_settings()
+    return _policy
+
+
+def get_tracing_client() -> Client:
+    """One client per process; it batches runs and sends them from its own background thread."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = Client(
+                    api_url=settings.langsmith_endpoint or None,
+                    api_key=settings.langsmith_api_key or None,
+                    auto_batch_tracing=True
+                )
+    return _client
+
+
+def flush_tracing() -> None:
+    """Sends buffered runs; call on shutdown, never on the request path."""
+    if _client is not None:
+        try:
+            _client.flush()
+        except Exception as e:
+            logger.warning(f"Failed to flush LangSmith traces | error={str(e)}")
+
+
+def _is_error(error: BaseException) -> bool:
+    # Client errors (HTTPException 4xx) are expected outcomes, not failures worth a trace
+    return getattr(error, "status_code", 500) >= 500
+
+
+def _safe_inputs(fn: Callable[..., Any], args: tuple, kwargs: dict) -> Dict[str, Any]:
+    try:
+        bound = inspect.signature(fn).bind_partial(*args, **kwargs)
+    except TypeError:
+        return {}
+    return {k: v for k, v in bound.arguments.items() if isinstance(v, _SAFE_INPUT_TYPES)}
+
+
+def _record_error_trace(name: str, inputs: Dict[str, Any], error: BaseException) -> None:
+    """A root-only trace for a failed call that sampling had skipped (its child runs were never recorded)."""
+    try:
+        run = RunTree(
+            name=name,
+            run_type="chain",
+            inputs=inputs,
+            ls_client=get_tracing_client(),
+            project_name=settings.langsmith_project or None,
+            extra={"metadata": {"sampled": False, "traced_on_error": True}}
+        )
+        run.end(error=f"{type(error).__name__}: {error}")
+        run.post()
+    except Exception as e:
+        logger.warning(f"Failed to record error trace | name={name} | error={str(e)}")
+
+
+def traced(name: str, **traceable_kwargs: Any) -> Callable[[F], F]:
+    """
+    Drop-in for @traceable that applies the tracing policy. Sampled calls are traced with
+    their child runs (LLM chains included); the rest run with tracing off, and if they fail
+    a root-only error trace is recorded. Sync and async functions are supported.
+    """
+
+    def decorator(fn: F) -> F:
+        traced_fn: Optional[Callable[..., Any]] = None
+
+        def sampled_fn() -> Callable[..., Any]:
+            nonlocal traced_fn
+            if traced_fn is None:
+                traced_fn = traceable(name=name, client=get_tracing_client(), **traceable_kwargs)(fn)
+            return traced_fn
+
+        def on_error(error: BaseException, args: tuple, kwargs: dict) -> None:
+            if get_tracing_policy().trace_errors and _is_error(error):
+                _record_error_trace(name, _safe_inputs(fn, args, kwargs), error)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                policy = get_tracing_policy()
+                if not policy.enabled:
+                    return await fn(*args, **kwargs)
+                if policy.should_sample(name):
+                    with tracing_context(enabled=True):
+                        return await sampled_fn()(*args, **kwargs)
+                with tracing_context(enabled=False):
+                    try:
+                        return await fn(*args, **kwargs)
+                    except Exception as e:
+                        on_error(e, args, kwargs)
+                        raise
+
+            return async_wrapper  # type: ignore
+
+        @functools.wraps(fn)
+        def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+            policy = get_tracing_policy()
+            if not policy.enabled:
+                return fn(*args, **kwargs)
+            if policy.should_sample(name):
+                with tracing_context(enabled=True):
+                    return sampled_fn()(*args, **kwargs)
+            with tracing_context(enabled=False):
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    on_error(e, args, kwargs)
+                    raise
+
+        return sync_wrapper  # type: ignore
+
+    return decorator
@@ -3,10 +3,29 @@ from src.backend.interfaces.IS_cable_validation import (
     IFieldExtractor, 
     IDatabaseValidator, 
     IEvidenceFormatter, 
-    IAuditor
+    IAuditor,
+    IRuleEngine
 )
-from src.backend.schemas.cable_validation_schema import LLMResponseSchema, CableDesignSchema
-from typing import Union, Dict, Any
+from src.backend.schemas.cable_validation_schema import LLMResponseSchema, CableDesignSchema, ValidationResponseSchema, Confidence
+from src.backend.observability.metrics import observe_stage
+from typing import Awaitable, Callable, Union, Dict, Any, List, Optional
+
+# The 7 parameters every audit must report on (see SYSTEM_PROMPT "MANDATORY STRUCTURE")
+AUDIT_FIELDS = (
+    "standard",
+    "voltage",
+    "conductor_material",
+    "conductor_class",
+    "csa",
+    "insulation_material",
+    "insulation_thickness",
+)
+
+# Checkpoint stages, in pipeline order; a checkpoint's "stage" is the last one completed
+STAGE_EXTRACTION = "extraction"
+STAGE_DB_VALIDATIONS = "db_validations"
+STAGE_EVIDENCE = "evidence"
+STAGE_AUDIT = "audit"
 
 class CableDesignValidator:
     
@@ -15,46 +34,129 @@ class CableDesignValidator:
         field_extractor: IFieldExtractor,
         database_validator: IDatabaseValidator,
         evidence_formatter: IEvidenceFormatter,
-        auditor: IAuditor
+        auditor: IAuditor,
+        rule_engine: Optional[IRuleEngine] = None
     ):
         self.field_extractor = field_extractor
         self.database_validator = database_validator
         self.evidence_formatter = evidence_formatter
         self.auditor = auditor
+        self.rule_engine = rule_engine
         logger.info("CableDesignValidator initialized with dependency injection")
     
     async def validate(self, 
         user_input: Union[str, Dict[str, Any]], 
-        input_mode: str) -> LLMResponseSchema:
-        logger.info("Starting cable design validation workflow")
-        logger.info(f"Starting cable design validation workflow | mode={input_mode}")
+        input_mode: str,
+        checkpoint: Optional[Dict[str, Any]] = None,
+        on_checkpoint: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None) -> LLMResponseSchema:
+        """
+        checkpoint: JSON-serialisable dict of stage results. Stages already present are
+        reused instead of recomputed, and each newly completed stage is written into it,
+        so a retry after a failed audit starts from the stored evidence.
+        on_checkpoint: awaited with the checkpoint after every completed stage, to persist it
+        before the next one starts (a killed worker never reaches its error handler).
+        """
+        logger.info("Starting cable design validation workflow | mode=%s", input_mode)
+        if checkpoint is None:
+            checkpoint = {}
+        elif checkpoint.get("stage"):
+            logger.info("Resuming validation from checkpoint | stage=%s", checkpoint["stage"])
 
         # Extract fields
-        if input_mode == "free_text":
-            logger.info("Using LLM extractor for free text input")
-            extracted_fields = await self.field_extractor.extract(user_input)  # Returns CableDesignSchema
-            logger.debug(f"Fields extracted via LLM: {extracted_fields}")
+        if STAGE_EXTRACTION in checkpoint:
+            extracted_fields = CableDesignSchema(**checkpoint[STAGE_EXTRACTION])
+
+        elif input_mode == "free_text":
+            with observe_stage(STAGE_EXTRACTION):
+                extracted_fields = await self.field_extractor.extract(user_input)  # Returns CableDesignSchema
+            logger.debug("Fields extracted via LLM: %s", extracted_fields)
+            await self._checkpoint(checkpoint, STAGE_EXTRACTION, extracted_fields.model_dump(), on_checkpoint)
             
         elif input_mode in {"json", "manual"}:
-            logger.info("Bypassing LLM extractor - converting structured input to CableDesignSchema")
             # Convert dict to CableDesignSchema using Pydantic validation
             if not isinstance(user_input, dict):
                 raise ValueError(f"Expected dict for {input_mode} mode, got {type(user_input).__name__}")
             extracted_fields = CableDesignSchema(**user_input)
-            logger.debug(f"Structured fields converted to schema: {extracted_fields}")
+            logger.debug("Structured fields converted to schema: %s", extracted_fields)
             
         else:
             raise ValueError(f"Invalid input_mode: {input_mode}")
         
-        # Validate against database
-        db_validations = self.database_validator.validate(extracted_fields)
-        logger.debug(f"Database validation completed with {len(db_validations)} results")
-        
-        # Format evidence
-        evidence_context = self.evidence_formatter.format(db_validations)
+        if STAGE_EVIDENCE in checkpoint:
+            evidence_context = checkpoint[STAGE_EVIDENCE]
+
+        else:
+            if STAGE_DB_VALIDATIONS in checkpoint:
+                db_validations = [ValidationResponseSchema(**v) for v in checkpoint[STAGE_DB_VALIDATIONS]]
+            else:
+                with observe_stage(STAGE_DB_VALIDATIONS):
+                    # Validate against database
+                    db_validations = self.database_validator.validate(extracted_fields)
+                    logger.debug("Database validation completed with %d results", len(db_validations))
+
+                    # Resolve IS 1554-1 table lookups deterministically
+                    if self.rule_engine is not None:
+                        db_validations = self._apply_rules(extracted_fields, db_validations)
+
+                if self.rule_engine is not None and self._is_fully_resolved(extracted_fields, db_validations):
+                    logger.info("All fields resolved deterministically - skipping LLM audit")
+                    return self._deterministic_result(extracted_fields, db_validations)
+                await self._checkpoint(checkpoint, STAGE_DB_VALIDATIONS, [v.model_dump() for v in db_validations], on_checkpoint)
+
+            # Format evidence
+            with observe_stage(STAGE_EVIDENCE):
+                evidence_context = self.evidence_formatter.format(db_validations)
+            await self._checkpoint(checkpoint, STAGE_EVIDENCE, evidence_context, on_checkpoint)
         
         # Audit with LLM
-        result = await self.auditor.audit(evidence_context, extracted_fields)
+        with observe_stage(STAGE_AUDIT):
+            result = await self.auditor.audit(evidence_context, extracted_fields)
+        checkpoint["stage"] = STAGE_AUDIT
         logger.info("Cable design validation completed successfully")
         
-        return result
\ No newline at end of file
+        return result
+
+    @staticmethod
+    async def _checkpoint(
+        checkpoint: Dict[str, Any],
+        stage: str,
+        value: Any,
+        on_checkpoint: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None
+    ) -> None:
+        checkpoint[stage] = value
+        checkpoint["stage"] = stage
+        if on_checkpoint is not None:
+            await on_checkpoint(checkpoint)
+
+    def _apply_rules(
+        self, extracted_fields: CableDesignSchema, db_validations: List[ValidationResponseSchema]
+    ) -> List[ValidationResponseSchema]:
+        """Replaces 'refer to LLM' placeholders with rule-engine verdicts for the fields it could decide."""
+        rule_results = {r.field: r for r in self.rule_engine.evaluate(extracted_fields)}
+        if not rule_results:
+            return db_validations
+
+        logger.debug("Rule engine resolved fields: %s", sorted(rule_results))
+        merged = [rule_results.pop(v.field, v) for v in db_validations]
+        merged.extend(rule_results.values())
+        return merged
+
+    def _is_fully_resolved(
+        self, extracted_fields: CableDesignSchema, validations: List[ValidationResponseSchema]
+    ) -> bool:
+        decided = {v.field for v in validations if v.validation_status in {"PASS", "FAIL"}}
+        pending = any(v.validation_status == "WARN" for v in validations)
+        all_present = all(getattr(extracted_fields, field) is not None for field in AUDIT_FIELDS)
+        return all_present and not pending and decided.issuperset(AUDIT_FIELDS)
+
+    def _deterministic_result(
+        self, extracted_fields: CableDesignSchema, validations: List[ValidationResponseSchema]
+    ) -> LLMResponseSchema:
+        by_field = {v.field: v for v in validations}
+        return LLMResponseSchema(
+            is_out_of_scope=False,
+            out_of_scope_explanation="",
+            fields=extracted_fields,
+            validation=[by_field[field] for field in AUDIT_FIELDS],
+            confidence=Confidence(overall=1.0)
+        )
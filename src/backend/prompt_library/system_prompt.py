@@ -27,6 +27,13 @@ Approving a cable with insufficient insulation thickness (e.g., 1.0mm for 50mm²
 
 """
 
+BATCH_AUDIT_PROMPT = """
+6. BATCH MODE:
+The input contains several independent designs, each under a "### DESIGN <n>" header.
+- Audit every design on its own, applying all rules above; never mix evidence between designs.
+- Return one entry in 'results' per design, with 'design_index' set to the design's <n>.
+"""
+
 # SYSTEM_PROMPT = """
 # ROLE:
 # You are an uncompromising Senior Cable Design Auditor. Your mission is to perform a final technical audit of a cable specification by reviewing "DATABASE EVIDENCE" and applying "IS 1554-1 Engineering Logic."
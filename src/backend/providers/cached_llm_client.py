@@ -0,0 +1,31 @@
+from typing import Any, Dict, Optional, Union
+from src.backend.cache.extraction_cache import ExtractionCache, extraction_cache_key, get_extraction_cache
+from src.backend.config.logger import logger
+from src.backend.interfaces.LLM_Client import ExtractLLMClient
+from src.backend.schemas.cable_validation_schema import CableDesignSchema
+
+
+class CachedExtractLLMClient(ExtractLLMClient):
+    """
+    Exact-match cache in front of any ExtractLLMClient.
+    Extraction runs at temperature 0 with a fixed prompt, so an identical
+    (normalized input, prompt, model) triple always yields the same fields.
+    """
+
+    def __init__(self, client: ExtractLLMClient, cache: Optional[ExtractionCache] = None):
+        self.client = client
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self.cache = cache or get_extraction_cache()
+        logger.info(f"CachedExtractLLMClient initialized | model={self.model_name}")
+
+    async def extract(self, user_input: Union[str, Dict[str, Any]]) -> CableDesignSchema:
+        key = extraction_cache_key(user_input, self.model_name)
+
+        cached = await self.cache.get(key)
+        if cached is not None:
+            logger.debug("Extraction cache hit | key=%.12s", key)
+            return cached
+
+        response = await self.client.extract(user_input)
+        await self.cache.set(key, response)
+        return response
@@ -1,24 +1,59 @@
+import asyncio
 from langchain_google_genai import ChatGoogleGenerativeAI
 from pydantic import SecretStr
 from src.backend.interfaces.LLM_Client import ValidateLLMClient
-from src.backend.schemas.cable_validation_schema import CableDesignSchema, LLMResponseSchema
+from src.backend.schemas.cable_validation_schema import CableDesignSchema, LLMResponseSchema, LLMBatchResponseSchema
 from src.backend.config.settings import settings
 from src.backend.config.logger import logger
 from src.backend.config.exception import LLMInvocationError
 from langchain_core.prompts import ChatPromptTemplate
-from src.backend.prompt_library.system_prompt import SYSTEM_PROMPT
+from src.backend.prompt_library.system_prompt import SYSTEM_PROMPT, BATCH_AUDIT_PROMPT
 from src.backend.config.constants import constant
+from src.backend.scheduler.llm_scheduler import get_llm_scheduler
+from src.backend.utils.token_estimator import estimate_tokens, record_prompt_tokens
+from src.backend.observability.metrics import LLM_PROMPT_TOKENS, observe_llm_call
+from typing import List, Tuple, Union
 
 class GeminiLLMClient(ValidateLLMClient):
+
+    model_name = "gemini-2.5-flash"
+
     def __init__(self):
         try:
             self.llm = ChatGoogleGenerativeAI(
-                model ="gemini-2.5-flash",
+                model =self.model_name,
                 temperature = 0,
                 max_completion_tokens = 700,
                 api_key = SecretStr(settings.google_api_key),
                 model_kwargs={"response_format": {"type": "json_object"}}
             )
+            # Prompt and schema-to-tool conversion are compiled once; validate() only invokes the chain
+            prompt = ChatPromptTemplate.from_messages([ #type: ignore
+                ("system", SYSTEM_PROMPT), 
+                ("human",(
+                    "### DATA TO REPORT IN 'fields':\n{extracted_fields}\n\n"
+                    "### DATABASE EVIDENCE FOR AUDIT:\n{evidence_context}"
+                ))
+            ])
+            self.chain = prompt | self.llm.with_structured_output(LLMResponseSchema) #type: ignore
+            self.output_tokens = 700  # max output per design
+            self.max_batch_size = settings.audit_batch_max_size
+
+            # A batched response carries one audit per design, so its output cap scales with the batch size
+            self.batch_llm = ChatGoogleGenerativeAI(
+                model =self.model_name,
+                temperature = 0,
+                max_completion_tokens = self.output_tokens * self.max_batch_size,
+                api_key = SecretStr(settings.google_api_key),
+                model_kwargs={"response_format": {"type": "json_object"}}
+            )
+
+            # Batched audits send the system prompt once for several designs
+            batch_prompt = ChatPromptTemplate.from_messages([ #type: ignore
+                ("system", SYSTEM_PROMPT + BATCH_AUDIT_PROMPT),
+                ("human", "{designs}")
+            ])
+            self.batch_chain = batch_prompt | self.batch_llm.with_structured_output(LLMBatchResponseSchema) #type: ignore
             logger.info(f"{constant.GEMINI} LLM client initialized")
 
         except Exception as e:
@@ -27,24 +62,60 @@ class GeminiLLMClient(ValidateLLMClient):
         
     async def validate(self, evidence_context: str, extracted_fields: CableDesignSchema) -> LLMResponseSchema:
 
-        logger.info(f"Starting cable design validation: {evidence_context[:50]}...")
+        logger.debug("Starting cable design validation: %.50s...", evidence_context)
 
         try:
-            structured_llm = self.llm.with_structured_output(LLMResponseSchema) #type: ignore
-
-            prompt = ChatPromptTemplate.from_messages([ #type: ignore
-                ("system", SYSTEM_PROMPT), 
-                ("human",(
-                    "### DATA TO REPORT IN 'fields':\n{extracted_fields}\n\n"
-                    "### DATABASE EVIDENCE FOR AUDIT:\n{evidence_context}"
-                ))
-            ])
-
-            chain = prompt | structured_llm   #type: ignore
-            response = await chain.ainvoke({"evidence_context": evidence_context, "extracted_fields": extracted_fields})  #type: ignore
+            prompt_tokens = record_prompt_tokens("audit", constant.GEMINI, SYSTEM_PROMPT, evidence_context, str(extracted_fields))
+            async with get_llm_scheduler().slot(constant.GEMINI, prompt_tokens + self.output_tokens):
+                with observe_llm_call(constant.GEMINI, "audit"):
+                    response = await self.chain.ainvoke({"evidence_context": evidence_context, "extracted_fields": extracted_fields})  #type: ignore
 
             return response  #type: ignore
 
         except Exception as e:
             logger.error(f"{constant.GEMINI} LLM invocation failed", exc_info=True)
-            raise LLMInvocationError(f"{constant.GEMINI} LLM failed during cable validation") from e
\ No newline at end of file
+            raise LLMInvocationError(f"{constant.GEMINI} LLM failed during cable validation") from e
+
+    async def validate_batch(self, items: List[Tuple[str, CableDesignSchema]]) -> List[Union[LLMResponseSchema, BaseException]]:
+
+        if len(items) == 1:
+            return await super().validate_batch(items)
+
+        if len(items) > self.max_batch_size:
+            # Larger batches would not fit the batch LLM's output cap
+            chunks = [items[i:i + self.max_batch_size] for i in range(0, len(items), self.max_batch_size)]
+            return [result for chunk in await asyncio.gather(*(self.validate_batch(c) for c in chunks)) for result in chunk]
+
+        logger.info("Starting batched cable design validation | designs=%d", len(items))
+
+        designs = "\n\n".join(
+            f"### DESIGN {index}\n"
+            f"### DATA TO REPORT IN 'fields':\n{fields}\n\n"
+            f"### DATABASE EVIDENCE FOR AUDIT:\n{evidence}"
+            for index, (evidence, fields) in enumerate(items)
+        )
+
+        try:
+            # Logged only: the batch runs outside the per-request contexts of the designs it carries
+            prompt_tokens = estimate_tokens(SYSTEM_PROMPT + BATCH_AUDIT_PROMPT + designs)
+            logger.info("Prompt size | stage=audit_batch | provider=%s | designs=%d | est_tokens=%d", constant.GEMINI, len(items), prompt_tokens)
+            LLM_PROMPT_TOKENS.labels(constant.GEMINI, "audit_batch").observe(prompt_tokens)
+            async with get_llm_scheduler().slot(constant.GEMINI, prompt_tokens + self.output_tokens * len(items)):
+                with observe_llm_call(constant.GEMINI, "audit_batch"):
+                    response = await self.batch_chain.ainvoke({"designs": designs})  #type: ignore
+            by_index = {r.design_index: LLMResponseSchema(**r.model_dump(exclude={"design_index"})) for r in response.results}  #type: ignore
+
+        except Exception:
+            # A failed or unparseable batch says nothing about any single design; audit each on its own
+            logger.warning(f"{constant.GEMINI} LLM batched invocation failed; validating {len(items)} designs one by one", exc_info=True)
+            return await super().validate_batch(items)
+
+        results: List[Union[LLMResponseSchema, BaseException]] = [by_index.get(i) for i in range(len(items))]  #type: ignore
+        missing = [i for i in range(len(items)) if i not in by_index]
+        if missing:
+            # The model skipped or mis-numbered some designs; audit those individually
+            logger.warning(f"Batched validation returned no result for designs {missing}; retrying them one by one")
+            for index, result in zip(missing, await super().validate_batch([items[i] for i in missing])):
+                results[index] = result
+
+        return results
@@ -8,18 +8,30 @@ from langchain_core.prompts import ChatPromptTemplate
 from src.backend.prompt_library.extraction_prompt import EXTRACTION_PROMPT
 from src.backend.config.exception import LLMInvocationError
 from src.backend.config.constants import constant
+from src.backend.scheduler.llm_scheduler import get_llm_scheduler
+from src.backend.utils.token_estimator import record_prompt_tokens
+from src.backend.observability.metrics import observe_llm_call
 
 class GroqLLMClient(ExtractLLMClient):
 
+    model_name = "llama-3.1-8b-instant"
+
     def __init__(self):
 
         try:
             self.llm = ChatGroq(
-                model="llama-3.1-8b-instant",
+                model=self.model_name,
                 temperature=0,
                 max_tokens=200,
                 api_key=SecretStr(settings.groq_api_key)
             )
+            # Prompt and schema-to-tool conversion are compiled once; extract() only invokes the chain
+            prompt = ChatPromptTemplate.from_messages([ #type: ignore
+                ("system", EXTRACTION_PROMPT), 
+                ("human", "{user_input}")
+            ])
+            self.chain = prompt | self.llm.with_structured_output(CableDesignSchema) #type: ignore
+            self.output_tokens = 200  # max_tokens
             logger.info(f"{constant.GROQ} LLM client initialized")
 
         except Exception as e:
@@ -29,18 +41,13 @@ class GroqLLMClient(ExtractLLMClient):
 
     async def extract(self, user_input: str) -> CableDesignSchema:
 
-        logger.info(f"Starting entity extraction: {user_input[:50]}...")
+        logger.debug("Starting entity extraction: %.50s...", user_input)
 
         try:
-            structured_llm = self.llm.with_structured_output(CableDesignSchema) #type: ignore
-
-            prompt = ChatPromptTemplate.from_messages([ #type: ignore
-                ("system", EXTRACTION_PROMPT), 
-                ("human", "{user_input}")
-            ])
-
-            chain = prompt | structured_llm #type: ignore
-            response = await chain.ainvoke({"user_input": user_input}) #type: ignore
+            prompt_tokens = record_prompt_tokens("extract", constant.GROQ, EXTRACTION_PROMPT, user_input)
+            async with get_llm_scheduler().slot(constant.GROQ, prompt_tokens + self.output_tokens):
+                with observe_llm_call(constant.GROQ, "extract"):
+                    response = await self.chain.ainvoke({"user_input": user_input}) #type: ignore
 
             return response #type: ignore
 
@@ -0,0 +1,64 @@
+import asyncio
+from typing import List, Optional, Set, Tuple
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.interfaces.LLM_Client import ValidateLLMClient
+from src.backend.schemas.cable_validation_schema import CableDesignSchema, LLMResponseSchema
+
+
+class MicroBatchingValidateLLMClient(ValidateLLMClient):
+    """
+    Collects concurrent validate() calls for up to max_wait_ms (or max_batch_size items)
+    and sends them as one validate_batch() request. Each caller still gets its own result.
+    Only helps when several validations run concurrently on the worker's event loop.
+    """
+
+    def __init__(self, client: ValidateLLMClient, max_batch_size: Optional[int] = None, max_wait_ms: Optional[float] = None):
+        self.client = client
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self.max_batch_size = max_batch_size or settings.audit_batch_max_size
+        self.max_wait = (settings.audit_batch_max_wait_ms if max_wait_ms is None else max_wait_ms) / 1000.0
+        self._pending: List[Tuple[str, CableDesignSchema, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._inflight: Set[asyncio.Task] = set()
+        logger.info(f"MicroBatchingValidateLLMClient initialized | max_batch_size={self.max_batch_size} | max_wait={self.max_wait}s")
+
+    async def validate(self, evidence_context: str, extracted_fields: CableDesignSchema) -> LLMResponseSchema:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((evidence_context, extracted_fields, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            # Keep a reference so the batch task is not garbage-collected mid-flight
+            task = asyncio.get_running_loop().create_task(self._run(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, batch: List[Tuple[str, CableDesignSchema, asyncio.Future]]) -> None:
+        logger.debug("Flushing audit micro-batch | size=%d", len(batch))
+        try:
+            results = await self.client.validate_batch([(evidence, fields) for evidence, fields, _ in batch])
+        except Exception as e:
+            # validate_batch reports per-item failures in place; raising means nothing was audited
+            results = [e] * len(batch)
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
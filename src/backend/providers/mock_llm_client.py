@@ -0,0 +1,112 @@
+import asyncio
+import random
+from typing import Any, Dict, List, Optional, Tuple, Union
+from src.backend.config.constants import constant
+from src.backend.config.exception import LLMInvocationError
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.extractor.rule_based_extractor import RuleBasedFieldExtractor
+from src.backend.interfaces.LLM_Client import ExtractLLMClient, ValidateLLMClient
+from src.backend.observability.metrics import observe_llm_call
+from src.backend.orchestrator.cable_validation_orchestrator import AUDIT_FIELDS
+from src.backend.schemas.cable_validation_schema import (
+    CableDesignSchema,
+    Confidence,
+    LLMResponseSchema,
+    ValidationResponseSchema
+)
+
+
+class MockLatency:
+    """Injected latency and failures for offline load tests; seeded for repeatable runs."""
+
+    def __init__(
+        self,
+        distribution: Optional[str] = None,
+        mean_ms: Optional[float] = None,
+        sigma: Optional[float] = None,
+        error_rate: Optional[float] = None,
+        seed: Optional[int] = None
+    ):
+        self.distribution = distribution or settings.mock_llm_latency_distribution
+        self.mean = (settings.mock_llm_latency_mean_ms if mean_ms is None else mean_ms) / 1000.0
+        self.sigma = settings.mock_llm_latency_sigma if sigma is None else sigma
+        self.error_rate = settings.mock_llm_error_rate if error_rate is None else error_rate
+        self._random = random.Random(settings.mock_llm_seed if seed is None else seed)
+
+    def sample(self) -> float:
+        if self.mean <= 0:
+            return 0.0
+        if self.distribution == "fixed":
+            return self.mean
+        if self.distribution == "uniform":
+            return self._random.uniform(0.0, 2 * self.mean)
+        if self.distribution == "exponential":
+            return self._random.expovariate(1.0 / self.mean)
+        if self.distribution == "lognormal":
+            # mu chosen so the distribution's mean equals the configured mean
+            return self._random.lognormvariate(0.0, self.sigma) * self.mean / (2.718281828459045 ** (self.sigma ** 2 / 2))
+        raise ValueError(f"Unknown mock latency distribution: {self.distribution}")
+
+    async def wait(self, operation: str) -> None:
+        await asyncio.sleep(self.sample())
+        if self._random.random() < self.error_rate:
+            raise LLMInvocationError(f"{constant.MOCK} LLM injected failure during {operation}")
+
+
+class MockExtractLLMClient(ExtractLLMClient):
+    """Deterministic stand-in for the extraction LLM: fields come from the rule-based parser."""
+
+    model_name = "mock-extract"
+
+    def __init__(self, latency: Optional[MockLatency] = None):
+        self.latency = latency or MockLatency()
+        self.parser = RuleBasedFieldExtractor()
+        logger.info(f"{constant.MOCK} extraction client initialized | distribution={self.latency.distribution} | mean={self.latency.mean}s")
+
+    async def extract(self, user_input: Union[str, Dict[str, Any]]) -> CableDesignSchema:
+        with observe_llm_call(constant.MOCK, "extract"):
+            await self.latency.wait("entity extraction")
+        if isinstance(user_input, dict):
+            return CableDesignSchema(**user_input)
+        return self.parser.parse(user_input).fields
+
+
+class MockValidateLLMClient(ValidateLLMClient):
+    """Deterministic stand-in for the audit LLM: present fields PASS, missing fields WARN."""
+
+    model_name = "mock-validate"
+
+    def __init__(self, latency: Optional[MockLatency] = None):
+        self.latency = latency or MockLatency()
+        logger.info(f"{constant.MOCK} validation client initialized | distribution={self.latency.distribution} | mean={self.latency.mean}s")
+
+    def _audit(self, extracted_fields: CableDesignSchema) -> LLMResponseSchema:
+        validation = []
+        for field in AUDIT_FIELDS:
+            value = getattr(extracted_fields, field)
+            validation.append(ValidationResponseSchema(
+                field=field,
+                validation_status="PASS" if value is not None else "WARN",
+                expected=str(value) if value is not None else None,
+                comment=f"{constant.MOCK} audit: {field} {'present' if value is not None else 'not specified'}."
+            ))
+        present = sum(v.validation_status == "PASS" for v in validation)
+        return LLMResponseSchema(
+            is_out_of_scope=False,
+            out_of_scope_explanation="",
+            fields=extracted_fields,
+            validation=validation,
+            confidence=Confidence(overall=round(present / len(AUDIT_FIELDS), 2))
+        )
+
+    async def validate(self, evidence_context: str, extracted_fields: CableDesignSchema) -> LLMResponseSchema:
+        with observe_llm_call(constant.MOCK, "audit"):
+            await self.latency.wait("cable validation")
+        return self._audit(extracted_fields)
+
+    async def validate_batch(self, items: List[Tuple[str, CableDesignSchema]]) -> List[LLMResponseSchema]:
+        # One round trip for the whole batch, like the real batched call
+        with observe_llm_call(constant.MOCK, "audit_batch"):
+            await self.latency.wait("batched cable validation")
+        return [self._audit(fields) for _, fields in items]
@@ -8,20 +8,30 @@ from langchain_core.prompts import ChatPromptTemplate
 from src.backend.prompt_library.extraction_prompt import EXTRACTION_PROMPT
 from src.backend.config.exception import LLMInvocationError
 from src.backend.config.constants import constant
+from src.backend.utils.token_estimator import record_prompt_tokens
+from src.backend.observability.metrics import observe_llm_call
 
 
 class OpenAILLMClient(ExtractLLMClient):
 
+    model_name = "gpt-4o-mini"
+
     def __init__(self):
 
         try:
             self.llm = ChatOpenAI(
-                model="gpt-4o-mini",
+                model=self.model_name,
                 temperature = 0,
                 max_completion_tokens = 200,
                 api_key=SecretStr(settings.openai_api_key),
                 model_kwargs={"response_format": {"type": "json_object"}}
             )
+            # Prompt and schema-to-tool conversion are compiled once; extract() only invokes the chain
+            prompt = ChatPromptTemplate.from_messages([ #type: ignore
+                ("system", EXTRACTION_PROMPT), 
+                ("human", "{user_input}")
+            ])
+            self.chain = prompt | self.llm.with_structured_output(CableDesignSchema) #type: ignore
             logger.info(f"{constant.GPT} LLM client initialized")
 
         except Exception as e:
@@ -31,18 +41,12 @@ class OpenAILLMClient(ExtractLLMClient):
 
     async def extract(self, user_input: str) -> CableDesignSchema:
 
-        logger.info(f"Starting entity extraction: {user_input[:50]}...")
+        logger.debug("Starting entity extraction: %.50s...", user_input)
 
         try:
-            structured_llm = self.llm.with_structured_output(CableDesignSchema) #type: ignore
-
-            prompt = ChatPromptTemplate.from_messages([ #type: ignore
-                ("system", EXTRACTION_PROMPT), 
-                ("human", "{user_input}")
-            ])
-
-            chain = prompt | structured_llm   #type: ignore
-            response = await chain.ainvoke({"user_input": user_input})  #type: ignore
+            record_prompt_tokens("extract", constant.GPT, EXTRACTION_PROMPT, user_input)
+            with observe_llm_call(constant.GPT, "extract"):
+                response = await self.chain.ainvoke({"user_input": user_input})  #type: ignore
 
             return response  #type: ignore
 
@@ -0,0 +1,131 @@
+import threading
+from typing import Callable, Dict, Optional, TypeVar
+from src.backend.config.constants import constant
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.interfaces.IS_cable_validation import IFieldExtractor, IEvidenceFormatter
+from src.backend.interfaces.LLM_Client import ExtractLLMClient, ValidateLLMClient
+from src.backend.orchestrator.cable_validation_orchestrator import CableDesignValidator
+from src.backend.validators.database_validators import ISRAGDatabaseValidator
+from src.backend.validators.insulation_rule_engine import IS1554RuleEngine
+from src.backend.formatters.evidence_formatters import EvidenceFormatter, CompactEvidenceFormatter
+from src.backend.extractor.llm_extractor import LLMFieldExtractor
+from src.backend.extractor.rule_based_extractor import RuleBasedFieldExtractor, HybridFieldExtractor
+from src.backend.auditors.llm_auditor import LLMAuditor
+from src.backend.providers.groq_llm_client import GroqLLMClient
+from src.backend.providers.openai_llm_client import OpenAILLMClient
+from src.backend.providers.anthropic_llm_client import AnthropicLLMClient
+from src.backend.providers.gemini_llm_client import GeminiLLMClient
+from src.backend.providers.mock_llm_client import MockExtractLLMClient, MockValidateLLMClient
+from src.backend.providers.cached_llm_client import CachedExtractLLMClient
+from src.backend.providers.routing_llm_client import RoutingExtractLLMClient
+from src.backend.providers.micro_batching_llm_client import MicroBatchingValidateLLMClient
+
+T = TypeVar("T")
+
+EXTRACT_PROVIDERS: Dict[str, Callable[[], ExtractLLMClient]] = {
+    constant.GROQ: GroqLLMClient,
+    constant.GPT: OpenAILLMClient,
+    constant.CLAUDE: AnthropicLLMClient,
+    constant.MOCK: MockExtractLLMClient,
+}
+
+VALIDATE_PROVIDERS: Dict[str, Callable[[], ValidateLLMClient]] = {
+    constant.GEMINI: GeminiLLMClient,
+    constant.MOCK: MockValidateLLMClient,
+}
+
+EVIDENCE_FORMATTERS: Dict[str, Callable[[], IEvidenceFormatter]] = {
+    "verbose": EvidenceFormatter,
+    "compact": CompactEvidenceFormatter,
+}
+
+# Process-wide singletons. Clients hold compiled chains and HTTP connection pools,
+# so they are built lazily once per API/worker process and then reused.
+_instances: Dict[str, object] = {}
+_lock = threading.RLock()  # re-entrant: the validator factory resolves clients through the registry
+
+
+def _get_or_create(key: str, factory: Callable[[], T]) -> T:
+    instance = _instances.get(key)
+    if instance is None:
+        with _lock:
+            instance = _instances.get(key)
+            if instance is None:
+                instance = factory()
+                _instances[key] = instance
+                logger.info(f"Provider registry created {key}")
+    return instance  # type: ignore
+
+
+def _build_routing_client() -> ExtractLLMClient:
+    clients: Dict[str, ExtractLLMClient] = {}
+    for provider in (p.strip() for p in settings.routing_providers.split(",") if p.strip()):
+        if provider not in EXTRACT_PROVIDERS:
+            raise ValueError(f"Unknown extraction provider: {provider}")
+        try:
+            clients[provider] = EXTRACT_PROVIDERS[provider]()
+        except RuntimeError as e:
+            # A provider without credentials is left out of the rotation rather than failing startup
+            logger.warning(f"Skipping extraction provider {provider} | error={str(e)}")
+    return RoutingExtractLLMClient(clients)
+
+
+def _build_extract_client(provider: str) -> ExtractLLMClient:
+    if settings.routing_enabled:
+        client = _build_routing_client()
+    elif provider in EXTRACT_PROVIDERS:
+        client = EXTRACT_PROVIDERS[provider]()
+    else:
+        raise ValueError(f"Unknown extraction provider: {provider}")
+
+    if settings.extraction_cache_enabled:
+        client = CachedExtractLLMClient(client)
+    return client
+
+
+def get_extract_client(provider: Optional[str] = None) -> ExtractLLMClient:
+    provider = provider or settings.extraction_provider
+    key = "extract:router" if settings.routing_enabled else f"extract:{provider}"
+    return _get_or_create(key, lambda: _build_extract_client(provider))
+
+
+def _build_validate_client(provider: str) -> ValidateLLMClient:
+    if provider not in VALIDATE_PROVIDERS:
+        raise ValueError(f"Unknown validation provider: {provider}")
+    client = VALIDATE_PROVIDERS[provider]()
+    if settings.audit_batching_enabled:
+        client = MicroBatchingValidateLLMClient(client)
+    return client
+
+
+def get_validate_client(provider: Optional[str] = None) -> ValidateLLMClient:
+    provider = provider or settings.validation_provider
+    return _get_or_create(f"validate:{provider}", lambda: _build_validate_client(provider))
+
+
+def _build_field_extractor() -> IFieldExtractor:
+    llm_extractor = LLMFieldExtractor(get_extract_client())
+    if settings.rule_extractor_enabled:
+        return HybridFieldExtractor(RuleBasedFieldExtractor(), llm_extractor)
+    return llm_extractor
+
+
+def _build_cable_validator() -> CableDesignValidator:
+    return CableDesignValidator(
+        field_extractor=_build_field_extractor(),
+        database_validator=ISRAGDatabaseValidator(),
+        evidence_formatter=EVIDENCE_FORMATTERS[settings.evidence_format](),
+        auditor=LLMAuditor(get_validate_client()),
+        rule_engine=IS1554RuleEngine()
+    )
+
+
+def get_cable_validator() -> CableDesignValidator:
+    return _get_or_create("cable_validator", _build_cable_validator)
+
+
+def reset_registry() -> None:
+    """Drops all cached instances (e.g. after changing provider settings)."""
+    with _lock:
+        _instances.clear()
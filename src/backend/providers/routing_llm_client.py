@@ -0,0 +1,162 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Union
+from src.backend.config.exception import LLMInvocationError
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.interfaces.LLM_Client import ExtractLLMClient
+from src.backend.schemas.cable_validation_schema import CableDesignSchema
+
+
+class ProviderHealth:
+    """Rolling latency/error window and circuit breaker for one provider."""
+
+    def __init__(self, name: str, window_size: int, failure_threshold: int, error_rate_threshold: float, cooldown_seconds: float):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.error_rate_threshold = error_rate_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+
+    def record_success(self, latency: float) -> None:
+        self._latencies.append(latency)
+        self._outcomes.append(True)
+        self._consecutive_failures = 0
+        self._open_until = 0.0
+
+    def record_failure(self) -> None:
+        self._outcomes.append(False)
+        self._consecutive_failures += 1
+        if self._consecutive_failures >= self.failure_threshold or (
+            len(self._outcomes) >= self.failure_threshold and self.error_rate >= self.error_rate_threshold
+        ):
+            self._open_until = time.monotonic() + self.cooldown_seconds
+            logger.warning(f"Circuit opened for {self.name} | error_rate={self.error_rate:.2f} | cooldown={self.cooldown_seconds}s")
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.percentile(0.5)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.percentile(0.95)
+
+    @property
+    def samples(self) -> int:
+        return len(self._latencies)
+
+    @property
+    def error_rate(self) -> float:
+        return self._outcomes.count(False) / len(self._outcomes) if self._outcomes else 0.0
+
+    @property
+    def available(self) -> bool:
+        # After the cool-down the breaker is half-open: the next call is the trial
+        return time.monotonic() >= self._open_until
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {"p50": self.p50, "p95": self.p95, "error_rate": self.error_rate, "samples": self.samples, "available": self.available}
+
+
+class RoutingExtractLLMClient(ExtractLLMClient):
+    """
+    Latency-aware router over several ExtractLLMClients.
+    The fastest healthy provider is tried first; if it has not answered by its latency
+    percentile deadline, a hedged request goes to the next provider and the first good
+    answer wins (the other call is cancelled). Failures fall through to the next provider.
+    """
+
+    def __init__(self, clients: Dict[str, ExtractLLMClient]):
+        if not clients:
+            raise ValueError("RoutingExtractLLMClient needs at least one provider")
+        self.clients = clients
+        self.model_name = "router:" + "+".join(getattr(c, "model_name", name) for name, c in clients.items())
+        self.health = {
+            name: ProviderHealth(
+                name,
+                window_size=settings.routing_latency_window,
+                failure_threshold=settings.routing_breaker_failure_threshold,
+                error_rate_threshold=settings.routing_breaker_error_rate,
+                cooldown_seconds=settings.routing_breaker_cooldown_seconds
+            )
+            for name in clients
+        }
+        logger.info(f"RoutingExtractLLMClient initialized | providers={list(clients)}")
+
+    def _ranked_providers(self) -> List[str]:
+        """Available providers by p50, unmeasured ones after them in configuration order."""
+        order = list(self.clients)
+        available = [n for n in order if self.health[n].available]
+        available.sort(key=lambda n: (self.health[n].p50 is None, self.health[n].p50 or 0.0))
+        if not available:
+            # Every breaker is open: configuration order is better than failing outright
+            return order
+        return available
+
+    def _hedge_deadline(self, name: str) -> float:
+        health = self.health[name]
+        if health.samples < settings.routing_min_samples:
+            return settings.routing_hedge_default_delay_seconds
+        return health.percentile(settings.routing_hedge_percentile) or settings.routing_hedge_default_delay_seconds
+
+    async def _call(self, name: str, user_input: Union[str, Dict[str, Any]]) -> CableDesignSchema:
+        started = time.perf_counter()
+        try:
+            response = await self.clients[name].extract(user_input)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.health[name].record_failure()
+            raise
+        self.health[name].record_success(time.perf_counter() - started)
+        return response
+
+    async def extract(self, user_input: Union[str, Dict[str, Any]]) -> CableDesignSchema:
+        candidates = self._ranked_providers()
+        pending: Dict[asyncio.Task, str] = {}
+        last_error: Optional[BaseException] = None
+
+        def launch(name: str) -> None:
+            pending[asyncio.ensure_future(self._call(name, user_input))] = name
+
+        try:
+            launch(candidates.pop(0))
+            while pending:
+                # Hedge only while exactly one request is in flight and a backup provider remains
+                timeout = self._hedge_deadline(next(iter(pending.values()))) if len(pending) == 1 and candidates else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                if not done:
+                    backup = candidates.pop(0)
+                    logger.info("Hedging extraction | slow=%s | backup=%s", list(pending.values()), backup)
+                    launch(backup)
+                    continue
+
+                for task in done:
+                    name = pending.pop(task)
+                    if task.exception() is None:
+                        logger.debug("Extraction served by %s | health=%s", name, self.health[name].snapshot())
+                        return task.result()
+                    last_error = task.exception()
+                    logger.warning(f"Extraction provider {name} failed | error={str(last_error)}")
+
+                if not pending and candidates:
+                    launch(candidates.pop(0))
+        finally:
+            for task in pending:
+                task.cancel()
+
+        raise LLMInvocationError("All extraction providers failed") from last_error
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {name: health.snapshot() for name, health in self.health.items()}
@@ -1,11 +1,19 @@
-from fastapi import APIRouter, status
+from fastapi import APIRouter, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
 from typing import Dict, Any
 from datetime import datetime
+import time
 from src.backend.config.constants import constant  # Adjust import path as needed
+from src.backend.config.logger import logger
+from src.backend.tasks.queues import get_queue_depths
+from src.backend.observability.metrics import render_metrics
+from src.backend.observability.readiness import get_readiness
 
 # System Router - no prefix, root level endpoints
 router = APIRouter(tags=["System"])
 
+STARTED_AT = time.monotonic()
+
 @router.get("/", status_code=status.HTTP_200_OK)
 async def root_health_check() -> Dict[str, Any]:
     """
@@ -31,5 +39,41 @@ async def detailed_health_check() -> Dict[str, Any]:
         "service": constant.APP_TITLE,
         "version": constant.APP_VERSION,
         "timestamp": datetime.now().isoformat(),
-        "uptime": "operational"
+        "uptime": "operational",
+        "uptime_seconds": round(time.monotonic() - STARTED_AT, 1)
+    }
+
+@router.get("/ready", status_code=status.HTTP_200_OK)
+async def readiness_check(response: Response) -> Dict[str, Any]:
+    """
+    Readiness probe
+    503 when this instance's database pool or broker connection is unusable; queue depth,
+    age of the oldest PENDING validation and live workers only mark the report degraded
+    """
+    report = await get_readiness()
+    if report["status"] == "not_ready":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    return report
+
+@router.get("/queues", status_code=status.HTTP_200_OK)
+async def queue_depths() -> Dict[str, Any]:
+    """
+    Validation queue depths
+    Messages waiting per queue, to spot free_text bursts backing up structured work
+    """
+    try:
+        depths = await run_in_threadpool(get_queue_depths)
+    except Exception as e:
+        logger.error(f"Failed to read queue depths | error={str(e)}")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Broker unavailable.")
+    return {
+        "queues": depths,
+        "total": sum(depths.values()),
+        "timestamp": datetime.now().isoformat()
     }
+
+@router.get("/metrics", include_in_schema=False)
+async def prometheus_metrics() -> Response:
+    """Prometheus scrape endpoint: stage and LLM latency histograms, tokens, cache hits and errors"""
+    content, content_type = render_metrics()
+    return Response(content=content, media_type=content_type)
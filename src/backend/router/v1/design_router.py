@@ -1,64 +1,119 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from celery import group
+import asyncio
+import time
 import uuid
 import json
-from src.backend.config.logger import logger
-from src.backend.db.models.ai_validation_model import AIValidation
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple, Union
+from src.backend.config.logger import logger, set_request_id
 from src.backend.orchestrator.cable_validation_orchestrator import CableDesignValidator
-from src.backend.validators.database_validators import ISRAGDatabaseValidator
-from src.backend.formatters.evidence_formatters import EvidenceFormatter
-from src.backend.extractor.llm_extractor import LLMFieldExtractor
-from src.backend.providers.groq_llm_client import GroqLLMClient
-from src.backend.providers.gemini_llm_client import GeminiLLMClient
-from src.backend.auditors.llm_auditor import LLMAuditor
+from src.backend.providers import registry
 from src.backend.schemas.cable_validation_schema import (
     DesignValidationPostRequest, 
     DesignValidationGetResponse,
-    DesignValidationPostResponse
+    DesignValidationPostResponse,
+    DesignValidationBatchPostRequest,
+    DesignValidationBatchPostResponse,
+    DesignValidationBatchGetResponse
 )
-from src.backend.db.database import get_db
-from src.backend.db.crud import save_ai_validation  #type: ignore
-from langsmith import traceable #type: ignore
+from src.backend.db.database import get_async_db, AsyncSessionLocal
+from src.backend.db.async_crud import (  #type: ignore
+    save_ai_validation,
+    get_ai_validation,
+    find_reusable_validation,
+    find_inflight_validation,
+    mark_validation_failed,
+    bulk_save_ai_validations,
+    mark_batch_failed,
+    get_batch_status_counts
+)
+from src.backend.config.settings import settings
+from src.backend.notifications.result_notifier import result_listener, TERMINAL_STATUSES
+from src.backend.utils.hashing import compute_payload_hash
+from src.backend.observability.tracing import traced
 from src.backend.tasks.validation_task import validate_cable_design_task #type: ignore
+from src.backend.tasks.queues import select_queue
 
 
 router = APIRouter()
 
-def get_cable_validator(db: Session = Depends(get_db)) -> CableDesignValidator:
-    extraction_client = GroqLLMClient()
-    audit_client = GeminiLLMClient()
-    
-    return CableDesignValidator(
-        field_extractor=LLMFieldExtractor(extraction_client),
-        database_validator=ISRAGDatabaseValidator(db),
-        evidence_formatter=EvidenceFormatter(),
-        auditor=LLMAuditor(audit_client)
-    )
+def get_cable_validator() -> CableDesignValidator:
+    return registry.get_cable_validator()
 
-@traceable(name="cable_design_validation_result_Api_hit")
-@router.get("/design-validations/{request_id}", response_model=DesignValidationGetResponse, status_code=status.HTTP_200_OK)
-async def get_validation_result(request_id: uuid.UUID, db: Session = Depends(get_db)):
-    logger.info(f"Fetching validation result for request_id={request_id}")
-    try:
-        validation_record = db.query(AIValidation).filter(AIValidation.request_id == request_id).first()
-        
-        if not validation_record:
+def resolve_user_input(payload: DesignValidationPostRequest) -> Tuple[str, Union[str, Dict[str, Any]]]:
+    """Returns (raw_text, user_input) for the payload's input mode."""
+    if payload.input_mode == "free_text":
+        description = payload.data.get("description", "")
+        if not description:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"No validation record found for request_id: {request_id}"
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Description is required for free_text input mode."
             )
-        logger.info(f"Validation record found for request_id={request_id} | job_status={validation_record.status}")
+        return description, description
 
-        return DesignValidationGetResponse(
-            request_id=validation_record.request_id,
-            job_status=validation_record.status,
-            result=validation_record.ai_response,
-            error=validation_record.error_message,
-            meta={
-                "model_name": validation_record.model_name,
-                "pipeline_type": validation_record.pipeline_type
-            }
+    if payload.input_mode in {"json", "manual"}:
+        return json.dumps(payload.data, indent=2), payload.data
+
+    raise HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=f"Invalid input mode: {payload.input_mode}. Supported modes are 'free_text', 'json', and 'manual'."
+    )
+
+async def load_validation_response(db: AsyncSession, request_id: uuid.UUID) -> DesignValidationGetResponse:
+    validation_record = await get_ai_validation(db, request_id)
+
+    if not validation_record:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No validation record found for request_id: {request_id}"
         )
+    logger.info("Validation record found for request_id=%s | job_status=%s", request_id, validation_record.status)
+
+    return DesignValidationGetResponse(
+        request_id=validation_record.request_id,
+        job_status=validation_record.status,
+        result=validation_record.ai_response,
+        error=validation_record.error_message,
+        meta={
+            "model_name": validation_record.model_name,
+            "pipeline_type": validation_record.pipeline_type,
+            "prompt_tokens": validation_record.prompt_tokens,
+            "stage": validation_record.stage
+        }
+    )
+
+def deduplicated_response(existing) -> DesignValidationPostResponse:
+    logger.info("Duplicate submission reused | request_id=%s | job_status=%s", existing.request_id, existing.status)
+    return DesignValidationPostResponse(
+        request_id=existing.request_id,
+        job_status=existing.status,
+        meta={
+            "model_name": existing.model_name,
+            "pipeline_type": existing.pipeline_type,
+            "deduplicated": True,
+            "message": "Identical design already submitted; returning the existing validation job."
+        }
+    )
+
+def resolve_wait_timeout(timeout: Optional[float]) -> float:
+    if timeout is None:
+        return settings.result_wait_default_seconds
+    return min(timeout, settings.result_wait_max_seconds)
+
+def format_sse_event(event: str, response: DesignValidationGetResponse) -> str:
+    return f"event: {event}\ndata: {response.model_dump_json()}\n\n"
+
+@router.get("/design-validations/{request_id}", response_model=DesignValidationGetResponse, status_code=status.HTTP_200_OK)
+@traced(name="cable_design_validation_result_Api_hit")
+async def get_validation_result(request_id: uuid.UUID, db: AsyncSession = Depends(get_async_db)):
+    logger.info("Fetching validation result for request_id=%s", request_id)
+    try:
+        return await load_validation_response(db, request_id)
     
     except HTTPException:
         raise
@@ -69,59 +124,158 @@ async def get_validation_result(request_id: uuid.UUID, db: Session = Depends(get
             detail="Error retrieving validation record. Please try again later."
         )
 
-@traceable(name="cable_design_validation_Api_hit")
+@router.get("/design-validations/{request_id}/wait", response_model=DesignValidationGetResponse, status_code=status.HTTP_200_OK)
+@traced(name="cable_design_validation_result_wait_Api_hit")
+async def wait_for_validation_result(
+    request_id: uuid.UUID,
+    timeout: Optional[float] = Query(None, gt=0, description="Seconds to wait for a terminal status."),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Long-poll variant of get_validation_result.
+    Blocks until the worker publishes completion or the timeout elapses, then returns the current record.
+    """
+    logger.info("Waiting for validation result for request_id=%s", request_id)
+    wait_seconds = resolve_wait_timeout(timeout)
+
+    # Register before the first read so a completion published in between is not missed
+    future = result_listener.register(str(request_id))
+    try:
+        response = await load_validation_response(db, request_id)
+        if response.job_status in TERMINAL_STATUSES:
+            return response
+
+        # Release the pooled connection while the client is parked
+        await db.close()
+
+        if await result_listener.wait(future, wait_seconds) is None:
+            return response
+        return await load_validation_response(db, request_id)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error waiting for validation record for request_id={request_id} | error={str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error retrieving validation record. Please try again later."
+        )
+    finally:
+        result_listener.unregister(str(request_id), future)
+
+@router.get("/design-validations/{request_id}/events", status_code=status.HTTP_200_OK)
+async def stream_validation_result(
+    request_id: uuid.UUID,
+    timeout: Optional[float] = Query(None, gt=0, description="Seconds to keep the stream open."),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Server-Sent Events variant of get_validation_result.
+    Emits a 'status' event immediately, then a single 'result' event on completion or a 'timeout' event.
+    """
+    logger.info("Streaming validation result for request_id=%s", request_id)
+    wait_seconds = resolve_wait_timeout(timeout)
+
+    future = result_listener.register(str(request_id))
+    try:
+        response = await load_validation_response(db, request_id)
+    except Exception:
+        result_listener.unregister(str(request_id), future)
+        raise
+    finally:
+        await db.close()
+
+    async def event_stream():
+        try:
+            yield format_sse_event("status", response)
+            if response.job_status in TERMINAL_STATUSES:
+                return
+
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + wait_seconds
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    yield format_sse_event("timeout", response)
+                    return
+
+                published = await result_listener.wait(future, min(remaining, settings.sse_keepalive_seconds))
+                if published is None:
+                    yield ": keep-alive\n\n"
+                    continue
+
+                async with AsyncSessionLocal() as stream_db:
+                    final_response = await load_validation_response(stream_db, request_id)
+                yield format_sse_event("result", final_response)
+                return
+        finally:
+            result_listener.unregister(str(request_id), future)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.post("/design-validations", response_model=DesignValidationPostResponse, status_code=status.HTTP_202_ACCEPTED)
+@traced(name="cable_design_validation_Api_hit")
 async def validate_design(
     payload: DesignValidationPostRequest,
-    db: Session = Depends(get_db)
+    bypass_dedup: bool = Header(False, alias="X-Bypass-Dedup", description="Always run a fresh validation."),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    logger.info(f"Validation request received: {payload.data}...")
     request_id = uuid.uuid4()
-    logger.info(f"Assigned Request ID: {request_id}")
+    set_request_id(str(request_id))
+    # The payload itself is only logged at DEBUG: free text can be large and json designs are echoed back anyway
+    logger.info("Validation request received | request_id=%s | input_mode=%s", request_id, payload.input_mode)
+    logger.debug("Validation payload | request_id=%s | data=%s", request_id, payload.data)
     
     raw_text = ""
     try:
-        if payload.input_mode == "free_text":
-            description = payload.data.get("description", "")
-            if not description:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Description is required for free_text input mode."
-                )
-            raw_text = description
-            user_input = description
-            
-        elif payload.input_mode in {"json", "manual"}:
-            raw_text = json.dumps(payload.data, indent=2)
-            user_input = payload.data
-            
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid input mode: {payload.input_mode}. Supported modes are 'free_text', 'json', and 'manual'."
-            )
+        raw_text, user_input = resolve_user_input(payload)
+        # Fresh runs are stored without a hash so they neither claim nor collide with the payload's in-flight slot
+        dedup = settings.dedup_enabled and not bypass_dedup
+        payload_hash = compute_payload_hash(payload.input_mode, payload.data) if dedup else None
+
+        # Reuse a recent result or attach to an in-flight job for the same payload
+        if payload_hash is not None:
+            since = datetime.now(timezone.utc) - timedelta(seconds=settings.dedup_ttl_seconds)
+            existing = await find_reusable_validation(db, payload_hash, since)
+            if existing is not None:
+                return deduplicated_response(existing)
 
         # Save initial record with PENDING status
-        save_ai_validation(
-            db=db,
-            request_id=request_id,
-            raw_text=raw_text,
-            ai_result=None,  # No result yet - will be updated by Celery task
-            meta={
-                "model_name": "Gemini 2.5 flash",
-                "pipeline_type": "structured_rag",
-                "status": "PENDING"
-            }
-        )
+        try:
+            await save_ai_validation(
+                db=db,
+                request_id=request_id,
+                raw_text=raw_text,
+                ai_result=None,  # No result yet - will be updated by Celery task
+                meta={
+                    "model_name": "Gemini 2.5 flash",
+                    "pipeline_type": "structured_rag",
+                    "status": "PENDING"
+                },
+                payload_hash=payload_hash
+            )
+        except IntegrityError:
+            # A concurrent identical submission committed its PENDING record between our lookup and insert
+            await db.rollback()
+            existing = await find_inflight_validation(db, payload_hash) if payload_hash is not None else None
+            if existing is None:
+                raise
+            return deduplicated_response(existing)
 
-        # Submit task to Celery worker (background processing)
-        validate_cable_design_task.delay(
+        # Submit task to Celery worker (background processing); the broker client is blocking
+        await run_in_threadpool(
+            validate_cable_design_task.delay,
             request_id=str(request_id),
             user_input=user_input,
-            input_mode=payload.input_mode
+            input_mode=payload.input_mode,
+            enqueued_at=time.time()
         )
 
-        logger.info(f"Validation job submitted to background worker | request_id={request_id}")
+        logger.info("Validation job submitted to background worker | request_id=%s", request_id)
 
         return DesignValidationPostResponse(
             request_id=request_id,
@@ -136,22 +290,142 @@ async def validate_design(
     except Exception as e:
         logger.error(f"Failed to submit validation job | request_id={request_id} | error={str(e)}", exc_info=True)
         
-        # Save failed record
-        save_ai_validation(
-            db=db,
-            request_id=request_id,
-            raw_text=raw_text,
-            ai_result=None,
-            meta={
-                "model_name": "Gemini 2.5 flash",
-                "pipeline_type": "structured_rag",
-                "status": "FAILED"
-            },
-            error_message=str(e)
-        )
+        # The PENDING record is already committed when enqueueing fails; only earlier failures need a new record
+        await db.rollback()
+        if not await mark_validation_failed(db, request_id, str(e)):
+            await save_ai_validation(
+                db=db,
+                request_id=request_id,
+                raw_text=raw_text,
+                ai_result=None,
+                meta={
+                    "model_name": "Gemini 2.5 flash",
+                    "pipeline_type": "structured_rag",
+                    "status": "FAILED"
+                },
+                error_message=str(e)
+            )
         
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to submit validation job. Please try again."
         )
-    
+
+
+@router.post("/design-validations/batch", response_model=DesignValidationBatchPostResponse, status_code=status.HTTP_202_ACCEPTED)
+@traced(name="cable_design_batch_validation_Api_hit")
+async def validate_design_batch(
+    payload: DesignValidationBatchPostRequest,
+    db: AsyncSession = Depends(get_async_db)
+):
+    if len(payload.items) > settings.max_batch_size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Batch contains {len(payload.items)} designs. Maximum allowed is {settings.max_batch_size}."
+        )
+
+    batch_id = uuid.uuid4()
+    logger.info("Batch validation request received | batch_id=%s | size=%d", batch_id, len(payload.items))
+
+    # Resolve every item up front so a bad item rejects the whole batch before anything is persisted
+    enqueued_at = time.time()
+    rows = []
+    signatures = []
+    for index, item in enumerate(payload.items):
+        try:
+            raw_text, user_input = resolve_user_input(item)
+        except HTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail=f"Item {index}: {e.detail}")
+
+        request_id = uuid.uuid4()
+        rows.append({
+            "request_id": request_id,
+            "batch_id": batch_id,
+            "raw_input_text": raw_text,
+            "payload_hash": compute_payload_hash(item.input_mode, item.data),
+            "ai_response": None,
+            "model_name": "Gemini 2.5 flash",
+            "pipeline_type": "structured_rag",
+            "status": "PENDING"
+        })
+        signatures.append(validate_cable_design_task.s(
+            request_id=str(request_id),
+            user_input=user_input,
+            input_mode=item.input_mode,
+            enqueued_at=enqueued_at
+        ).set(queue=select_queue(item.input_mode, batch=True)))
+
+    try:
+        # Single bulk INSERT for all PENDING records
+        await bulk_save_ai_validations(db, rows)
+    except Exception as e:
+        logger.error(f"Failed to persist batch | batch_id={batch_id} | error={str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to submit validation batch. Please try again."
+        )
+
+    try:
+        # One message per design, each routed to its mode's batch queue; the group publishes them over one producer connection
+        await run_in_threadpool(group(signatures).apply_async)
+    except Exception as e:
+        logger.error(f"Failed to dispatch batch | batch_id={batch_id} | error={str(e)}", exc_info=True)
+        await mark_batch_failed(db, batch_id, str(e))
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to submit validation batch. Please try again."
+        )
+
+    logger.info("Batch submitted to background worker | batch_id=%s | size=%d", batch_id, len(rows))
+
+    return DesignValidationBatchPostResponse(
+        batch_id=batch_id,
+        request_ids=[row["request_id"] for row in rows],
+        job_status="PENDING",
+        meta={
+            "model_name": "Gemini 2.5 flash",
+            "pipeline_type": "structured_rag",
+            "message": f"Validation batch of {len(rows)} designs submitted."
+        }
+    )
+
+
+@router.get("/design-validations/batch/{batch_id}", response_model=DesignValidationBatchGetResponse, status_code=status.HTTP_200_OK)
+@traced(name="cable_design_batch_validation_result_Api_hit")
+async def get_batch_validation_result(batch_id: uuid.UUID, db: AsyncSession = Depends(get_async_db)):
+    logger.info("Fetching batch status for batch_id=%s", batch_id)
+    try:
+        status_counts = await get_batch_status_counts(db, batch_id)
+    except Exception as e:
+        logger.error(f"Error fetching batch status for batch_id={batch_id} | error={str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Error retrieving batch status. Please try again later."
+        )
+
+    total = sum(status_counts.values())
+    if total == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No validation records found for batch_id: {batch_id}"
+        )
+
+    if status_counts.get("PENDING", 0) + status_counts.get("RETRYING", 0) > 0:
+        job_status = "PENDING"
+    elif status_counts.get("SUCCESS", 0) == total:
+        job_status = "SUCCESS"
+    elif status_counts.get("FAILED", 0) == total:
+        job_status = "FAILED"
+    else:
+        job_status = "PARTIAL"
+
+    return DesignValidationBatchGetResponse(
+        batch_id=batch_id,
+        job_status=job_status,
+        total=total,
+        status_counts=status_counts,
+        meta={
+            "model_name": "Gemini 2.5 flash",
+            "pipeline_type": "structured_rag"
+        }
+    )
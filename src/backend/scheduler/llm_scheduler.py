@@ -0,0 +1,228 @@
+import asyncio
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+import redis
+from src.backend.config.constants import constant
+from src.backend.config.exception import LLMSchedulerTimeoutError
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+
+KEY_PREFIX = "llm_scheduler:"
+
+# All-or-nothing withdrawal from several token buckets. KEYS: bucket hashes; ARGV: (capacity, refill/s, cost) per key.
+# Returns "0" when granted, else the seconds until the scarcest bucket can cover its cost.
+_TOKEN_BUCKET_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local levels = {}
+local wait = 0
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 3 - 2])
+    local rate = tonumber(ARGV[i * 3 - 1])
+    local cost = math.min(tonumber(ARGV[i * 3]), capacity)
+    local state = redis.call('HMGET', key, 'tokens', 'ts')
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+    levels[i] = tokens
+    if tokens < cost then
+        wait = math.max(wait, (cost - tokens) / rate)
+    end
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[i * 3 - 2])
+    local rate = tonumber(ARGV[i * 3 - 1])
+    local tokens = levels[i]
+    if wait == 0 then
+        tokens = tokens - math.min(tonumber(ARGV[i * 3]), capacity)
+    end
+    redis.call('HSET', key, 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+end
+return tostring(wait)
+"""
+
+# Counting semaphore as a sorted set of lease ids scored by expiry, so a crashed holder's slot frees itself.
+_LEASE_LUA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[1]) then
+    redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[2])
+    redis.call('EXPIRE', KEYS[1], math.ceil(tonumber(ARGV[3])) + 1)
+    return 1
+end
+return 0
+"""
+
+
+@dataclass(frozen=True)
+class ProviderLimits:
+    max_in_flight: int
+    requests_per_minute: float
+    tokens_per_minute: float
+
+    def buckets(self, tokens: int) -> List[Tuple[str, float, float, float]]:
+        """(suffix, capacity, refill per second, cost) for each configured budget; 0 disables a budget."""
+        buckets = []
+        if self.requests_per_minute > 0:
+            buckets.append(("rpm", self.requests_per_minute, self.requests_per_minute / 60.0, 1))
+        if self.tokens_per_minute > 0:
+            buckets.append(("tpm", self.tokens_per_minute, self.tokens_per_minute / 60.0, tokens))
+        return buckets
+
+
+class RedisSchedulerBackend:
+    """Budgets shared by every worker through the broker's Redis."""
+
+    def __init__(self, redis_url: str):
+        self._redis = redis.Redis.from_url(redis_url)
+        self._bucket = self._redis.register_script(_TOKEN_BUCKET_LUA)
+        self._lease = self._redis.register_script(_LEASE_LUA)
+
+    def try_lease(self, provider: str, limit: int, lease_id: str, ttl: float) -> bool:
+        return bool(self._lease(keys=[f"{KEY_PREFIX}{provider}:leases"], args=[limit, lease_id, ttl]))
+
+    def release(self, provider: str, lease_id: str) -> None:
+        self._redis.zrem(f"{KEY_PREFIX}{provider}:leases", lease_id)
+
+    def reserve(self, provider: str, buckets: List[Tuple[str, float, float, float]]) -> float:
+        keys = [f"{KEY_PREFIX}{provider}:{suffix}" for suffix, _, _, _ in buckets]
+        args = [value for _, capacity, rate, cost in buckets for value in (capacity, rate, cost)]
+        return float(self._bucket(keys=keys, args=args))
+
+
+class LocalSchedulerBackend:
+    """Same semantics within one process; used when Redis is disabled or unreachable."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._leases: Dict[str, Dict[str, float]] = {}
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def try_lease(self, provider: str, limit: int, lease_id: str, ttl: float) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            leases = self._leases.setdefault(provider, {})
+            for expired in [k for k, expiry in leases.items() if expiry <= now]:
+                del leases[expired]
+            if len(leases) >= limit:
+                return False
+            leases[lease_id] = now + ttl
+            return True
+
+    def release(self, provider: str, lease_id: str) -> None:
+        with self._lock:
+            self._leases.get(provider, {}).pop(lease_id, None)
+
+    def reserve(self, provider: str, buckets: List[Tuple[str, float, float, float]]) -> float:
+        now = time.monotonic()
+        with self._lock:
+            levels = []
+            wait = 0.0
+            for suffix, capacity, rate, cost in buckets:
+                tokens, ts = self._buckets.get(f"{provider}:{suffix}", (capacity, now))
+                tokens = min(capacity, tokens + (now - ts) * rate)
+                levels.append(tokens)
+                if tokens < min(cost, capacity):
+                    wait = max(wait, (min(cost, capacity) - tokens) / rate)
+            for (suffix, capacity, rate, cost), tokens in zip(buckets, levels):
+                self._buckets[f"{provider}:{suffix}"] = (tokens - min(cost, capacity) if wait == 0 else tokens, now)
+            return wait
+
+
+class LLMScheduler:
+    """
+    Per-provider admission control for LLM calls: max in-flight requests plus
+    requests/tokens-per-minute budgets. Callers wait for capacity instead of
+    collecting 429s and burning task retries.
+    """
+
+    def __init__(self, limits: Dict[str, ProviderLimits], redis_url: Optional[str] = None):
+        self.limits = limits
+        self._local = LocalSchedulerBackend()
+        self._redis = RedisSchedulerBackend(redis_url) if redis_url else None
+        self._redis_retry_at = 0.0
+
+    def _backend(self):
+        if self._redis is not None and time.monotonic() >= self._redis_retry_at:
+            return self._redis
+        return self._local
+
+    async def _call(self, method: str, *args):
+        backend = self._backend()
+        if backend is self._local:
+            return getattr(backend, method)(*args)
+        try:
+            return await asyncio.to_thread(getattr(backend, method), *args)
+        except Exception as e:
+            if time.monotonic() >= self._redis_retry_at:
+                logger.warning(f"LLM scheduler falling back to in-process limits | error={str(e)}")
+            self._redis_retry_at = time.monotonic() + settings.llm_scheduler_redis_retry_seconds
+            return getattr(self._local, method)(*args)
+
+    @asynccontextmanager
+    async def slot(self, provider: str, tokens: int = 0) -> AsyncIterator[None]:
+        """Holds one in-flight slot for the provider and charges its request/token budgets."""
+        limits = self.limits.get(provider)
+        if limits is None or not settings.llm_scheduler_enabled:
+            yield
+            return
+
+        deadline = time.monotonic() + settings.llm_scheduler_acquire_timeout_seconds
+        lease_id = uuid.uuid4().hex
+        leased = False
+        try:
+            # 1. Rate budgets first: waiting here must not hold an in-flight slot (or outlive its lease TTL)
+            buckets = limits.buckets(tokens)
+            if buckets:
+                while (wait := await self._call("reserve", provider, buckets)) > 0:
+                    self._check_deadline(deadline, provider, "rate budget", wait)
+                    logger.debug("LLM scheduler throttling %s | wait=%.2fs | tokens=%d", provider, wait, tokens)
+                    await asyncio.sleep(wait)
+
+            # 2. Concurrency slot, leased only once the call can start
+            if limits.max_in_flight > 0:
+                delay = 0.05
+                while not await self._call("try_lease", provider, limits.max_in_flight, lease_id, settings.llm_scheduler_lease_seconds):
+                    self._check_deadline(deadline, provider, "in-flight slot")
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, 1.0)
+                leased = True
+
+            yield
+        finally:
+            if leased:
+                await self._call("release", provider, lease_id)
+
+    @staticmethod
+    def _check_deadline(deadline: float, provider: str, resource: str, wait: float = 0.0) -> None:
+        if time.monotonic() + wait > deadline:
+            raise LLMSchedulerTimeoutError(f"Timed out waiting for {provider} {resource}")
+
+
+_scheduler: Optional[LLMScheduler] = None
+_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _scheduler
+    if _scheduler is None:
+        with _lock:
+            if _scheduler is None:
+                _scheduler = LLMScheduler(
+                    limits={
+                        constant.GROQ: ProviderLimits(
+                            settings.groq_max_in_flight, settings.groq_requests_per_minute, settings.groq_tokens_per_minute
+                        ),
+                        constant.GEMINI: ProviderLimits(
+                            settings.gemini_max_in_flight, settings.gemini_requests_per_minute, settings.gemini_tokens_per_minute
+                        ),
+                    },
+                    redis_url=settings.redis_url_set if settings.llm_scheduler_redis_enabled and settings.redis_url_set else None
+                )
+    return _scheduler
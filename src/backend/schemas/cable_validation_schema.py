@@ -29,6 +29,13 @@ class LLMResponseSchema(BaseModel):
     validation: List[ValidationResponseSchema] = Field(default_factory=list)
     confidence: Confidence = Field(..., description="Confidence scores for the extraction and validation results.")
 
+# Batched audit response from LLM (several designs per call)
+class LLMBatchResponseItemSchema(LLMResponseSchema):
+    design_index: int = Field(..., description="Index of the design in the request this result belongs to.")
+
+class LLMBatchResponseSchema(BaseModel):
+    results: List[LLMBatchResponseItemSchema] = Field(..., description="One audit result per design in the request.")
+
 # Post request and response schemas (execution/job creation)
 class DesignValidationPostRequest(BaseModel):
     input_mode: Literal["free_text", "json", "manual"]
@@ -36,13 +43,31 @@ class DesignValidationPostRequest(BaseModel):
 
 class DesignValidationPostResponse(BaseModel):
     request_id: uuid.UUID
-    job_status: Literal["PENDING", "SUCCESS", "FAILED"]
+    job_status: Literal["PENDING", "RETRYING", "SUCCESS", "FAILED"]
     meta: Dict[str, Any] = Field(default_factory=dict)
 
 # Get request and response schemas (fetching job result)
 class DesignValidationGetResponse(BaseModel):
     request_id: uuid.UUID
-    job_status: Literal["PENDING", "SUCCESS", "FAILED"]
+    job_status: Literal["PENDING", "RETRYING", "SUCCESS", "FAILED"]
     result: Optional[LLMResponseSchema] = None
     error: Optional[str] = None
-    meta: Dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
+    meta: Dict[str, Any] = Field(default_factory=dict)
+
+# Batch post request and response schemas (bulk job creation)
+class DesignValidationBatchPostRequest(BaseModel):
+    items: List[DesignValidationPostRequest] = Field(..., min_length=1, description="Cable designs to validate in a single submission.")
+
+class DesignValidationBatchPostResponse(BaseModel):
+    batch_id: uuid.UUID
+    request_ids: List[uuid.UUID]
+    job_status: Literal["PENDING", "SUCCESS", "FAILED"]
+    meta: Dict[str, Any] = Field(default_factory=dict)
+
+# Batch get response schema (aggregate status of a batch)
+class DesignValidationBatchGetResponse(BaseModel):
+    batch_id: uuid.UUID
+    job_status: Literal["PENDING", "SUCCESS", "FAILED", "PARTIAL"]
+    total: int = Field(..., ge=0)
+    status_counts: Dict[str, int] = Field(default_factory=dict)
+    meta: Dict[str, Any] = Field(default_factory=dict)
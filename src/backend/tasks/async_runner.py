@@ -0,0 +1,79 @@
+import asyncio
+import contextvars
+import os
+import threading
+from typing import Awaitable, Optional, TypeVar
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+
+T = TypeVar("T")
+
+
+class AsyncWorkerRunner:
+    """
+    Long-lived event loop on a background thread, one per worker process.
+    Celery pool threads (or the solo/prefork main thread) submit coroutines and block on
+    the result, while the loop multiplexes all of them, so one process keeps many LLM
+    calls in flight. A semaphore on the loop caps concurrent validations.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.loop = asyncio.new_event_loop()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, name="async-worker-loop", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        logger.info(f"Async worker loop started | pid={os.getpid()} | max_concurrency={max_concurrency}")
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.loop.call_soon(self._ready.set)
+        self.loop.run_forever()
+
+    async def _guarded(self, coro: Awaitable[T], context: contextvars.Context) -> T:
+        # The task runs in the loop thread's context; carry over the caller's request_id, prompt tally, ...
+        for var, value in context.items():
+            var.set(value)
+        async with self._semaphore:  # type: ignore
+            return await coro
+
+    def run(self, coro: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Runs the coroutine on the shared loop and blocks the calling thread until it finishes."""
+        future = asyncio.run_coroutine_threadsafe(self._guarded(coro, contextvars.copy_context()), self.loop)
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def close(self) -> None:
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join(timeout=5)
+        logger.info(f"Async worker loop stopped | pid={os.getpid()}")
+
+
+_runner: Optional[AsyncWorkerRunner] = None
+_runner_pid: Optional[int] = None
+_lock = threading.Lock()
+
+
+def get_async_runner() -> AsyncWorkerRunner:
+    """Created lazily so prefork children start their own loop thread after the fork."""
+    global _runner, _runner_pid
+    if _runner is None or _runner_pid != os.getpid():
+        with _lock:
+            if _runner is None or _runner_pid != os.getpid():
+                _runner = AsyncWorkerRunner(settings.worker_async_concurrency)
+                _runner_pid = os.getpid()
+    return _runner
+
+
+def shutdown_async_runner() -> None:
+    global _runner
+    if _runner is not None and _runner_pid == os.getpid():
+        _runner.close()
+        _runner = None
@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Optional
+import redis
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+
+# free_text needs extraction + audit LLM calls; json/manual skip extraction and only audit
+FREE_TEXT_QUEUE = "validation.free_text"
+STRUCTURED_QUEUE = "validation.structured"
+FREE_TEXT_BATCH_QUEUE = "validation.free_text.batch"
+STRUCTURED_BATCH_QUEUE = "validation.structured.batch"
+
+# Worker groups, queues listed in the order a worker drains them
+QUEUE_GROUPS: Dict[str, List[str]] = {
+    "structured": [STRUCTURED_QUEUE, STRUCTURED_BATCH_QUEUE],
+    "free_text": [FREE_TEXT_QUEUE, FREE_TEXT_BATCH_QUEUE],
+    "all": [STRUCTURED_QUEUE, FREE_TEXT_QUEUE, STRUCTURED_BATCH_QUEUE, FREE_TEXT_BATCH_QUEUE],
+}
+
+ALL_QUEUES = QUEUE_GROUPS["all"]
+
+_broker: Optional[redis.Redis] = None
+
+
+def select_queue(input_mode: Optional[str], batch: bool = False) -> str:
+    if input_mode == "free_text":
+        return FREE_TEXT_BATCH_QUEUE if batch else FREE_TEXT_QUEUE
+    return STRUCTURED_BATCH_QUEUE if batch else STRUCTURED_QUEUE
+
+
+def route_validation_task(name: str, args: Any, kwargs: Dict[str, Any], options: Dict[str, Any], task: Any = None, **kw: Any) -> Optional[Dict[str, str]]:
+    """Celery task router: interactive validations go to their input_mode queue; an explicit queue (batches) wins."""
+    if name != "validate_cable_design":
+        return None
+    return {"queue": select_queue((kwargs or {}).get("input_mode"))}
+
+
+def group_concurrency(group: str) -> int:
+    return {
+        "structured": settings.structured_queue_concurrency,
+        "free_text": settings.free_text_queue_concurrency,
+    }.get(group, settings.celery_worker_concurrency)
+
+
+def get_queue_depths() -> Dict[str, int]:
+    """Messages waiting in each validation queue (Redis broker lists); blocking, call from a thread."""
+    global _broker
+    if _broker is None:
+        _broker = redis.Redis.from_url(settings.redis_url_set)
+    pipe = _broker.pipeline(transaction=False)
+    for queue in ALL_QUEUES:
+        pipe.llen(queue)
+    return dict(zip(ALL_QUEUES, pipe.execute()))
+
+
+def worker_argv(group: str) -> List[str]:
+    if group not in QUEUE_GROUPS:
+        raise ValueError(f"Unknown queue group '{group}'. Expected one of {list(QUEUE_GROUPS)}")
+    concurrency = group_concurrency(group)
+    return [
+        "worker",
+        "--loglevel=info",
+        f"--queues={','.join(QUEUE_GROUPS[group])}",
+        f"--pool={settings.celery_worker_pool}",
+        f"--concurrency={concurrency}",
+        f"--hostname={group}@%h",
+    ]
+
+
+if __name__ == "__main__":
+    # python -m src.backend.tasks.queues structured|free_text|all
+    import sys
+    from src.backend.tasks.validation_task import celery_app
+
+    group = sys.argv[1] if len(sys.argv) > 1 else "all"
+    argv = worker_argv(group)
+    # Size the worker's event loop to the group so pool threads never queue behind the semaphore
+    settings.worker_async_concurrency = max(settings.worker_async_concurrency, group_concurrency(group))
+    logger.info(f"Starting validation worker | group={group} | argv={argv}")
+    celery_app.worker_main(argv)
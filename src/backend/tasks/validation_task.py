@@ -1,18 +1,24 @@
 from celery import Celery
-from celery.exceptions import MaxRetriesExceededError
+from kombu import Queue
+from celery.utils.time import get_exponential_backoff_interval
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown, worker_shutdown
 from src.backend.db.database import SessionLocal
 from src.backend.db.models.ai_validation_model import AIValidation
-from src.backend.orchestrator.cable_validation_orchestrator import CableDesignValidator
-from src.backend.validators.database_validators import ISRAGDatabaseValidator
-from src.backend.formatters.evidence_formatters import EvidenceFormatter
-from src.backend.extractor.llm_extractor import LLMFieldExtractor
-from src.backend.providers.groq_llm_client import GroqLLMClient
-from src.backend.providers.gemini_llm_client import GeminiLLMClient
-from src.backend.auditors.llm_auditor import LLMAuditor
-from src.backend.config.logger import logger
-import uuid
+from src.backend.validators.insulation_rule_engine import get_insulation_rules
+from src.backend.validators.conductor_spec_index import init_spec_index
+from src.backend.providers.registry import get_cable_validator
+from src.backend.orchestrator.cable_validation_orchestrator import STAGE_AUDIT
+from src.backend.config.logger import logger, set_request_id
+from src.backend.notifications.result_notifier import publish_validation_result
+from src.backend.utils.token_estimator import start_prompt_accounting
+from src.backend.tasks.async_runner import get_async_runner, shutdown_async_runner
+from src.backend.tasks.queues import ALL_QUEUES, STRUCTURED_QUEUE, route_validation_task
+from src.backend.observability.metrics import TASK_DURATION, TASK_OUTCOMES, observe_queue_wait, start_metrics_server
+from src.backend.observability.tracing import flush_tracing, traced
 import asyncio
-from typing import Any
+import time
+import uuid
+from typing import Any, Optional
 from src.backend.config.settings import settings
 
 celery_app: Celery = Celery(
@@ -27,64 +33,154 @@ celery_config: dict[str, Any] = {
     'result_serializer': 'json',
     'timezone': 'UTC',
     'enable_utc': True,
-    'worker_pool': 'solo'
+    # solo: one validation per process; threads: pool threads share the process's async loop
+    'worker_pool': settings.celery_worker_pool,
+    'worker_concurrency': settings.celery_worker_concurrency,
+    # Cheap structured jobs and LLM-heavy free_text jobs never share a queue; a worker
+    # started without -Q consumes all of them, interactive queues before batch queues
+    'task_queues': [Queue(name) for name in ALL_QUEUES],
+    'task_default_queue': STRUCTURED_QUEUE,
+    'task_routes': (route_validation_task,),
+    'broker_transport_options': {'queue_order_strategy': 'priority'}
 }
 celery_app.conf.update(celery_config)  # type: ignore
 
-@celery_app.task(name="validate_cable_design", bind=True, max_retries=3) # type: ignore
-def validate_cable_design_task(self, request_id: str, user_input: Any, input_mode: str) -> dict[str, Any]:
-    db = SessionLocal() 
+@worker_init.connect
+def serve_worker_metrics(**kwargs: Any) -> None:
+    if settings.worker_metrics_port > 0:
+        start_metrics_server(settings.worker_metrics_port)
+
+@worker_init.connect
+def warn_on_solo_pool(sender: Any = None, **kwargs: Any) -> None:
+    pool = getattr(sender, "pool_cls", None)
+    pool_name = pool if isinstance(pool, str) else getattr(pool, "__module__", "")
+    if "solo" in str(pool_name):
+        # The async runner only overlaps validations submitted by concurrent pool threads
+        logger.warning(
+            "[CELERY] Worker started with the solo pool: validations run one at a time. "
+            "Use --pool=threads (CELERY_WORKER_POOL=threads) with --concurrency matching WORKER_ASYNC_CONCURRENCY"
+        )
+
+@worker_process_init.connect
+def load_reference_tables(**kwargs: Any) -> None:
+    # Pools without child processes (solo/threads) load lazily on first validation instead
+    init_spec_index()
+    get_insulation_rules()
     try:
-        logger.info(f"[CELERY] Starting validation for request_id={request_id}")
-        
-        extraction_client = GroqLLMClient()
-        audit_client = GeminiLLMClient()
-        validator = CableDesignValidator(
-            field_extractor=LLMFieldExtractor(extraction_client),
-            database_validator=ISRAGDatabaseValidator(db),
-            evidence_formatter=EvidenceFormatter(),
-            auditor=LLMAuditor(audit_client)
+        get_cable_validator()
+    except Exception as e:
+        # Leave it to the first task, which records the failure against its request
+        logger.error(f"[CELERY] Failed to warm up LLM providers | error={str(e)}")
+    get_async_runner()
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_async_runner(**kwargs: Any) -> None:
+    shutdown_async_runner()
+    flush_tracing()
+
+def save_checkpoint(request_id: str, checkpoint: dict[str, Any]) -> None:
+    """Best-effort write of the completed stages; the task's own error handler saves them again on failure."""
+    db = SessionLocal()
+    try:
+        db.query(AIValidation).filter(AIValidation.request_id == uuid.UUID(request_id)).update(
+            {"stage": checkpoint.get("stage"), "checkpoint": checkpoint}, synchronize_session=False
         )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"[CELERY] Failed to persist checkpoint | request_id={request_id} | stage={checkpoint.get('stage')} | error={str(e)}")
+    finally:
+        db.close()
 
-        # ✅ FIX 3: Now validator is defined
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(validator.validate(user_input, input_mode))
-        loop.close()
+@traced(name="cable_design_validation_pipeline", process_inputs=lambda inputs: {k: v for k, v in inputs.items() if k != "validator"})
+async def run_validation_pipeline(validator: Any, request_id: str, user_input: Any, input_mode: str, checkpoint: dict[str, Any]) -> Any:
+    # Root of the worker-side trace; the sampling decision made here covers every LLM call below it
+    async def persist(stages: dict[str, Any]) -> None:
+        await asyncio.to_thread(save_checkpoint, request_id, dict(stages))
+    return await validator.validate(user_input, input_mode, checkpoint, on_checkpoint=persist)
+
+# Acked after the task returns, so a validation whose worker was killed is redelivered and resumes from its saved checkpoint
+@celery_app.task(name="validate_cable_design", bind=True, max_retries=settings.task_max_retries, acks_late=True, reject_on_worker_lost=True) # type: ignore
+def validate_cable_design_task(self, request_id: str, user_input: Any, input_mode: str, enqueued_at: Optional[float] = None) -> dict[str, Any]:
+    started = time.perf_counter()
+    outcome = "FAILED"
+    db = SessionLocal() 
+    validation_record = None
+    checkpoint: dict[str, Any] = {}
+    set_request_id(request_id)
+    try:
+        logger.info("[CELERY] Starting validation for request_id=%s | attempt=%d", request_id, self.request.retries + 1)
+        if self.request.retries == 0:
+            # Retries wait out their backoff countdown, which is not queueing delay
+            observe_queue_wait((self.request.delivery_info or {}).get("routing_key"), enqueued_at)
 
         validation_record = db.query(AIValidation).filter(
             AIValidation.request_id == uuid.UUID(request_id)
         ).first()
+        if validation_record and validation_record.status == "SUCCESS":
+            # Redelivered after the worker died between committing the result and acking the message
+            logger.info("[CELERY] Validation already completed | request_id=%s", request_id)
+            outcome = "SUCCESS"
+            return {"status": "SUCCESS", "request_id": request_id}
+        if validation_record and validation_record.checkpoint:
+            checkpoint = dict(validation_record.checkpoint)
+        
+        validator = get_cable_validator()
+        prompt_usage = start_prompt_accounting()
+        # The registry's async clients live on the runner's long-lived loop, shared by all pool threads
+        result = get_async_runner().run(run_validation_pipeline(validator, request_id, user_input, input_mode, checkpoint))
+        logger.info("[CELERY] Prompt tokens | request_id=%s | usage=%s", request_id, prompt_usage)
         
         if validation_record:
+            # save_checkpoint wrote stage/checkpoint from its own session; reload so clearing them is not a no-op
+            db.refresh(validation_record)
             validation_record.ai_response = result.model_dump()
             validation_record.status = "SUCCESS"
+            validation_record.error_message = None
+            validation_record.prompt_tokens = sum(prompt_usage.values())
+            validation_record.stage = STAGE_AUDIT
+            validation_record.checkpoint = None
             db.commit()
-            logger.info(f"[CELERY] Validation completed successfully | request_id={request_id}")
+            publish_validation_result(request_id, "SUCCESS")
+            logger.info("[CELERY] Validation completed successfully | request_id=%s", request_id)
         else:
             logger.error(f"[CELERY] Validation record not found | request_id={request_id}")
         
+        outcome = "SUCCESS"
         return {"status": "SUCCESS", "request_id": request_id}
         
     except Exception as e:
-        logger.error(f"[CELERY] Validation failed | request_id={request_id} | error={str(e)}", exc_info=True)
-        
-        # Update database with FAILED
-        validation_record = db.query(AIValidation).filter(
-            AIValidation.request_id == uuid.UUID(request_id)
-        ).first()
-        
+        logger.error(f"[CELERY] Validation failed | request_id={request_id} | stage={checkpoint.get('stage')} | error={str(e)}", exc_info=True)
+        db.rollback()
+        final_attempt = self.request.retries >= self.max_retries
+
+        # Keep the completed stages so the retry resumes from the one that failed
         if validation_record:
-            validation_record.status = "FAILED"
+            validation_record.status = "FAILED" if final_attempt else "RETRYING"
             validation_record.error_message = str(e)
+            validation_record.stage = checkpoint.get("stage")
+            validation_record.checkpoint = checkpoint or None
             db.commit()
-        
-        # Retry logic
-        try:
-            raise self.retry(exc=e, countdown=60)  # Retry after 60 seconds
-        except MaxRetriesExceededError:
+
+        if final_attempt:
             logger.error(f"[CELERY] Max retries exceeded | request_id={request_id}")
+            if validation_record:
+                publish_validation_result(request_id, "FAILED")
             return {"status": "FAILED", "request_id": request_id, "error": str(e)}
+
+        outcome = "RETRYING"
+        # Exponential backoff with full jitter, so retries after a provider outage do not arrive in lockstep
+        countdown = get_exponential_backoff_interval(
+            factor=settings.task_retry_backoff_seconds,
+            retries=self.request.retries,
+            maximum=settings.task_retry_backoff_max_seconds,
+            full_jitter=True
+        )
+        logger.info("[CELERY] Retrying validation | request_id=%s | countdown=%ss | resume_after=%s", request_id, countdown, checkpoint.get("stage"))
+        raise self.retry(exc=e, countdown=countdown)
     
     finally:
+        TASK_DURATION.labels(input_mode, outcome).observe(time.perf_counter() - started)
+        TASK_OUTCOMES.labels(outcome).inc()
         db.close()
\ No newline at end of file
@@ -4,6 +4,7 @@ from sqlalchemy import create_engine, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from src.backend.db.database import Base
 from src.backend.db.models.conductor_spec_model import ConductorSpec
+from src.backend.db.models.insulation_spec_model import InsulationSpec
 from src.backend.config.settings import settings
 
 
@@ -124,9 +125,54 @@ def load_from_json(json_data: Dict[str, Any], db: Session) -> int:
         db.rollback()
         raise e
 
+def load_insulation_from_json(json_data: Dict[str, Any], db: Session) -> int:
+    count = 0
+
+    try:
+        for table in json_data.get("tables", []):
+            for row in table.get("rows", []):
+                spec = InsulationSpec(
+                    standard=table["standard"],
+                    voltage_grade=table["voltage_grade"],
+                    max_voltage_v=table["max_voltage_v"],
+                    insulation_material=table["insulation_material"],
+                    csa_mm2=float(row["nominal_cross_sectional_area"]),
+                    nominal_thickness_mm=row["nominal_thickness_mm"],
+                    note=row.get("note")
+                )
+                db.add(spec)
+                count += 1
+
+        db.commit()
+        return count
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
+def load_insulation_data(json_file_path: str):
+    """Create insulation_specs (IS 1554-1 Table 3) and load it from JSON."""
+    engine = create_engine(settings.database_url)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+
+    try:
+        with open(json_file_path, 'r', encoding='utf-8') as f:
+            json_data = json.load(f)
+
+        if db.query(InsulationSpec).count() > 0:
+            print("✓ Table 'insulation_specs' already populated")
+            return
+
+        count = load_insulation_from_json(json_data, db)
+        print(f"✓ Successfully loaded {count} insulation records")
+    finally:
+        db.close()
+
 if __name__ == "__main__":
     # Replace with your JSON file path
     json_file_path = "extracted_output/conductor_v1.json"
     check_table_and_load_data(json_file_path)
+    load_insulation_data("extracted_output/insulation_v1.json")
 
 
@@ -0,0 +1,18 @@
+import hashlib
+import json
+from typing import Any, Dict
+
+
+def normalize_free_text(text: str) -> str:
+    """Collapses whitespace and case so trivially different descriptions share a key."""
+    return " ".join(text.split()).casefold()
+
+
+def compute_payload_hash(input_mode: str, data: Dict[str, Any]) -> str:
+    """SHA-256 of the normalized (input_mode, data) pair used for submission deduplication."""
+    if input_mode == "free_text":
+        canonical = f"free_text:{normalize_free_text(str(data.get('description', '')))}"
+    else:
+        # json and manual inputs run the same pipeline, so they share one namespace
+        canonical = "structured:" + json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -0,0 +1,35 @@
+import math
+from contextvars import ContextVar
+from typing import Dict, Optional
+from src.backend.config.logger import logger
+from src.backend.observability.metrics import LLM_PROMPT_TOKENS
+
+# ~4 characters per token holds well enough for English prompts across our providers
+CHARS_PER_TOKEN = 4
+
+# Per-request prompt size by pipeline stage ("extract", "audit"); set by the task before running the pipeline
+_prompt_usage: ContextVar[Optional[Dict[str, int]]] = ContextVar("prompt_usage", default=None)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap provider-agnostic token estimate used for budgeting, not billing."""
+    return math.ceil(len(text) / CHARS_PER_TOKEN) if text else 0
+
+
+def start_prompt_accounting() -> Dict[str, int]:
+    """Starts a fresh per-request tally; the returned dict is filled in as LLM prompts are sent."""
+    usage: Dict[str, int] = {}
+    _prompt_usage.set(usage)
+    return usage
+
+
+def record_prompt_tokens(stage: str, provider: str, *parts: str) -> int:
+    """Estimates, logs and tallies the input tokens of one LLM prompt."""
+    tokens = sum(estimate_tokens(part) for part in parts)
+    logger.info("Prompt size | stage=%s | provider=%s | est_tokens=%d", stage, provider, tokens)
+    LLM_PROMPT_TOKENS.labels(provider, stage).observe(tokens)
+
+    usage = _prompt_usage.get()
+    if usage is not None:
+        usage[stage] = usage.get(stage, 0) + tokens
+    return tokens
@@ -0,0 +1,182 @@
+from typing import Iterable, Iterator, List, Optional
+import numpy as np
+import pandas as pd
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.schemas.cable_validation_schema import CableDesignSchema, ValidationResponseSchema
+from src.backend.validators.conductor_spec_index import ConductorSpecIndex, get_spec_index
+
+# Optional measurement columns a catalog frame may carry alongside the CableDesignSchema fields
+RESISTANCE_COLUMN = "resistance_ohm_per_km"
+WIRE_COUNT_COLUMN = "wire_count"
+TINNED_COLUMN = "tinned"
+COMPACTED_COLUMN = "compacted"
+
+
+def _as_float_array(values: Iterable[Optional[float]]) -> np.ndarray:
+    return np.array([np.nan if v is None else float(v) for v in values], dtype=float)
+
+
+def _checked_status(value) -> Optional[str]:
+    """Status cell from a result frame; pandas may turn the 'not checked' None into NaN."""
+    return value if isinstance(value, str) else None
+
+
+class BulkConductorValidator:
+    """
+    Columnar IS 8130 Table 2 checks for whole catalogs.
+    The spec index is copied into NumPy arrays once; each batch is validated with
+    searchsorted/where over arrays instead of one CableRAGValidator call per design.
+    """
+
+    def __init__(self, spec_index: Optional[ConductorSpecIndex] = None):
+        index = spec_index or get_spec_index()
+        records = sorted(index.records, key=lambda r: r.csa_mm2)
+
+        self._sizes = _as_float_array(r.csa_mm2 for r in records)
+        self._max_res_cu_plain = _as_float_array(r.max_resistance_cu_plain for r in records)
+        self._max_res_cu_tinned = _as_float_array(r.max_resistance_cu_tinned for r in records)
+        self._max_res_al = _as_float_array(r.max_resistance_al for r in records)
+        self._min_wires_cu_circular = _as_float_array(r.min_wires_cu_circular for r in records)
+        self._min_wires_cu_compacted = _as_float_array(r.min_wires_cu_compacted for r in records)
+        self._min_wires_al_circular = _as_float_array(r.min_wires_al_circular for r in records)
+        self._min_wires_al_compacted = _as_float_array(r.min_wires_al_compacted for r in records)
+        logger.info(f"BulkConductorValidator initialized with {len(self._sizes)} standard sizes")
+
+    @staticmethod
+    def designs_to_frame(designs: Iterable[CableDesignSchema]) -> pd.DataFrame:
+        return pd.DataFrame.from_records(d.model_dump() for d in designs)
+
+    def _match_sizes(self, csa: np.ndarray, rel_tolerance: float):
+        """Vectorized match_standard_size: returns (matched mask, matched idx, lower idx, higher idx)."""
+        n = len(self._sizes)
+        position = np.searchsorted(self._sizes, np.nan_to_num(csa, nan=-1.0), side="left")
+        lower_idx = np.clip(position - 1, 0, n - 1)
+        higher_idx = np.clip(position, 0, n - 1)
+        has_lower = position > 0
+        has_higher = position < n
+
+        lower_diff = np.abs(csa - self._sizes[lower_idx])
+        higher_diff = np.abs(csa - self._sizes[higher_idx])
+        lower_ok = has_lower & (lower_diff <= rel_tolerance * self._sizes[lower_idx])
+        higher_ok = has_higher & (higher_diff <= rel_tolerance * self._sizes[higher_idx])
+
+        use_higher = higher_ok & (~lower_ok | (higher_diff < lower_diff))
+        matched = (lower_ok | higher_ok) & ~np.isnan(csa)
+        idx = np.where(use_higher, higher_idx, lower_idx)
+        return matched, idx, np.where(has_lower, lower_idx, -1), np.where(has_higher, higher_idx, -1)
+
+    def validate_frame(self, designs: pd.DataFrame, rel_tolerance: Optional[float] = None) -> pd.DataFrame:
+        """
+        Validates a frame with CableDesignSchema columns (plus optional resistance_ohm_per_km,
+        wire_count, tinned, compacted). Returns one result row per input row, same index.
+        """
+        tolerance = settings.csa_match_rel_tolerance if rel_tolerance is None else rel_tolerance
+        rows = len(designs)
+
+        csa = pd.to_numeric(designs.get("csa", pd.Series([np.nan] * rows, index=designs.index)), errors="coerce").to_numpy(dtype=float)
+        material = designs.get("conductor_material", pd.Series([None] * rows, index=designs.index)).to_numpy(dtype=object)
+        conductor_class = designs.get("conductor_class", pd.Series([None] * rows, index=designs.index)).to_numpy(dtype=object)
+        is_cu = material == "Cu"
+        is_al = material == "Al"
+
+        matched, idx, lower_idx, higher_idx = self._match_sizes(csa, tolerance)
+
+        # 1. CSA membership
+        matched_csa = np.where(matched, self._sizes[idx], np.nan)
+        has_csa = ~np.isnan(csa)
+        nearest_lower = np.where(~matched & has_csa & (lower_idx >= 0), self._sizes[np.maximum(lower_idx, 0)], np.nan)
+        nearest_higher = np.where(~matched & has_csa & (higher_idx >= 0), self._sizes[np.maximum(higher_idx, 0)], np.nan)
+        csa_status = np.where(matched, "PASS", "FAIL")
+
+        # 2. Resistance limits (plain or tinned copper, aluminium)
+        tinned = designs[TINNED_COLUMN].fillna(False).to_numpy(dtype=bool) if TINNED_COLUMN in designs else np.zeros(rows, dtype=bool)
+        cu_limit = np.where(tinned, self._max_res_cu_tinned[idx], self._max_res_cu_plain[idx])
+        expected_max_res = np.where(matched & is_cu, cu_limit, np.where(matched & is_al, self._max_res_al[idx], np.nan))
+
+        measured_res = (
+            pd.to_numeric(designs[RESISTANCE_COLUMN], errors="coerce").to_numpy(dtype=float)
+            if RESISTANCE_COLUMN in designs else np.full(rows, np.nan)
+        )
+        res_checked = ~np.isnan(measured_res) & ~np.isnan(expected_max_res)
+        resistance_status = np.where(res_checked, np.where(measured_res <= expected_max_res, "PASS", "FAIL"), None)
+
+        # 3. Minimum wire counts (Class 2 stranded conductors)
+        compacted = designs[COMPACTED_COLUMN].fillna(False).to_numpy(dtype=bool) if COMPACTED_COLUMN in designs else np.zeros(rows, dtype=bool)
+        cu_min = np.where(compacted, self._min_wires_cu_compacted[idx], self._min_wires_cu_circular[idx])
+        al_min = np.where(compacted, self._min_wires_al_compacted[idx], self._min_wires_al_circular[idx])
+        is_class_2 = conductor_class == "Class 2"
+        expected_min_wires = np.where(matched & is_class_2 & is_cu, cu_min, np.where(matched & is_class_2 & is_al, al_min, np.nan))
+
+        wire_count = (
+            pd.to_numeric(designs[WIRE_COUNT_COLUMN], errors="coerce").to_numpy(dtype=float)
+            if WIRE_COUNT_COLUMN in designs else np.full(rows, np.nan)
+        )
+        wires_checked = ~np.isnan(wire_count) & ~np.isnan(expected_min_wires)
+        wire_count_status = np.where(wires_checked, np.where(wire_count >= expected_min_wires, "PASS", "FAIL"), None)
+
+        return pd.DataFrame({
+            "csa_status": csa_status,
+            "matched_csa": matched_csa,
+            "nearest_lower_csa": nearest_lower,
+            "nearest_higher_csa": nearest_higher,
+            "expected_max_resistance": expected_max_res,
+            "resistance_status": resistance_status,
+            "expected_min_wires": expected_min_wires,
+            "wire_count_status": wire_count_status,
+        }, index=designs.index)
+
+    def validate_designs(self, designs: Iterable[CableDesignSchema]) -> pd.DataFrame:
+        return self.validate_frame(self.designs_to_frame(designs))
+
+    @staticmethod
+    def iter_validation_responses(designs: pd.DataFrame, results: pd.DataFrame) -> Iterator[List[ValidationResponseSchema]]:
+        """Lazily converts result rows into the per-design lists CableRAGValidator would produce for conductor fields."""
+        for design, result in zip(designs.itertuples(index=False), results.itertuples(index=False)):
+            validations: List[ValidationResponseSchema] = []
+
+            if result.csa_status == "FAIL":
+                neighbours = []
+                if not np.isnan(result.nearest_lower_csa):
+                    neighbours.append(f"{result.nearest_lower_csa} mm² (next lower)")
+                if not np.isnan(result.nearest_higher_csa):
+                    neighbours.append(f"{result.nearest_higher_csa} mm² (next higher)")
+                validations.append(ValidationResponseSchema(
+                    field="csa",
+                    validation_status="FAIL",
+                    expected="Nearest standard IS 8130 sizes: " + " or ".join(neighbours) if neighbours else "Standard IS 8130 Size",
+                    comment=f"Size {getattr(design, 'csa', None)} mm² is not a standard size in IS 8130 Table 2."
+                ))
+                yield validations
+                continue
+
+            if not np.isnan(result.expected_max_resistance):
+                measured = getattr(design, RESISTANCE_COLUMN, None)
+                resistance_status = _checked_status(result.resistance_status)
+                validations.append(ValidationResponseSchema(
+                    field="conductor_material",
+                    validation_status=resistance_status or "PASS",
+                    expected=f"Max {result.expected_max_resistance} Ω/km",
+                    comment=(
+                        f"Measured {measured} Ω/km against IS 8130 Table 2 limit for {result.matched_csa} mm²."
+                        if resistance_status else
+                        f"Confirmed via IS 8130 Table 2. Resistance limit is valid for {result.matched_csa} mm²."
+                    )
+                ))
+
+            if not np.isnan(result.expected_min_wires):
+                min_wires = int(result.expected_min_wires)
+                validations.append(ValidationResponseSchema(
+                    field="conductor_class",
+                    validation_status=_checked_status(result.wire_count_status) or "PASS",
+                    expected=f"Min {min_wires} wires",
+                    comment=f"Confirmed via IS 8130 Table 2. Class 2 construction requires min {min_wires} strands."
+                ))
+
+            validations.append(ValidationResponseSchema(
+                field="csa",
+                validation_status="PASS",
+                expected=f"{result.matched_csa} mm²",
+                comment="Validated via IS 8130. This is a recognized standard conductor size."
+            ))
+            yield validations
@@ -1,27 +1,25 @@
 from typing import List
-from sqlalchemy.orm import Session
-from src.backend.db.models.conductor_spec_model import ConductorSpec
+from src.backend.validators.conductor_spec_index import ConductorSpecIndex, ConductorSpecRecord, CSALookupResult
 from src.backend.schemas.cable_validation_schema import CableDesignSchema, ValidationResponseSchema
 
 class CableRAGValidator:
     
-    def __init__(self, db: Session):
-        self.db = db
+    def __init__(self, spec_index: ConductorSpecIndex):
+        self.spec_index = spec_index
 
     def validate_design(self, extracted_data: CableDesignSchema) -> List[ValidationResponseSchema]:
         validations: List[ValidationResponseSchema] = []
 
-        # 1. RETRIEVE DATA FROM DATABASE (IS 8130 Table 2)
-        spec = self.db.query(ConductorSpec).filter(
-            ConductorSpec.csa_mm2 == extracted_data.csa
-        ).first()
+        # 1. RETRIEVE DATA FROM THE IN-MEMORY SPEC INDEX (IS 8130 Table 2)
+        lookup = self.spec_index.lookup(extracted_data.csa)
+        spec = lookup.match
 
-        # If the size is not in our IS 8130 table
+        # If the size is not in our IS 8130 table, point at the nearest standard sizes
         if not spec:
             validations.append(ValidationResponseSchema(
                 field="csa",
                 validation_status="FAIL",
-                expected="Standard IS 8130 Size",
+                expected=self._nearest_sizes_text(lookup),
                 comment=f"Size {extracted_data.csa} mm² is not a standard size in IS 8130 Table 2."
             ))
             return validations
@@ -34,7 +32,7 @@ class CableRAGValidator:
 
         return validations
 
-    def _validate_conductor(self, data: CableDesignSchema, spec: ConductorSpec, results: List[ValidationResponseSchema]):
+    def _validate_conductor(self, data: CableDesignSchema, spec: ConductorSpecRecord, results: List[ValidationResponseSchema]):
         """Validates Conductor parameters using your specific DB model fields."""
         
         is_cu = data.conductor_material == "Cu"
@@ -48,7 +46,7 @@ class CableRAGValidator:
             field="conductor_material",
             validation_status="PASS",
             expected=f"Max {expected_res} Ω/km",
-            comment=f"Confirmed via IS 8130 Table 2. Resistance limit for {mat_name} is valid for {data.csa} mm²."
+            comment=f"Confirmed via IS 8130 Table 2. Resistance limit for {mat_name} is valid for {spec.csa_mm2} mm²."
         ))
 
         # B. Conductor Class & Stranding Check
@@ -64,13 +62,29 @@ class CableRAGValidator:
             ))
 
         # C. CSA Validation
+        comment = "Validated via IS 8130. This is a recognized standard conductor size."
+        if data.csa != spec.csa_mm2:
+            comment += f" Input {data.csa} mm² matched to {spec.csa_mm2} mm² within tolerance."
+
         results.append(ValidationResponseSchema(
             field="csa",
             validation_status="PASS",
-            expected=f"{data.csa} mm²",
-            comment="Validated via IS 8130. This is a recognized standard conductor size."
+            expected=f"{spec.csa_mm2} mm²",
+            comment=comment
         ))
 
+    def _nearest_sizes_text(self, lookup: CSALookupResult) -> str:
+        """Describes the standard sizes either side of a non-standard CSA."""
+        neighbours = []
+        if lookup.lower is not None:
+            neighbours.append(f"{lookup.lower.csa_mm2} mm² (next lower)")
+        if lookup.higher is not None:
+            neighbours.append(f"{lookup.higher.csa_mm2} mm² (next higher)")
+
+        if not neighbours:
+            return "Standard IS 8130 Size"
+        return "Nearest standard IS 8130 sizes: " + " or ".join(neighbours)
+
     def _prepare_llm_fields(self, data: CableDesignSchema, results: List[ValidationResponseSchema]):
         """Flags fields for IS 1554-1 reasoning."""
         
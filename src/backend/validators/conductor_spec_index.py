@@ -0,0 +1,181 @@
+import bisect
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.db.database import SessionLocal
+from src.backend.db.models.conductor_spec_model import ConductorSpec
+
+
+@dataclass(frozen=True)
+class ConductorSpecRecord:
+    """Detached, read-only copy of a conductor_specs row (IS 8130 Table 2)."""
+    csa_mm2: float
+    min_wires_cu_circular: Optional[int]
+    min_wires_cu_compacted: Optional[int]
+    max_resistance_cu_plain: Optional[float]
+    max_resistance_cu_tinned: Optional[float]
+    min_wires_al_circular: Optional[int]
+    min_wires_al_compacted: Optional[int]
+    max_resistance_al: Optional[float]
+    note: Optional[str]
+
+    @classmethod
+    def from_model(cls, spec: ConductorSpec) -> "ConductorSpecRecord":
+        return cls(
+            csa_mm2=spec.csa_mm2,
+            min_wires_cu_circular=spec.min_wires_cu_circular,
+            min_wires_cu_compacted=spec.min_wires_cu_compacted,
+            max_resistance_cu_plain=spec.max_resistance_cu_plain,
+            max_resistance_cu_tinned=spec.max_resistance_cu_tinned,
+            min_wires_al_circular=spec.min_wires_al_circular,
+            min_wires_al_compacted=spec.min_wires_al_compacted,
+            max_resistance_al=spec.max_resistance_al,
+            note=spec.note
+        )
+
+
+def match_standard_size(
+    sizes: Sequence[float], csa: float, rel_tolerance: float
+) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """
+    Bisects a sorted size list and returns (match, lower, higher).
+    A size within rel_tolerance (fraction of the standard size) counts as a match,
+    so 2.499999 resolves to 2.5 instead of failing exact float equality.
+    """
+    position = bisect.bisect_left(sizes, csa)
+    lower = sizes[position - 1] if position > 0 else None
+    higher = sizes[position] if position < len(sizes) else None
+
+    candidates = [size for size in (lower, higher) if size is not None and abs(csa - size) <= rel_tolerance * size]
+    if candidates:
+        return min(candidates, key=lambda size: abs(csa - size)), None, None
+    return None, lower, higher
+
+
+@dataclass(frozen=True)
+class CSALookupResult:
+    """Exact/tolerant match, or the standard sizes either side of the requested CSA."""
+    match: Optional[ConductorSpecRecord] = None
+    lower: Optional[ConductorSpecRecord] = None
+    higher: Optional[ConductorSpecRecord] = None
+
+
+class ConductorSpecIndex:
+    """Immutable in-memory snapshot of conductor_specs keyed by CSA."""
+
+    def __init__(self, records: Iterable[ConductorSpecRecord], version: Tuple[int, Optional[int]]):
+        by_csa: Dict[float, ConductorSpecRecord] = {}
+        for record in records:
+            # Keep the first row per size, matching the previous query(...).first() semantics
+            by_csa.setdefault(record.csa_mm2, record)
+        self._by_csa = MappingProxyType(by_csa)
+        self._sizes: Tuple[float, ...] = tuple(sorted(by_csa))
+        self.version = version
+
+    def lookup(self, csa: Optional[float], rel_tolerance: Optional[float] = None) -> CSALookupResult:
+        """Exact match first, then the tolerant bisect match, else the neighbouring standard sizes."""
+        if csa is None or not self._sizes:
+            return CSALookupResult()
+
+        exact = self._by_csa.get(csa)
+        if exact is not None:
+            return CSALookupResult(match=exact)
+
+        tolerance = settings.csa_match_rel_tolerance if rel_tolerance is None else rel_tolerance
+        match, lower, higher = match_standard_size(self._sizes, csa, tolerance)
+        if match is not None:
+            return CSALookupResult(match=self._by_csa[match])
+
+        return CSALookupResult(
+            lower=self._by_csa[lower] if lower is not None else None,
+            higher=self._by_csa[higher] if higher is not None else None
+        )
+
+    def get(self, csa: Optional[float]) -> Optional[ConductorSpecRecord]:
+        return self.lookup(csa).match
+
+    @property
+    def sizes(self) -> Tuple[float, ...]:
+        return self._sizes
+
+    @property
+    def records(self) -> Tuple[ConductorSpecRecord, ...]:
+        return tuple(self._by_csa.values())
+
+    def __len__(self) -> int:
+        return len(self._by_csa)
+
+
+def _table_version(db: Session) -> Tuple[int, Optional[int]]:
+    """Cheap change detector for conductor_specs: (row count, max id)."""
+    count, max_id = db.query(func.count(ConductorSpec.id), func.max(ConductorSpec.id)).one()
+    return int(count), max_id
+
+
+def load_spec_index(db: Session) -> ConductorSpecIndex:
+    version = _table_version(db)
+    specs = db.query(ConductorSpec).order_by(ConductorSpec.id).all()
+    return ConductorSpecIndex((ConductorSpecRecord.from_model(spec) for spec in specs), version)
+
+
+_spec_index: Optional[ConductorSpecIndex] = None
+_last_version_check: float = 0.0
+_lock = threading.Lock()
+
+
+def reload_spec_index() -> ConductorSpecIndex:
+    """Explicit reload hook: rebuilds the process-wide index from the database."""
+    global _spec_index, _last_version_check
+    db = SessionLocal()
+    try:
+        index = load_spec_index(db)
+    finally:
+        db.close()
+
+    with _lock:
+        _spec_index = index
+        _last_version_check = time.monotonic()
+    logger.info(f"Conductor spec index loaded | sizes={len(index)} | version={index.version}")
+    return index
+
+
+def init_spec_index() -> ConductorSpecIndex:
+    """Loads the index once per process (startup / Celery worker_process_init)."""
+    if _spec_index is None:
+        return reload_spec_index()
+    return _spec_index
+
+
+def _refresh_if_stale(index: ConductorSpecIndex) -> ConductorSpecIndex:
+    global _last_version_check
+    interval = settings.spec_index_version_check_seconds
+    if interval <= 0 or time.monotonic() - _last_version_check < interval:
+        return index
+
+    with _lock:
+        # Another thread may have checked while we waited for the lock
+        if time.monotonic() - _last_version_check < interval:
+            return _spec_index
+        _last_version_check = time.monotonic()
+
+    db = SessionLocal()
+    try:
+        version = _table_version(db)
+    finally:
+        db.close()
+
+    if version != index.version:
+        logger.info(f"conductor_specs changed ({index.version} -> {version}); reloading spec index")
+        return reload_spec_index()
+    return index
+
+
+def get_spec_index() -> ConductorSpecIndex:
+    index = _spec_index if _spec_index is not None else init_spec_index()
+    return _refresh_if_stale(index)
@@ -1,19 +1,20 @@
-from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from src.backend.config.logger import logger
 from src.backend.validators.cable_rag_validator import CableRAGValidator
+from src.backend.validators.conductor_spec_index import ConductorSpecIndex, get_spec_index
 from src.backend.schemas.cable_validation_schema import CableDesignSchema, ValidationResponseSchema
 from src.backend.interfaces.IS_cable_validation import IDatabaseValidator
 
 
 class ISRAGDatabaseValidator(IDatabaseValidator):
     
-    def __init__(self, db: Session):
-        self.db = db
+    def __init__(self, spec_index: Optional[ConductorSpecIndex] = None):
+        self.spec_index = spec_index
         logger.info("ISRAGDatabaseValidator initialized")
     
     def validate(self, extracted_fields: CableDesignSchema) -> List[ValidationResponseSchema]:
-        logger.debug("Validating extracted fields against database")
-       
-        rag_checker = CableRAGValidator(self.db)
-        return rag_checker.validate_design(extracted_fields)
\ No newline at end of file
+        logger.debug("Validating extracted fields against conductor spec index")
+
+        # Resolve the process-wide index per call so explicit reloads are picked up
+        rag_checker = CableRAGValidator(self.spec_index or get_spec_index())
+        return rag_checker.validate_design(extracted_fields)
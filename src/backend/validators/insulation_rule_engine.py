@@ -0,0 +1,171 @@
+import re
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.orm import Session
+from src.backend.config.logger import logger
+from src.backend.config.settings import settings
+from src.backend.db.database import SessionLocal
+from src.backend.db.models.insulation_spec_model import InsulationSpec
+from src.backend.interfaces.IS_cable_validation import IRuleEngine
+from src.backend.schemas.cable_validation_schema import CableDesignSchema, ValidationResponseSchema
+from src.backend.validators.conductor_spec_index import match_standard_size
+
+_IS_1554_1_PATTERN = re.compile(r"^\s*IS\s*[:\-]?\s*1554\s*(?:\(\s*PART\s*[-:]?\s*(?:1|I)\s*\)|PART\s*[-:]?\s*(?:1|I)\b|-\s*1\b)", re.IGNORECASE)
+_VOLTAGE_PATTERN = re.compile(r"(\d+(?:\.\d+)?)\s*(?:/\s*(\d+(?:\.\d+)?)\s*)?(kV|V)\b", re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class InsulationRule:
+    """Detached, read-only copy of an insulation_specs row (IS 1554-1 Table 3)."""
+    standard: str
+    voltage_grade: str
+    max_voltage_v: int
+    insulation_material: str
+    csa_mm2: float
+    nominal_thickness_mm: float
+
+    @classmethod
+    def from_model(cls, spec: InsulationSpec) -> "InsulationRule":
+        return cls(
+            standard=spec.standard,
+            voltage_grade=spec.voltage_grade,
+            max_voltage_v=spec.max_voltage_v,
+            insulation_material=spec.insulation_material.upper(),
+            csa_mm2=spec.csa_mm2,
+            nominal_thickness_mm=spec.nominal_thickness_mm
+        )
+
+
+class InsulationRuleTable:
+    """Immutable in-memory snapshot of insulation_specs keyed by (material, CSA)."""
+
+    def __init__(self, rules: Iterable[InsulationRule]):
+        by_material: Dict[str, Dict[float, InsulationRule]] = {}
+        for rule in rules:
+            by_material.setdefault(rule.insulation_material, {}).setdefault(rule.csa_mm2, rule)
+
+        self._by_material = MappingProxyType({m: MappingProxyType(r) for m, r in by_material.items()})
+        self._sizes = {m: tuple(sorted(r)) for m, r in by_material.items()}
+        grades = {(rule.voltage_grade, rule.max_voltage_v) for r in by_material.values() for rule in r.values()}
+        # Highest grade covered by the table, e.g. ("1.1 kV", 1100)
+        self.voltage_grade: Optional[Tuple[str, int]] = max(grades, key=lambda g: g[1]) if grades else None
+
+    @property
+    def materials(self) -> Tuple[str, ...]:
+        return tuple(self._by_material)
+
+    def find(self, material: str, csa: float) -> Optional[InsulationRule]:
+        sizes = self._sizes.get(material)
+        if not sizes:
+            return None
+        match, _, _ = match_standard_size(sizes, csa, settings.csa_match_rel_tolerance)
+        return self._by_material[material][match] if match is not None else None
+
+    def __len__(self) -> int:
+        return sum(len(r) for r in self._by_material.values())
+
+
+def load_insulation_rules(db: Session) -> InsulationRuleTable:
+    specs = db.query(InsulationSpec).order_by(InsulationSpec.id).all()
+    return InsulationRuleTable(InsulationRule.from_model(spec) for spec in specs)
+
+
+_rule_table: Optional[InsulationRuleTable] = None
+_lock = threading.Lock()
+
+
+def reload_insulation_rules() -> InsulationRuleTable:
+    """Explicit reload hook: rebuilds the process-wide rule table from the database."""
+    global _rule_table
+    db = SessionLocal()
+    try:
+        table = load_insulation_rules(db)
+    finally:
+        db.close()
+
+    with _lock:
+        _rule_table = table
+    logger.info(f"Insulation rule table loaded | rows={len(table)} | materials={table.materials}")
+    return table
+
+
+def get_insulation_rules() -> InsulationRuleTable:
+    return _rule_table if _rule_table is not None else reload_insulation_rules()
+
+
+def parse_rated_voltage(voltage: str) -> Optional[float]:
+    """Rated phase-to-phase voltage in volts: '1.1 kV' -> 1100, '0.6/1 kV' -> 1000, '650/1100 V' -> 1100."""
+    match = _VOLTAGE_PATTERN.search(voltage)
+    if not match:
+        return None
+    value = float(match.group(2) or match.group(1))
+    return value * 1000 if match.group(3).lower() == "kv" else value
+
+
+class IS1554RuleEngine(IRuleEngine):
+    """
+    Deterministic IS 1554-1 checks for standard, voltage grade, insulation material and thickness.
+    Only fields it can decide from the table are returned; everything else is left to the LLM audit.
+    """
+
+    def __init__(self, rule_table: Optional[InsulationRuleTable] = None):
+        self.rule_table = rule_table
+        logger.info("IS1554RuleEngine initialized")
+
+    def evaluate(self, extracted_fields: CableDesignSchema) -> List[ValidationResponseSchema]:
+        table = self.rule_table or get_insulation_rules()
+        results: List[ValidationResponseSchema] = []
+
+        # A. Standard
+        if extracted_fields.standard and _IS_1554_1_PATTERN.match(extracted_fields.standard):
+            results.append(ValidationResponseSchema(
+                field="standard",
+                validation_status="PASS",
+                expected="IS 1554 (Part 1)",
+                comment="Per IS 1554-1, the design references the applicable standard for PVC insulated cables up to 1100 V."
+            ))
+
+        # B. Voltage grade
+        if extracted_fields.voltage and table.voltage_grade is not None:
+            grade_label, grade_max_v = table.voltage_grade
+            rated_v = parse_rated_voltage(extracted_fields.voltage)
+            if rated_v is not None:
+                passed = rated_v <= grade_max_v
+                results.append(ValidationResponseSchema(
+                    field="voltage",
+                    validation_status="PASS" if passed else "FAIL",
+                    expected=f"≤ {grade_label}",
+                    comment=(
+                        f"Per IS 1554-1, {extracted_fields.voltage} is within the {grade_label} voltage grade."
+                        if passed else
+                        f"Per IS 1554-1, {extracted_fields.voltage} exceeds the {grade_label} grade covered by the standard."
+                    )
+                ))
+
+        # C. Insulation material and thickness (IS 1554-1 Table 3)
+        material = (extracted_fields.insulation_material or "").strip().upper()
+        if material and material in table.materials:
+            results.append(ValidationResponseSchema(
+                field="insulation_material",
+                validation_status="PASS",
+                expected=material,
+                comment=f"Per IS 1554-1 Table 3, {material} is a specified insulation material."
+            ))
+
+            if extracted_fields.csa is not None and extracted_fields.insulation_thickness is not None:
+                rule = table.find(material, extracted_fields.csa)
+                if rule is not None:
+                    passed = extracted_fields.insulation_thickness >= rule.nominal_thickness_mm - 1e-9
+                    results.append(ValidationResponseSchema(
+                        field="insulation_thickness",
+                        validation_status="PASS" if passed else "FAIL",
+                        expected=f"{rule.nominal_thickness_mm} mm",
+                        comment=(
+                            f"Per IS 1554-1 Table 3, nominal {material} insulation thickness for {rule.csa_mm2} mm² "
+                            f"is {rule.nominal_thickness_mm} mm; design has {extracted_fields.insulation_thickness} mm."
+                        )
+                    ))
+
+        return results
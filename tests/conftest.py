@@ -0,0 +1,12 @@
+"""
+Unit tests run offline: settings and the database engines are bound at import time, so the
+environment is pointed at a throwaway SQLite file and no broker before anything from src.backend loads.
+"""
+import os
+import tempfile
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='cable-tests-'), 'test.db')}"
+os.environ["REDIS_URL_SET"] = ""
+os.environ["LANGSMITH_TRACING_V2"] = "false"
+os.environ["LOG_ASYNC"] = "false"
+os.environ["LOG_LEVEL"] = "WARNING"
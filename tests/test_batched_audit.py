@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from src.backend.config.exception import LLMInvocationError
+from src.backend.providers.gemini_llm_client import GeminiLLMClient
+from src.backend.providers.micro_batching_llm_client import MicroBatchingValidateLLMClient
+from src.backend.schemas.cable_validation_schema import CableDesignSchema, LLMBatchResponseSchema, LLMResponseSchema
+
+
+def audit_result(csa):
+    return LLMResponseSchema(
+        is_out_of_scope=False,
+        out_of_scope_explanation="",
+        fields=CableDesignSchema(csa=csa),
+        confidence={"overall": 0.9},
+    )
+
+
+class FailingChain:
+    async def ainvoke(self, inputs):
+        raise ValueError("unparseable batch output")
+
+
+class StaticChain:
+    def __init__(self, response):
+        self.response = response
+
+    async def ainvoke(self, inputs):
+        return self.response
+
+
+def gemini_client(batch_chain, fail_csa=None):
+    """GeminiLLMClient without the network: its batch chain and per-design validate() are stubbed."""
+    client = GeminiLLMClient.__new__(GeminiLLMClient)
+    client.output_tokens = 700
+    client.max_batch_size = 8
+    client.batch_chain = batch_chain
+    client.single_calls = []
+
+    async def validate(evidence_context, extracted_fields):
+        client.single_calls.append(extracted_fields.csa)
+        if extracted_fields.csa == fail_csa:
+            raise LLMInvocationError("design failed on its own")
+        return audit_result(extracted_fields.csa)
+
+    client.validate = validate
+    return client
+
+
+def items(*sizes):
+    return [(f"evidence {csa}", CableDesignSchema(csa=csa)) for csa in sizes]
+
+
+@pytest.fixture(autouse=True)
+def no_scheduler(monkeypatch):
+    monkeypatch.setattr("src.backend.config.settings.settings.llm_scheduler_enabled", False)
+
+
+def test_failed_batch_falls_back_to_single_designs():
+    client = gemini_client(FailingChain(), fail_csa=16.0)
+    results = asyncio.run(client.validate_batch(items(10.0, 16.0, 25.0)))
+
+    assert client.single_calls == [10.0, 16.0, 25.0]
+    assert results[0].fields.csa == 10.0
+    assert isinstance(results[1], LLMInvocationError)
+    assert results[2].fields.csa == 25.0
+
+
+def test_missing_designs_are_audited_individually():
+    response = LLMBatchResponseSchema(results=[{**audit_result(10.0).model_dump(), "design_index": 0}])
+    client = gemini_client(StaticChain(response))
+    results = asyncio.run(client.validate_batch(items(10.0, 16.0)))
+
+    assert client.single_calls == [16.0]
+    assert [r.fields.csa for r in results] == [10.0, 16.0]
+
+
+def test_oversized_batch_is_chunked():
+    client = gemini_client(FailingChain())
+    client.max_batch_size = 2
+    results = asyncio.run(client.validate_batch(items(1.5, 2.5, 4.0, 6.0, 10.0)))
+
+    assert [r.fields.csa for r in results] == [1.5, 2.5, 4.0, 6.0, 10.0]
+
+
+def test_micro_batch_fails_only_the_failing_caller():
+    batcher = MicroBatchingValidateLLMClient(gemini_client(FailingChain(), fail_csa=16.0), max_batch_size=3, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(
+            *(batcher.validate(evidence, fields) for evidence, fields in items(10.0, 16.0, 25.0)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert results[0].fields.csa == 10.0
+    assert isinstance(results[1], LLMInvocationError)
+    assert results[2].fields.csa == 25.0
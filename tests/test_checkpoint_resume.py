@@ -0,0 +1,92 @@
+import asyncio
+
+import pytest
+
+from src.backend.interfaces.IS_cable_validation import IAuditor, IDatabaseValidator, IEvidenceFormatter, IFieldExtractor
+from src.backend.orchestrator.cable_validation_orchestrator import (
+    STAGE_AUDIT,
+    STAGE_DB_VALIDATIONS,
+    STAGE_EVIDENCE,
+    STAGE_EXTRACTION,
+    CableDesignValidator,
+)
+from src.backend.schemas.cable_validation_schema import CableDesignSchema, LLMResponseSchema, ValidationResponseSchema
+
+
+class CountingExtractor(IFieldExtractor):
+    def __init__(self):
+        self.calls = 0
+
+    async def extract(self, user_input):
+        self.calls += 1
+        return CableDesignSchema(standard="IS 1554-1", csa=10.0, insulation_thickness=0.7)
+
+
+class CountingDatabaseValidator(IDatabaseValidator):
+    def __init__(self):
+        self.calls = 0
+
+    def validate(self, extracted_fields):
+        self.calls += 1
+        return [ValidationResponseSchema(field="csa", validation_status="PASS", expected="10.0 mm²", comment="IS 8130")]
+
+
+class JoinFormatter(IEvidenceFormatter):
+    def format(self, db_validations):
+        return "|".join(v.field for v in db_validations)
+
+
+class FlakyAuditor(IAuditor):
+    """Fails the first `failures` audits, then succeeds."""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.evidence_seen = []
+
+    async def audit(self, evidence_context, extracted_fields):
+        self.evidence_seen.append(evidence_context)
+        if self.failures > 0:
+            self.failures -= 1
+            raise RuntimeError("provider outage")
+        return LLMResponseSchema(
+            is_out_of_scope=False, out_of_scope_explanation="", fields=extracted_fields, confidence={"overall": 0.9}
+        )
+
+
+def pipeline(auditor):
+    extractor, database = CountingExtractor(), CountingDatabaseValidator()
+    validator = CableDesignValidator(extractor, database, JoinFormatter(), auditor)
+    return validator, extractor, database
+
+
+def test_each_completed_stage_is_persisted_before_the_next():
+    validator, _, _ = pipeline(FlakyAuditor(failures=1))
+    persisted = []
+
+    async def on_checkpoint(checkpoint):
+        persisted.append(dict(checkpoint))
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(validator.validate("10 sqmm PVC", "free_text", {}, on_checkpoint=on_checkpoint))
+
+    assert [c["stage"] for c in persisted] == [STAGE_EXTRACTION, STAGE_DB_VALIDATIONS, STAGE_EVIDENCE]
+    assert persisted[-1][STAGE_EVIDENCE] == "csa"
+
+
+def test_retry_resumes_from_the_failed_stage():
+    auditor = FlakyAuditor(failures=1)
+    validator, extractor, database = pipeline(auditor)
+    checkpoint = {}
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(validator.validate("10 sqmm PVC", "free_text", checkpoint))
+    # What the task stores on the record, and reloads on the retry
+    stored = dict(checkpoint)
+
+    result = asyncio.run(validator.validate("10 sqmm PVC", "free_text", stored))
+
+    assert extractor.calls == 1
+    assert database.calls == 1
+    assert auditor.evidence_seen == ["csa", "csa"]
+    assert result.fields.csa == 10.0
+    assert stored["stage"] == STAGE_AUDIT
@@ -0,0 +1,56 @@
+from src.backend.formatters.evidence_formatters import CompactEvidenceFormatter, EvidenceFormatter
+from src.backend.schemas.cable_validation_schema import ValidationResponseSchema
+
+WARN_COMMENT = (
+    "Parameter 'insulation_thickness' (0.7) is outside the scope of IS 8130. "
+    "Final LLM must validate this against IS 1554-1 requirements."
+)
+
+
+def evidence():
+    return [
+        ValidationResponseSchema(
+            field="csa", validation_status="PASS", expected="10.0 mm²",
+            comment="Validated via IS 8130. Input 10.2 mm² matched to 10.0 mm² within tolerance."
+        ),
+        ValidationResponseSchema(
+            field="insulation_material", validation_status="PASS", expected="PVC",
+            comment="Per IS 1554-1 Table 3, PVC is a specified insulation material."
+        ),
+        ValidationResponseSchema(
+            field="insulation_thickness", validation_status="WARN", expected="Refer to 0.7 mm", comment=WARN_COMMENT
+        ),
+        ValidationResponseSchema(
+            field="voltage", validation_status="FAIL", expected="≤ 1.1 kV",
+            comment="Per IS 1554-1, 3.3 kV exceeds the 1.1 kV grade covered by the standard."
+        ),
+    ]
+
+
+def rows(text):
+    return {line.split("|")[0]: line.split("|") for line in text.splitlines()[3:]}
+
+
+def test_compact_keeps_placeholder_marker():
+    # The "Refer to" value is the design's own thickness, never the IS requirement
+    row = rows(CompactEvidenceFormatter().format(evidence()))["IT"]
+    assert row[2] == "ref:0.7 mm"
+
+
+def test_compact_keeps_pass_row_notes():
+    table = rows(CompactEvidenceFormatter().format(evidence()))
+    assert "within tolerance" in table["CSA"][3]
+    assert "IS 1554-1 Table 3" in table["IM"][3]
+    assert "exceeds the 1.1 kV grade" in table["V"][3]
+
+
+def test_compact_drops_only_warn_boilerplate():
+    note = rows(CompactEvidenceFormatter().format(evidence()))["IT"][3]
+    assert note == "Parameter 'insulation_thickness' (0.7)"
+
+
+def test_compact_carries_every_row_in_fewer_characters():
+    compact = CompactEvidenceFormatter().format(evidence())
+    verbose = EvidenceFormatter().format(evidence())
+    assert len(rows(compact)) == len(evidence())
+    assert len(compact) < len(verbose)
@@ -0,0 +1,55 @@
+import asyncio
+import time
+
+from src.backend.scheduler.llm_scheduler import LLMScheduler, ProviderLimits
+
+PROVIDER = "test-provider"
+
+
+def drain_requests(scheduler):
+    scheduler._local._buckets[f"{PROVIDER}:rpm"] = (0.0, time.monotonic())
+
+
+def held_leases(scheduler):
+    return len(scheduler._local._leases.get(PROVIDER, {}))
+
+
+def test_rate_wait_does_not_hold_an_in_flight_slot():
+    # 600 rpm refills one request every 0.1 s
+    scheduler = LLMScheduler({PROVIDER: ProviderLimits(max_in_flight=1, requests_per_minute=600, tokens_per_minute=0)})
+    drain_requests(scheduler)
+
+    async def run():
+        entered = asyncio.Event()
+
+        async def call():
+            async with scheduler.slot(PROVIDER):
+                entered.set()
+                assert held_leases(scheduler) == 1
+
+        task = asyncio.create_task(call())
+        await asyncio.sleep(0.03)
+        # Still throttled on the request budget, without occupying the only slot
+        assert not entered.is_set()
+        assert held_leases(scheduler) == 0
+        await task
+        assert held_leases(scheduler) == 0
+
+    asyncio.run(run())
+
+
+def test_in_flight_cap_serialises_calls():
+    scheduler = LLMScheduler({PROVIDER: ProviderLimits(max_in_flight=1, requests_per_minute=0, tokens_per_minute=0)})
+    order = []
+
+    async def call(name):
+        async with scheduler.slot(PROVIDER):
+            order.append(f"{name}:start")
+            await asyncio.sleep(0.05)
+            order.append(f"{name}:end")
+
+    async def run():
+        await asyncio.gather(call("a"), call("b"))
+
+    asyncio.run(run())
+    assert order in (["a:start", "a:end", "b:start", "b:end"], ["b:start", "b:end", "a:start", "a:end"])
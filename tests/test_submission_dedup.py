@@ -0,0 +1,119 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from src.backend.db.async_crud import bulk_save_ai_validations
+from src.backend.db.database import AsyncSessionLocal, Base, engine
+from src.backend.router.v1 import design_router
+from src.backend.schemas.cable_validation_schema import DesignValidationPostRequest
+from src.backend.utils.hashing import compute_payload_hash
+
+
+@pytest.fixture(autouse=True)
+def fresh_tables():
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+
+class RecordingTask:
+    def __init__(self):
+        self.request_ids = []
+
+    def delay(self, request_id, **kwargs):
+        self.request_ids.append(request_id)
+
+
+def save_pending(payload_hash, batch_id=None, status="PENDING"):
+    async def save():
+        async with AsyncSessionLocal() as db:
+            await bulk_save_ai_validations(db, [{
+                "request_id": uuid.uuid4(),
+                "batch_id": batch_id,
+                "raw_input_text": "{}",
+                "payload_hash": payload_hash,
+                "status": status
+            }])
+
+    asyncio.run(save())
+
+
+def test_free_text_hash_ignores_whitespace_and_case():
+    a = compute_payload_hash("free_text", {"description": "  10 sqmm  Copper\tcable "})
+    b = compute_payload_hash("free_text", {"description": "10 SQMM copper cable"})
+    assert a == b
+
+
+def test_structured_hash_is_stable_across_key_order():
+    a = compute_payload_hash("json", {"csa": 10, "material": "Cu", "voltage": {"rated": 1100, "unit": "V"}})
+    b = compute_payload_hash("json", {"voltage": {"unit": "V", "rated": 1100}, "material": "Cu", "csa": 10})
+    assert a == b
+
+
+def test_json_and_manual_share_a_namespace_but_not_with_free_text():
+    data = {"description": "10 sqmm copper"}
+    assert compute_payload_hash("json", data) == compute_payload_hash("manual", data)
+    assert compute_payload_hash("json", data) != compute_payload_hash("free_text", data)
+
+
+def test_structured_hash_distinguishes_values():
+    assert compute_payload_hash("json", {"csa": 10}) != compute_payload_hash("json", {"csa": 16})
+    assert compute_payload_hash("json", {"csa": 10}) != compute_payload_hash("json", {"csa": "10"})
+
+
+def test_second_inflight_record_for_a_payload_is_rejected():
+    save_pending("h1")
+    with pytest.raises(IntegrityError):
+        save_pending("h1")
+
+
+def test_finished_batch_and_unhashed_records_do_not_claim_the_payload():
+    save_pending("h1", status="SUCCESS")
+    save_pending("h1", status="FAILED")
+    batch_id = uuid.uuid4()
+    save_pending("h1", batch_id=batch_id)
+    save_pending("h1", batch_id=batch_id)
+    save_pending(None)
+    save_pending(None)
+    # The single in-flight slot is still free
+    save_pending("h1")
+
+
+def test_concurrent_identical_submission_attaches_to_the_first(monkeypatch):
+    task = RecordingTask()
+    monkeypatch.setattr(design_router, "validate_cable_design_task", task)
+
+    # Both requests pass the reuse lookup before either has inserted
+    async def no_reusable(db, payload_hash, since):
+        return None
+
+    monkeypatch.setattr(design_router, "find_reusable_validation", no_reusable)
+    payload = DesignValidationPostRequest(input_mode="json", data={"csa": 10, "material": "Cu"})
+
+    async def submit():
+        async with AsyncSessionLocal() as db:
+            return await design_router.validate_design(payload=payload, bypass_dedup=False, db=db)
+
+    first = asyncio.run(submit())
+    second = asyncio.run(submit())
+
+    assert second.request_id == first.request_id
+    assert second.meta["deduplicated"] is True
+    assert task.request_ids == [str(first.request_id)]
+
+
+def test_bypass_dedup_enqueues_alongside_an_inflight_job(monkeypatch):
+    task = RecordingTask()
+    monkeypatch.setattr(design_router, "validate_cable_design_task", task)
+    payload = DesignValidationPostRequest(input_mode="json", data={"csa": 10, "material": "Cu"})
+
+    async def submit(bypass):
+        async with AsyncSessionLocal() as db:
+            return await design_router.validate_design(payload=payload, bypass_dedup=bypass, db=db)
+
+    first = asyncio.run(submit(False))
+    fresh = asyncio.run(submit(True))
+
+    assert fresh.request_id != first.request_id
+    assert len(task.request_ids) == 2